@@ -0,0 +1,196 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""ANTA adaptive concurrency limiter used by the devices and the runner."""
+
+from __future__ import annotations
+
+import logging
+from asyncio import CancelledError, Future, get_running_loop
+from collections import deque
+from contextlib import asynccontextmanager
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INITIAL_LIMIT = 10
+"""Default initial limit of the concurrent requests for a device adaptive limiter."""
+
+
+class AntaAdaptiveLimiter:
+    """Concurrency limiter adapting its limit to the observed request latency and timeouts (AIMD).
+
+    The limit is increased additively, by 1 every `limit` successful requests, and decreased
+    multiplicatively by `backoff` when a request raises one of the `overload` exceptions of `slot()`
+    or by `latency_backoff` when a request is `latency_tolerance` times slower than the average latency
+    or raises one of the `rejected` exceptions of `slot()`.
+    Only one decrease is applied for the requests started before the previous decrease, so a burst
+    of timeouts does not collapse the limit.
+
+    A limiter can have a parent, e.g. a run-wide limiter shared by the device limiters:
+    a slot is acquired from the limiter then from its parent, and both observe the request.
+
+    Examples
+    --------
+    ```python
+    limiter = AntaAdaptiveLimiter("device", initial_limit=10, max_limit=100)
+    async with limiter.slot(overload=(TimeoutException,)):
+        await client.post(...)
+    ```
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial_limit: int,
+        max_limit: int,
+        min_limit: int = 1,
+        *,
+        parent: AntaAdaptiveLimiter | None = None,
+        backoff: float = 0.5,
+        latency_backoff: float = 0.9,
+        latency_tolerance: float = 3.0,
+    ) -> None:
+        """Initialize an AntaAdaptiveLimiter."""
+        self.name = name
+        self.min_limit = min_limit
+        self.max_limit = max(max_limit, min_limit)
+        self.parent = parent
+        self.backoff = backoff
+        self.latency_backoff = latency_backoff
+        self.latency_tolerance = latency_tolerance
+        self._limit = float(min(max(initial_limit, self.min_limit), self.max_limit))
+        self._in_flight = 0
+        self._waiters: deque[Future[None]] = deque()
+        # Incremented on each decrease, requests started before the last decrease do not decrease the limit again
+        self._epoch = 0
+        self._average_latency: float | None = None
+
+        # Stats
+        self.stats: dict[str, int] = {"requests": 0, "timeouts": 0, "rejections": 0, "lowest_limit": self.limit, "highest_limit": self.limit}
+
+    @property
+    def limit(self) -> int:
+        """Current limit of concurrent requests."""
+        return int(self._limit)
+
+    @property
+    def statistics(self) -> dict[str, int]:
+        """Return the limiter statistics for logging purposes."""
+        return {"limit": self.limit, **self.stats}
+
+    def set_max_limit(self, max_limit: int) -> None:
+        """Set the maximum limit, lowering the current limit if it exceeds it."""
+        self.max_limit = max(max_limit, self.min_limit)
+        self._set_limit(self._limit)
+
+    @asynccontextmanager
+    async def slot(self, overload: tuple[type[BaseException], ...] = (), rejected: tuple[type[BaseException], ...] = ()) -> AsyncIterator[None]:
+        """Wait for a slot in this limiter and its parents and observe the request running in the context.
+
+        Parameters
+        ----------
+        overload
+            Exceptions signaling that the remote end is overloaded, e.g. timeouts.
+        rejected
+            Exceptions signaling that the remote end rejected the request, e.g. command errors.
+        """
+        limiters: list[AntaAdaptiveLimiter] = []
+        epochs: list[int] = []
+        try:
+            limiter: AntaAdaptiveLimiter | None = self
+            while limiter is not None:
+                epochs.append(await limiter._acquire())  # noqa: SLF001
+                limiters.append(limiter)
+                limiter = limiter.parent
+            start = perf_counter()
+            try:
+                yield
+            except overload:
+                for limiter_, epoch in zip(limiters, epochs, strict=True):
+                    limiter_._on_overload(epoch)  # noqa: SLF001
+                raise
+            except rejected:
+                for limiter_, epoch in zip(limiters, epochs, strict=True):
+                    limiter_._on_rejected(epoch)  # noqa: SLF001
+                raise
+            latency = perf_counter() - start
+            for limiter_, epoch in zip(limiters, epochs, strict=True):
+                limiter_._on_success(latency, epoch)  # noqa: SLF001
+        finally:
+            for limiter_ in limiters:
+                limiter_._release()  # noqa: SLF001
+
+    async def _acquire(self) -> int:
+        """Wait for a slot and return the current epoch."""
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return self._epoch
+        future: Future[None] = get_running_loop().create_future()
+        self._waiters.append(future)
+        try:
+            await future
+        except CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was granted before the cancellation, hand it over
+                self._release()
+            else:
+                self._waiters.remove(future)
+            raise
+        return self._epoch
+
+    def _release(self) -> None:
+        """Release a slot."""
+        self._in_flight -= 1
+        self._wake_up()
+
+    def _wake_up(self) -> None:
+        """Grant the available slots to the waiters."""
+        while self._waiters and self._in_flight < self.limit:
+            future = self._waiters.popleft()
+            if not future.done():
+                self._in_flight += 1
+                future.set_result(None)
+
+    def _on_success(self, latency: float, epoch: int) -> None:
+        """Update the limit after a successful request."""
+        self.stats["requests"] += 1
+        average = self._average_latency
+        self._average_latency = latency if average is None else 0.9 * average + 0.1 * latency
+        if average is not None and latency > self.latency_tolerance * average:
+            self._decrease(self.latency_backoff, epoch)
+            return
+        self._set_limit(self._limit + 1 / self._limit)
+
+    def _on_overload(self, epoch: int) -> None:
+        """Update the limit after a request signaled an overload."""
+        self.stats["requests"] += 1
+        self.stats["timeouts"] += 1
+        self._decrease(self.backoff, epoch)
+
+    def _on_rejected(self, epoch: int) -> None:
+        """Update the limit after a request was rejected."""
+        self.stats["requests"] += 1
+        self.stats["rejections"] += 1
+        self._decrease(self.latency_backoff, epoch)
+
+    def _decrease(self, factor: float, epoch: int) -> None:
+        """Decrease the limit if the request started after the last decrease."""
+        if epoch != self._epoch:
+            return
+        self._epoch += 1
+        previous = self.limit
+        self._set_limit(self._limit * factor)
+        if self.limit != previous:
+            logger.debug("Concurrency limit of %s decreased from %d to %d", self.name, previous, self.limit)
+
+    def _set_limit(self, limit: float) -> None:
+        """Set the limit within the bounds and wake up the waiters if it increased."""
+        self._limit = min(max(limit, self.min_limit), self.max_limit)
+        self.stats["lowest_limit"] = min(self.stats["lowest_limit"], self.limit)
+        self.stats["highest_limit"] = max(self.stats["highest_limit"], self.limit)
+        self._wake_up()
@@ -0,0 +1,60 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""ANTA event loop selection and tuning."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from anta.settings import AntaRunnerSettings
+
+if TYPE_CHECKING:
+    from collections.abc import Coroutine
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def run(main: Coroutine[Any, Any, T], settings: AntaRunnerSettings | None = None) -> T:
+    """Run a coroutine in a new event loop selected and tuned by the runner settings, like `asyncio.run()`.
+
+    The uvloop event loop is used when the `event_loop` setting is `uvloop` and uvloop is installed,
+    otherwise the default asyncio event loop is used.
+
+    Parameters
+    ----------
+    main
+        Coroutine to run, e.g. `AntaRunner.run()`.
+    settings
+        Runner settings. If `None`, the settings are loaded from the environment variables.
+
+    Returns
+    -------
+    T
+        The result of the coroutine.
+    """
+    settings = settings if settings is not None else AntaRunnerSettings()
+    if settings.event_loop == "uvloop":
+        try:
+            import uvloop  # noqa: PLC0415
+        except ImportError:
+            logger.warning("uvloop is not installed, using the asyncio event loop. Install it with `pip install anta[uvloop]`.")
+        else:
+            return uvloop.run(_tune_loop(main, settings))
+    return asyncio.run(_tune_loop(main, settings))
+
+
+async def _tune_loop(main: Coroutine[Any, Any, T], settings: AntaRunnerSettings) -> T:
+    """Apply the loop settings to the running event loop and await the coroutine."""
+    loop = asyncio.get_running_loop()
+    if settings.executor_workers is not None:
+        # Shut down with the loop by `asyncio.run()`
+        loop.set_default_executor(ThreadPoolExecutor(max_workers=settings.executor_workers, thread_name_prefix="anta"))
+    if settings.slow_callback_duration is not None:
+        loop.slow_callback_duration = settings.slow_callback_duration
+    return await main
@@ -0,0 +1,142 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""ANTA progress reporting of the test execution."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import Counter
+from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from anta.logger import anta_log_exception
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROGRESS_INTERVAL = 0.1
+"""Default time in seconds between two progress reports."""
+
+
+@dataclass(frozen=True)
+class AntaProgressUpdate:
+    """Progress of the test execution reported by `AntaProgress`.
+
+    Attributes
+    ----------
+    completed
+        Number of completed tests.
+    total
+        Number of scheduled tests.
+    devices
+        Number of completed and scheduled tests per device name. Empty if the per-device progress is disabled.
+    """
+
+    completed: int
+    total: int
+    devices: dict[str, tuple[int, int]] = field(default_factory=dict)
+
+
+class AntaProgress:
+    """Report the progress of the test execution to a callback, off the hot path of the tests.
+
+    The tests only increment counters when they complete. The counters are reported to the callback
+    every `interval` seconds by a task running while the tests are executed, and once when the execution ends.
+
+    The progress is enabled by setting `AntaTest.progress`, the ANTA runner then reports the progress of its runs.
+
+    Examples
+    --------
+    ```python
+    AntaTest.progress = AntaProgress(lambda update: print(f"{update.completed}/{update.total}"))
+    asyncio.run(runner.run(inventory, catalog))
+    ```
+    """
+
+    def __init__(self, callback: Callable[[AntaProgressUpdate], None], *, interval: float = DEFAULT_PROGRESS_INTERVAL, per_device: bool = False) -> None:
+        """Initialize an AntaProgress.
+
+        Parameters
+        ----------
+        callback
+            Function called with the progress of the test execution.
+        interval
+            Time in seconds between two progress reports.
+        per_device
+            Whether to report the progress of each device.
+        """
+        self.callback = callback
+        self.interval = interval
+        self.per_device = per_device
+        self.completed = 0
+        self.total = 0
+        self.device_completed: Counter[str] = Counter()
+        self.device_total: Counter[str] = Counter()
+        self._changed = False
+        self._executions = 0
+        self._reporter: asyncio.Task[None] | None = None
+
+    def advance(self, device: str | None = None, count: int = 1) -> None:
+        """Count completed tests.
+
+        Parameters
+        ----------
+        device
+            Name of the device of the tests.
+        count
+            Number of completed tests.
+        """
+        self.completed += count
+        if self.per_device and device is not None:
+            self.device_completed[device] += count
+        self._changed = True
+
+    def schedule(self, device: str, count: int) -> None:
+        """Count scheduled tests of a device, a negative count removes them."""
+        self.total += count
+        if self.per_device:
+            self.device_total[device] += count
+        self._changed = True
+
+    def report(self) -> None:
+        """Report the progress to the callback if it changed since the last report."""
+        if not self._changed:
+            return
+        self._changed = False
+        devices = {device: (self.device_completed[device], total) for device, total in self.device_total.items()} if self.per_device else {}
+        try:
+            self.callback(AntaProgressUpdate(completed=self.completed, total=self.total, devices=devices))
+        except Exception as exc:  # noqa: BLE001
+            # The callback is user-defined code, the tests must not be interrupted
+            anta_log_exception(exc, "Exception raised by the progress callback", logger)
+
+    @asynccontextmanager
+    async def execution(self) -> AsyncIterator[None]:
+        """Report the progress periodically while the tests are executed.
+
+        Concurrent executions, e.g. the runs of `AntaRunner.run_many()`, share the same reporting task.
+        """
+        self._executions += 1
+        if self._reporter is None:
+            self._reporter = asyncio.create_task(self._report_periodically())
+        try:
+            yield
+        finally:
+            self._executions -= 1
+            if not self._executions and self._reporter is not None:
+                self._reporter.cancel()
+                with suppress(asyncio.CancelledError):
+                    await self._reporter
+                self._reporter = None
+            self.report()
+
+    async def _report_periodically(self) -> None:
+        """Report the progress every `interval` seconds."""
+        while True:
+            self.report()
+            await asyncio.sleep(self.interval)
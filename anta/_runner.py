@@ -5,30 +5,48 @@
 
 from __future__ import annotations
 
+import asyncio
+import heapq
 import logging
-from asyncio import Semaphore, gather
-from collections import defaultdict
+import multiprocessing
+import pickle
+import re
+from asyncio import Queue, Semaphore, as_completed, create_task, gather, get_running_loop, wait_for
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import AbstractAsyncContextManager, aclosing, nullcontext
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from functools import cached_property
+from functools import cached_property, partial
 from inspect import getcoroutinelocals
+from math import ceil
+from operator import itemgetter
+from time import perf_counter
 from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, ConfigDict
 
 from anta import GITHUB_SUGGESTION
+from anta._limiter import DEFAULT_INITIAL_LIMIT, AntaAdaptiveLimiter
+from anta._loop import run as run_event_loop
+from anta._scheduler import AntaDurationHistory, AntaHistoricalTestScheduler, AntaTestScheduler
+from anta._tracing import trace_span
+from anta.constants import EOS_BLACKLIST_CMDS
+from anta.device import MAX_CONCURRENT_REQUESTS, AntaCircuitBreaker, save_session_store, shutdown_decode_executor
 from anta.inventory import AntaInventory
-from anta.logger import anta_log_exception
+from anta.logger import Log, anta_log_exception, exc_to_str, format_td, setup_logging
 from anta.models import AntaTest
 from anta.result_manager import ResultManager
+from anta.result_manager.models import AntaTestStatus
 from anta.settings import AntaRunnerSettings
 from anta.tools import Catchtime
 
 if TYPE_CHECKING:
-    from collections.abc import Coroutine
+    from collections.abc import AsyncGenerator, Collection, Coroutine, Iterable, Iterator
 
     from anta.catalog import AntaCatalog, AntaTestDefinition
     from anta.device import AntaDevice
+    from anta.models import AntaCommand
     from anta.result_manager.models import TestResult
 
 logger = logging.getLogger(__name__)
@@ -55,6 +73,11 @@ class AntaRunFilters(BaseModel):
     established_only : bool, default=True
         When `True`, only includes devices with established connections in the
         test run.
+    test_instances : dict[str, set[tuple[str, str | None]]] | None, optional
+        Mapping of device names to the `(test name, inputs uid)` pairs to run on
+        each device. A `None` inputs uid matches all the instances of the test.
+        If `None`, runs all the selected tests. Commonly built from the results
+        of a previous run with `from_results()`.
     """
 
     model_config = ConfigDict(frozen=True, extra="forbid")
@@ -62,10 +85,194 @@ class AntaRunFilters(BaseModel):
     tests: set[str] | None = None
     tags: set[str] | None = None
     established_only: bool = True
+    test_instances: dict[str, set[tuple[str, str | None]]] | None = None
 
+    @classmethod
+    def from_results(
+        cls, results: Iterable[TestResult], statuses: Collection[AntaTestStatus] = (AntaTestStatus.FAILURE, AntaTestStatus.ERROR), tags: set[str] | None = None
+    ) -> AntaRunFilters:
+        """Build filters selecting the device and test pairs of previous test results with the given statuses.
 
+        Parameters
+        ----------
+        results
+            Test results of a previous run, e.g. loaded from a `ResultManager` JSON dump.
+        statuses
+            Statuses of the test results to select.
+        tags
+            Tags used to filter both devices and tests.
+        """
+        test_instances: defaultdict[str, set[tuple[str, str | None]]] = defaultdict(set)
+        for result in results:
+            if result.result in statuses:
+                test_instances[result.name].add((result.test, result.inputs_uid))
+        return cls(
+            devices=set(test_instances),
+            tests={test for instances in test_instances.values() for test, _ in instances},
+            tags=tags,
+            test_instances=dict(test_instances),
+        )
+
+
+@dataclass
+class AntaCostPlan:
+    """Estimated cost of running the selected tests of a device, or of all the devices for the run total.
+
+    Attributes
+    ----------
+    tests: int
+        Number of tests scheduled.
+    commands: int
+        Number of commands rendered by the tests.
+    unique_commands: int
+        Number of unique commands, deduplicated by `AntaCommand.uid`.
+    requests: int
+        Number of eAPI requests predicted from the command caching and batching of the devices.
+    expected_duration: float | None
+        Sum of the durations in seconds of the tests in the previous runs, from the test duration history.
+        None if none of the tests has a recorded duration.
+    tests_with_history: int
+        Number of tests with a recorded duration in the test duration history.
+    """
+
+    tests: int = 0
+    commands: int = 0
+    unique_commands: int = 0
+    requests: int = 0
+    expected_duration: float | None = None
+    tests_with_history: int = 0
+
+    def add(self, other: AntaCostPlan) -> None:
+        """Add the cost of another plan to this plan."""
+        self.tests += other.tests
+        self.commands += other.commands
+        self.unique_commands += other.unique_commands
+        self.requests += other.requests
+        if other.expected_duration is not None:
+            self.expected_duration = (self.expected_duration or 0.0) + other.expected_duration
+        self.tests_with_history += other.tests_with_history
+
+
+@dataclass
+class AntaShardReport:
+    """Report of a shard of an ANTA run executed in a worker process.
+
+    Attributes
+    ----------
+    index: int
+        Index of the shard.
+    devices: list[str]
+        Names of the devices assigned to the shard.
+    tests_scheduled: int
+        Number of tests scheduled on the devices of the shard.
+    total_results: int
+        Number of test results returned by the shard.
+    start_time: datetime | None
+        Time the shard was submitted to the worker processes. None if not set yet.
+    end_time: datetime | None
+        Time the shard results were received. None if not set yet.
+    error: str | None
+        Error raised while running the shard. None if the shard completed.
+    """
+
+    index: int
+    devices: list[str] = field(default_factory=list)
+    tests_scheduled: int = 0
+    total_results: int = 0
+    start_time: datetime | None = None
+    end_time: datetime | None = None
+    error: str | None = None
+
+    @property
+    def duration(self) -> timedelta | None:
+        """Calculate the duration of the shard. Returns None if start or end time is not set."""
+        if self.start_time and self.end_time:
+            return self.end_time - self.start_time
+        return None
+
+
+@dataclass
+class AntaStatusChange:
+    """Change of the status of a test between two iterations of `AntaRunner.run_periodic()`.
+
+    Attributes
+    ----------
+    result: TestResult
+        Result of the test in the current iteration.
+    previous: AntaTestStatus | None
+        Status of the test in the previous iteration. None if the test did not run in the previous iteration.
+    """
+
+    result: TestResult
+    previous: AntaTestStatus | None = None
+
+
+@dataclass
+class AntaRunPlan:
+    """Tests of a catalog prepared once for the devices of an inventory and executed by several runs.
+
+    Created by `AntaRunner.prepare()` and executed by `AntaRunner.run_plan()`. The `AntaTest` instances are created
+    once with their validated inputs and rendered commands, and each run only resets their command outputs and results.
+    A plan must not be executed by concurrent runs.
+
+    Attributes
+    ----------
+    inventory: AntaInventory
+        Inventory of network devices to test.
+    catalog: AntaCatalog
+        Catalog of tests to run.
+    filters: AntaRunFilters
+        Filters of the runs.
+    tests: dict[AntaDevice, dict[AntaTestDefinition, AntaTest]]
+        Prepared test instances per device and test definition. The tests that cannot be created without error are
+        not prepared and are created by each run.
+    """
+
+    inventory: AntaInventory
+    catalog: AntaCatalog
+    filters: AntaRunFilters
+    tests: dict[AntaDevice, dict[AntaTestDefinition, AntaTest]] = field(default_factory=dict)
+
+    def get_test(self, device: AntaDevice, test_def: AntaTestDefinition) -> AntaTest | None:
+        """Return the prepared test instance of a test definition for a device, reset to run again. None if the test is not prepared."""
+        test = self.tests.get(device, {}).get(test_def)
+        if test is not None:
+            test.reset()
+        return test
+
+
+@dataclass
+class _ShardResult:
+    """Outcome of a shard returned by a worker process."""
+
+    manager: ResultManager
+    selected_devices: list[str]
+    devices_unreachable_at_setup: list[str]
+    warnings_at_setup: list[str]
+
+
+def _init_shard_process(log_level: Log | None) -> None:
+    """Configure the logging of a shard worker process like the parent process."""
+    if log_level is not None:
+        setup_logging(log_level)
+
+
+def _run_shard(payload: bytes) -> _ShardResult:
+    """Run the tests of a shard with a new event loop. Executed in a shard worker process."""
+    inventory, catalog, filters, settings = pickle.loads(payload)  # noqa: S301
+    runner = AntaRunner(settings=AntaRunnerSettings(**settings))
+    ctx = run_event_loop(runner.run(inventory, catalog, filters=filters, disconnect=True), runner.settings)
+    return _ShardResult(
+        manager=ctx.manager,
+        selected_devices=list(ctx.selected_inventory.keys()),
+        devices_unreachable_at_setup=ctx.devices_unreachable_at_setup,
+        warnings_at_setup=ctx.warnings_at_setup,
+    )
+
+
+# The context is the flat record of a run read by the CLI and the reporters, its fields are kept on a single object
 @dataclass
-class AntaRunContext:
+class AntaRunContext:  # pylint: disable=too-many-instance-attributes
     """Store the complete context and results of an ANTA run.
 
     A unique context is created and returned per ANTA run.
@@ -84,6 +291,14 @@ class AntaRunContext:
         Whether the run stops after setup and before test execution.
     disconnect: bool
         Whether the run disconnects matching inventory devices before returning.
+    refresh_established: bool
+        Whether the devices already established are refreshed when setting up the inventory.
+    inventory_connected: bool
+        Whether the devices were connected before the run, e.g. by `AntaRunner.run_many()`, in which case the run does not connect them.
+    concurrency_budget: Semaphore | None
+        Semaphore bounding the running tests of the concurrent runs of `AntaRunner.run_many()` to `max_concurrency`. None for a single run.
+    plan: AntaRunPlan | None
+        Prepared tests reused by the run, e.g. by `AntaRunner.run_plan()`. None if the run creates its tests.
     filtered_inventory: AntaInventory
         Inventory matching the run device/tag filters, computed once for this run context.
     selected_inventory: AntaInventory
@@ -96,6 +311,19 @@ class AntaRunContext:
         List of device names that were found unreachable during the inventory setup phase.
     warnings_at_setup: list[str]
         List of warnings caught during the setup phase.
+    prefetched_commands: dict[AntaDevice, dict[str, AntaCommand]]
+        Commands collected before running the tests when prefetching is enabled, per device and per command UID.
+        Cleared once the run is complete.
+    results: list[TestResult]
+        Test results produced by this run. The `manager` can also hold the results of previous runs.
+    shard_reports: list[AntaShardReport]
+        Reports of the shards when the run is sharded across worker processes, empty otherwise.
+    concurrency_limits: dict[str, dict[str, int]]
+        Final statistics of the adaptive concurrency limiters per device name when adaptive concurrency is enabled.
+    global_concurrency_limit: dict[str, int] | None
+        Final statistics of the run-wide adaptive concurrency limiter. None if adaptive concurrency is disabled.
+    cost_plans: dict[str, AntaCostPlan]
+        Estimated cost of the selected tests per device name. Only computed in dry-run.
     start_time: datetime | None
         Start time of the run. None if not set yet.
     end_time: datetime | None
@@ -108,6 +336,10 @@ class AntaRunContext:
     filters: AntaRunFilters
     dry_run: bool = False
     disconnect: bool = False
+    refresh_established: bool = True
+    inventory_connected: bool = False
+    concurrency_budget: Semaphore | None = None
+    plan: AntaRunPlan | None = None
 
     # State populated during the run
     selected_inventory: AntaInventory = field(default_factory=AntaInventory)
@@ -115,6 +347,12 @@ class AntaRunContext:
     devices_filtered_at_setup: list[str] = field(default_factory=list)
     devices_unreachable_at_setup: list[str] = field(default_factory=list)
     warnings_at_setup: list[str] = field(default_factory=list)
+    prefetched_commands: dict[AntaDevice, dict[str, AntaCommand]] = field(default_factory=dict)
+    results: list[TestResult] = field(default_factory=list)
+    shard_reports: list[AntaShardReport] = field(default_factory=list)
+    concurrency_limits: dict[str, dict[str, int]] = field(default_factory=dict)
+    global_concurrency_limit: dict[str, int] | None = None
+    cost_plans: dict[str, AntaCostPlan] = field(default_factory=dict)
     start_time: datetime | None = None
     end_time: datetime | None = None
 
@@ -150,6 +388,50 @@ class AntaRunContext:
         """Total tests scheduled to run across all selected devices."""
         return sum(len(tests) for tests in self.selected_tests.values())
 
+    @property
+    def total_cost_plan(self) -> AntaCostPlan:
+        """Estimated cost of the selected tests across all devices. Only computed in dry-run."""
+        total = AntaCostPlan()
+        for plan in self.cost_plans.values():
+            total.add(plan)
+        return total
+
+    @property
+    def timing_statistics(self) -> dict[str, float]:
+        """Cumulated timings in seconds of the test phases and number of command cache hits and misses of the run."""
+        totals: dict[str, float] = dict.fromkeys(("setup", "queued", "collection", "wait", "network", "evaluation", "cache_hits", "cache_misses"), 0)
+        for result in self.results:
+            timings = result.timings
+            totals["setup"] += timings.setup
+            totals["queued"] += timings.queued
+            totals["collection"] += timings.collection
+            totals["wait"] += timings.wait
+            totals["network"] += timings.network
+            totals["evaluation"] += timings.evaluation
+            totals["cache_hits"] += sum(timing.cache_hit is True for timing in timings.commands.values())
+            totals["cache_misses"] += sum(timing.cache_hit is False for timing in timings.commands.values())
+        return totals
+
+    def slowest_tests(self, count: int = 10) -> list[TestResult]:
+        """Return the results of the `count` slowest tests of the run."""
+        return heapq.nlargest(count, self.results, key=lambda result: result.timings.duration)
+
+    def slowest_devices(self, count: int = 10) -> list[tuple[str, float]]:
+        """Return the names and cumulated test durations of the `count` slowest devices of the run."""
+        durations: defaultdict[str, float] = defaultdict(float)
+        for result in self.results:
+            durations[result.name] += result.timings.duration
+        return heapq.nlargest(count, durations.items(), key=itemgetter(1))
+
+    def slowest_commands(self, count: int = 10) -> list[tuple[str, str, float]]:
+        """Return the device names, commands and network times of the `count` commands of the run with the longest network time."""
+        network: dict[tuple[str, str], float] = {}
+        for result in self.results:
+            for command, timing in result.timings.commands.items():
+                key = (result.name, command)
+                network[key] = max(network.get(key, 0.0), timing.network)
+        return [(device, command, time) for (device, command), time in heapq.nlargest(count, network.items(), key=itemgetter(1))]
+
     @property
     def duration(self) -> timedelta | None:
         """Calculate the duration of the run. Returns None if start or end time is not set."""
@@ -177,8 +459,8 @@ class AntaRunner:
     Notes
     -----
     After initializing an `AntaRunner` instance, tests should only be executed through
-    the `run()` method. This method manages the complete test lifecycle including setup,
-    execution, and cleanup.
+    the `run()`, `iter_results()`, `run_many()`, `run_periodic()` or `run_plan()` methods. These methods manage the complete test lifecycle
+    including setup, execution, and cleanup.
 
     Examples
     --------
@@ -212,6 +494,11 @@ class AntaRunner:
         self._settings = settings if settings is not None else AntaRunnerSettings()
         logger.debug("AntaRunner initialized with settings: %s", self._settings.model_dump())
 
+    @property
+    def settings(self) -> AntaRunnerSettings:
+        """Settings of the runner."""
+        return self._settings
+
     async def run(
         self,
         inventory: AntaInventory,
@@ -229,8 +516,13 @@ class AntaRunner:
         1. Build the context object for the run.
         2. Set up the selected inventory, removing filtered/unreachable devices.
         3. Set up the selected tests, removing filtered tests.
-        4. Prepare the `AntaTest` coroutines from the selected inventory and tests.
-        5. Run the test coroutines if it is not a dry run.
+        4. Prefetch the unique commands of the selected tests for each device if the `prefetch` setting is enabled.
+        5. Run the selected tests if it is not a dry run. A pool of `max_concurrency` workers
+           instantiates each `AntaTest` only when a concurrency slot is available.
+           If the `shards` setting is greater than 1, the selected inventory is split across
+           worker processes instead, each connecting to its devices and running its tests.
+
+        Test results are added to the context `ResultManager` as soon as each test completes.
 
         Parameters
         ----------
@@ -257,18 +549,326 @@ class AntaRunner:
         AntaRunContext
             The complete context and results of this ANTA run.
         """
-        start_time = datetime.now(tz=timezone.utc)
-        logger.info("ANTA run starting ...")
+        ctx = self._create_context(inventory, catalog, result_manager, filters, dry_run=dry_run, disconnect=disconnect)
+        with trace_span("AntaRunner.run"):
+            async for _ in self._run(ctx):
+                pass
+        return ctx
 
-        ctx = AntaRunContext(
+    async def iter_results(
+        self,
+        inventory: AntaInventory,
+        catalog: AntaCatalog,
+        result_manager: ResultManager | None = None,
+        filters: AntaRunFilters | None = None,
+        *,
+        dry_run: bool = False,
+        disconnect: bool = False,
+    ) -> AsyncGenerator[TestResult, None]:
+        """Run ANTA and yield the test results as they complete.
+
+        The run workflow is the same as `run()`. Each result is added to the `ResultManager`
+        before being yielded, which allows consumers to stream results to external sinks
+        without waiting for the slowest device of the run.
+
+        Parameters are the same as `run()`.
+
+        Yields
+        ------
+        TestResult
+            The result of each test, in completion order.
+
+        Examples
+        --------
+        ```python
+        from contextlib import aclosing
+
+        async with aclosing(runner.iter_results(inventory, catalog)) as results:
+            async for result in results:
+                print(result)
+        ```
+        """
+        ctx = self._create_context(inventory, catalog, result_manager, filters, dry_run=dry_run, disconnect=disconnect)
+        async with aclosing(self._run(ctx)) as results:
+            async for result in results:
+                yield result
+
+    def prepare(self, inventory: AntaInventory, catalog: AntaCatalog, filters: AntaRunFilters | None = None) -> AntaRunPlan:
+        """Prepare the tests of a catalog for the devices of an inventory, to execute them several times with `run_plan()`.
+
+        The tests selected by the filters for each device are created once: their inputs are validated and
+        their command templates rendered. The tests of all the devices matching the filters are prepared,
+        the devices are selected again by each run, e.g. if `established_only` is set.
+
+        Parameters
+        ----------
+        inventory
+            Inventory of network devices to test.
+        catalog
+            Catalog of tests to run.
+        filters
+            Filters for the ANTA runs. If `None`, run all tests on all devices.
+
+        Returns
+        -------
+        AntaRunPlan
+            The prepared tests.
+
+        Examples
+        --------
+        ```python
+        plan = runner.prepare(inventory, catalog)
+        for _ in range(3):
+            ctx = asyncio.run(runner.run_plan(plan))
+        ```
+        """
+        ctx = self._create_context(inventory, catalog, None, filters, dry_run=True, disconnect=False)
+        plan = AntaRunPlan(inventory=inventory, catalog=catalog, filters=ctx.filters)
+        ctx.selected_inventory = ctx.filtered_inventory
+        if not catalog.tests or not self._setup_tests(ctx):
+            return plan
+        with Catchtime(logger=logger, message="Preparing the tests"), trace_span("Preparing the tests"):
+            for device, test_definitions in ctx.selected_tests.items():
+                for test_def in test_definitions:
+                    try:
+                        test = test_def.test(device=device, inputs=test_def.inputs)
+                    except Exception:  # noqa: BLE001, S112
+                        # The error is reported when the test is created by the runs
+                        continue
+                    if test.result.result == AntaTestStatus.UNSET:
+                        plan.tests.setdefault(device, {})[test_def] = test
+        logger.debug("Prepared %d test(s) for %d device(s)", sum(len(tests) for tests in plan.tests.values()), len(plan.tests))
+        return plan
+
+    async def run_plan(
+        self,
+        plan: AntaRunPlan,
+        result_manager: ResultManager | None = None,
+        *,
+        dry_run: bool = False,
+        disconnect: bool = False,
+    ) -> AntaRunContext:
+        """Run ANTA with the tests prepared by `prepare()`.
+
+        The run workflow is the same as `run()`, except that the prepared tests are reset and run again instead of being created.
+
+        Parameters
+        ----------
+        plan
+            Tests prepared by `prepare()`.
+        result_manager
+            Manager for collecting and storing test results. If `None`, a new manager is returned for each run.
+        dry_run
+            Dry-run mode flag. If `True`, run all setup steps but do not execute tests.
+        disconnect
+            Disconnect matching inventory devices after the run completes.
+
+        Returns
+        -------
+        AntaRunContext
+            The complete context and results of this ANTA run.
+        """
+        ctx = self._create_context(plan.inventory, plan.catalog, result_manager, plan.filters, dry_run=dry_run, disconnect=disconnect)
+        ctx.plan = plan
+        with trace_span("AntaRunner.run_plan"):
+            async for _ in self._run(ctx):
+                pass
+        return ctx
+
+    async def run_many(
+        self,
+        inventory: AntaInventory,
+        runs: Iterable[tuple[AntaCatalog, AntaRunFilters | None]],
+        *,
+        dry_run: bool = False,
+        disconnect: bool = False,
+    ) -> list[AntaRunContext]:
+        """Run several catalogs concurrently on a shared connected inventory.
+
+        The devices matching the filters of any run are connected once before the runs start, so the runs share
+        the device connections and caches: a command of several catalogs is only collected once per device when
+        the device cache is enabled. The running tests of all the runs are bounded by the `max_concurrency` setting
+        and, when enabled, the adaptive limiters and circuit breakers of the devices are shared by the runs.
+        The runs are not sharded and the devices are not connected concurrently with the test execution.
+
+        Parameters
+        ----------
+        inventory
+            Inventory of network devices to test.
+        runs
+            Catalog of tests and filters of each run. If the filters are `None`, run all the tests of the catalog on all devices.
+        dry_run
+            Dry-run mode flag. If `True`, run all setup steps but do not execute tests.
+        disconnect
+            Disconnect the devices matching the filters of any run after all the runs complete.
+
+        Returns
+        -------
+        list[AntaRunContext]
+            The context and results of each run, in the order of `runs`.
+
+        Examples
+        --------
+        ```python
+        bgp_ctx, platform_ctx = asyncio.run(runner.run_many(inventory, [(bgp_catalog, None), (platform_catalog, AntaRunFilters(tags={"leaf"}))]))
+        ```
+        """
+        contexts = [self._create_context(inventory, catalog, None, filters, dry_run=dry_run, disconnect=False) for catalog, filters in runs]
+        if not contexts:
+            return contexts
+        # The runs share the device limiters, circuit breakers and connections set up for all the runs
+        runner = AntaRunner(
+            settings=self._settings.model_copy(update={"shards": 1, "pipelined_connect": False, "adaptive_concurrency": False, "circuit_breaker_threshold": None})
+        )
+        shared_inventory = inventory.get_inventory(devices={name for ctx in contexts for name in ctx.filtered_inventory})
+        budget = Semaphore(self._settings.max_concurrency)
+        for ctx in contexts:
+            ctx.inventory_connected = True
+            ctx.concurrency_budget = budget
+
+        async def run(ctx: AntaRunContext) -> None:
+            async for _ in runner._run(ctx):
+                pass
+
+        with trace_span("AntaRunner.run_many"):
+            try:
+                if not dry_run:
+                    await self._setup_shared_inventory(shared_inventory)
+                await gather(*(run(ctx) for ctx in contexts))
+            finally:
+                await save_session_store()
+                await self._teardown_shared_inventory(shared_inventory, contexts, disconnect=disconnect)
+                shutdown_decode_executor()
+        return contexts
+
+    async def run_periodic(
+        self,
+        inventory: AntaInventory,
+        catalog: AntaCatalog,
+        interval: float,
+        filters: AntaRunFilters | None = None,
+        *,
+        iterations: int | None = None,
+    ) -> AsyncGenerator[tuple[AntaRunContext, list[AntaStatusChange]], None]:
+        """Run ANTA every `interval` seconds on a persistently connected inventory.
+
+        The run workflow of each iteration is the same as `run()`, except that the devices stay connected
+        between iterations: the HTTP clients and sessions are reused and only the devices that are not
+        established are connected again. The device caches are cleared before each iteration.
+        The devices matching the filters are disconnected once the generator is closed.
+        The tests are prepared once with `prepare()` and reset by each iteration.
+
+        Tests are identified across iterations by device name, test name, description, custom field and inputs.
+
+        Parameters
+        ----------
+        inventory
+            Inventory of network devices to test.
+        catalog
+            Catalog of tests to run.
+        interval
+            Time in seconds between the start of two iterations. An iteration lasting longer
+            than `interval` is immediately followed by the next one.
+        filters
+            Filters for the ANTA run. If `None`, run all tests on all devices.
+        iterations
+            Number of iterations to run. If `None`, run until the generator is closed.
+
+        Yields
+        ------
+        tuple[AntaRunContext, list[AntaStatusChange]]
+            The context of each iteration with the status changes since the previous iteration.
+            All the results of the first iteration are reported as changes.
+
+        Examples
+        --------
+        ```python
+        from contextlib import aclosing
+
+        async with aclosing(runner.run_periodic(inventory, catalog, interval=300)) as iterations:
+            async for ctx, changes in iterations:
+                for change in changes:
+                    print(f"{change.result.name} {change.result.test}: {change.previous} -> {change.result.result}")
+        ```
+        """
+        loop = get_running_loop()
+        plan = self.prepare(inventory, catalog, filters)
+        previous: dict[tuple[str, str, str, str | None, str | None], AntaTestStatus] = {}
+        ctx: AntaRunContext | None = None
+        iteration = 0
+        try:
+            while iterations is None or iteration < iterations:
+                start = loop.time()
+                if ctx is not None:
+                    for device in ctx.filtered_inventory.devices:
+                        if device.cache is not None:
+                            device.cache.clear()
+                ctx = self._create_context(inventory, catalog, None, plan.filters, dry_run=False, disconnect=False)
+                ctx.plan = plan
+                ctx.refresh_established = iteration == 0
+                async for _ in self._run(ctx):
+                    pass
+
+                current = {(result.name, result.test, result.description, result.custom_field, result.inputs_uid): result for result in ctx.manager.results}
+                changes = [AntaStatusChange(result=result, previous=previous.get(key)) for key, result in current.items() if previous.get(key) != result.result]
+                previous = {key: result.result for key, result in current.items()}
+                logger.info("Iteration %d completed: %d results, %d status change(s)", iteration + 1, len(ctx.manager), len(changes))
+                yield ctx, changes
+
+                iteration += 1
+                if iterations is None or iteration < iterations:
+                    await asyncio.sleep(max(0.0, interval - (loop.time() - start)))
+        finally:
+            if ctx is not None:
+                with Catchtime(logger=logger, message="Disconnecting from devices"):
+                    await ctx.filtered_inventory.disconnect_inventory()
+
+    def _create_context(
+        self,
+        inventory: AntaInventory,
+        catalog: AntaCatalog,
+        result_manager: ResultManager | None,
+        filters: AntaRunFilters | None,
+        *,
+        dry_run: bool,
+        disconnect: bool,
+    ) -> AntaRunContext:
+        """Create the context object for an ANTA run."""
+        return AntaRunContext(
             inventory=inventory,
             catalog=catalog,
             manager=result_manager if result_manager is not None else ResultManager(),
             filters=filters if filters is not None else AntaRunFilters(),
             dry_run=dry_run,
-            start_time=start_time,
+            start_time=datetime.now(tz=timezone.utc),
             disconnect=disconnect,
         )
+
+    async def _setup_shared_inventory(self, inventory: AntaInventory) -> None:
+        """Connect the devices shared by the runs of `run_many()` and attach their limiters and circuit breakers."""
+        with Catchtime(logger=logger, message="Connecting to devices"), trace_span("Connecting to devices"):
+            await inventory.connect_inventory()
+        if self._settings.adaptive_concurrency:
+            self._setup_limiters(inventory.devices)
+        if self._settings.circuit_breaker_threshold is not None:
+            self._setup_circuit_breakers(inventory.devices, self._settings.circuit_breaker_threshold)
+
+    async def _teardown_shared_inventory(self, inventory: AntaInventory, contexts: list[AntaRunContext], *, disconnect: bool) -> None:
+        """Detach the limiters and circuit breakers of the devices shared by the runs of `run_many()` and disconnect them if required."""
+        if self._settings.adaptive_concurrency:
+            self._teardown_limiters(inventory.devices, contexts)
+        if self._settings.circuit_breaker_threshold is not None:
+            self._teardown_circuit_breakers(inventory.devices)
+        if disconnect:
+            with Catchtime(logger=logger, message="Disconnecting from devices"):
+                await inventory.disconnect_inventory()
+
+    async def _run(self, ctx: AntaRunContext) -> AsyncGenerator[TestResult, None]:
+        """Run the ANTA workflow for the provided context.
+
+        Yield each test result once it has been added to the context `ResultManager`.
+        """
+        logger.info("ANTA run starting ...")
         try:
             if len(ctx.manager) > 0:
                 msg = (
@@ -279,59 +879,435 @@ class AntaRunner:
 
             if not ctx.catalog.tests:
                 self._log_warning_msg(msg="The list of tests is empty. Exiting ...", ctx=ctx)
-                ctx.end_time = datetime.now(tz=timezone.utc)
-                return ctx
+                return
 
-            with Catchtime(logger=logger, message="Preparing ANTA NRFU Run"):
+            with Catchtime(logger=logger, message="Preparing ANTA NRFU Run"), trace_span("Preparing ANTA NRFU Run"):
                 # Set up inventory
                 setup_inventory_ok = await self._setup_inventory(ctx)
                 if not setup_inventory_ok:
-                    ctx.end_time = datetime.now(tz=timezone.utc)
-                    return ctx
+                    return
 
                 # Set up tests
-                with Catchtime(logger=logger, message="Preparing Tests"):
+                with Catchtime(logger=logger, message="Preparing Tests"), trace_span("Preparing Tests"):
                     setup_tests_ok = self._setup_tests(ctx)
                     if not setup_tests_ok:
-                        ctx.end_time = datetime.now(tz=timezone.utc)
-                        return ctx
+                        return
 
-                # Get test coroutines
-                test_coroutines = self._get_test_coroutines(ctx)
-
-            self._log_run_information(ctx)
+            # With the pipelined connection, the run information is logged once the devices are connected
+            if ctx.dry_run or ctx.shard_reports or not self._settings.pipelined_connect:
+                self._log_run_information(ctx)
 
             if ctx.dry_run:
+                self._plan_costs(ctx)
                 logger.info("Dry-run mode, exiting before running the tests.")
-                self._close_test_coroutines(test_coroutines, ctx)
-                ctx.end_time = datetime.now(tz=timezone.utc)
-                return ctx
+                for result in self._close_test_coroutines(self._get_test_coroutines(ctx), ctx):
+                    yield result
+                return
 
-            if AntaTest.progress is not None:
-                AntaTest.nrfu_task = AntaTest.progress.add_task("Running NRFU Tests ...", total=ctx.total_tests_scheduled)
+            with Catchtime(logger=logger, message="Running Tests"), trace_span("Running Tests"):
+                async with self._report_progress(ctx):
+                    async for result in self._execute_tests(ctx):
+                        ctx.manager.add(result)
+                        ctx.results.append(result)
+                        yield result
 
-            with Catchtime(logger=logger, message="Running Tests"):
-                sem = Semaphore(self._settings.max_concurrency)
+            self._log_cache_statistics(ctx)
+            self._log_timing_statistics(ctx)
 
-                async def run_with_sem(test_coro: Coroutine[Any, Any, TestResult]) -> TestResult:
-                    """Wrap the test coroutine with semaphore control."""
-                    async with sem:
-                        return await test_coro
+        finally:
+            ctx.prefetched_commands.clear()
+            await self._teardown_run(ctx)
+            ctx.end_time = datetime.now(tz=timezone.utc)
 
-                results = await gather(*[run_with_sem(coro) for coro in test_coroutines])
-                for res in results:
-                    ctx.manager.add(res)
+    async def _teardown_run(self, ctx: AntaRunContext) -> None:
+        """Save the session store, disconnect from the devices if required and shut down the decoding process pool at the end of a run.
 
-            self._log_cache_statistics(ctx)
+        The concurrent runs of `run_many()` share the session store and the decoding process pool until all the runs complete.
+        """
+        if ctx.concurrency_budget is None:
+            await save_session_store()
+        if ctx.disconnect:
+            # Disconnect from devices after tests complete
+            with Catchtime(logger=logger, message="Disconnecting from devices"):
+                await ctx.filtered_inventory.disconnect_inventory()
+        if ctx.concurrency_budget is None:
+            shutdown_decode_executor()
+
+    def _report_progress(self, ctx: AntaRunContext) -> AbstractAsyncContextManager[None]:
+        """Return a context manager reporting the progress of the test execution if `AntaTest.progress` is set."""
+        if (progress := AntaTest.progress) is None:
+            return nullcontext()
+        for device, test_definitions in ctx.selected_tests.items():
+            progress.schedule(device.name, len(test_definitions))
+        return progress.execution()
+
+    async def _execute_tests(self, ctx: AntaRunContext) -> AsyncGenerator[TestResult, None]:
+        """Execute the selected tests with a pool of workers and yield the test results as they complete.
+
+        Each worker instantiates an `AntaTest` only when it is ready to run it, so the number of
+        test instances alive at any time is bounded by `max_concurrency` instead of the catalog size.
+        Tests are dispatched to the workers by an `AntaTestScheduler`, round-robin across devices.
+        When the `prefetch` setting is enabled, the unique commands of the selected tests are collected first.
+        When the `adaptive_concurrency` setting is enabled, the device requests are throttled by adaptive limiters.
+        When the `circuit_breaker_threshold` setting is set, the requests to a failing device fail fast.
+        """
+        if ctx.shard_reports:
+            async for result in self._execute_shards(ctx):
+                yield result
+            return
+
+        if self._settings.adaptive_concurrency:
+            self._setup_limiters(ctx.selected_tests)
+        if self._settings.circuit_breaker_threshold is not None:
+            self._setup_circuit_breakers(ctx.selected_tests, self._settings.circuit_breaker_threshold)
+        try:
+            if self._settings.prefetch and not self._settings.pipelined_connect:
+                with Catchtime(logger=logger, message="Prefetching commands"), trace_span("Prefetching commands"):
+                    await self._await_until_deadline(self._prefetch_commands(ctx), self._get_run_deadline(ctx), "Prefetching commands")
 
+            async for result in self._execute_workers(ctx):
+                yield result
         finally:
-            if ctx.disconnect:
-                # Disconnect from devices after tests complete
-                with Catchtime(logger=logger, message="Disconnecting from devices"):
-                    await ctx.filtered_inventory.disconnect_inventory()
+            if self._settings.adaptive_concurrency:
+                self._teardown_limiters(ctx.filtered_inventory.devices, [ctx])
+            if self._settings.circuit_breaker_threshold is not None:
+                self._teardown_circuit_breakers(ctx.filtered_inventory.devices)
+
+    def _setup_circuit_breakers(self, devices: Iterable[AntaDevice], threshold: int) -> None:
+        """Attach a circuit breaker to each device."""
+        for device in devices:
+            device.circuit_breaker = AntaCircuitBreaker(device.name, threshold=threshold, cooldown=self._settings.circuit_breaker_cooldown)
+
+    def _teardown_circuit_breakers(self, devices: Iterable[AntaDevice]) -> None:
+        """Detach the circuit breakers from the devices and log the devices with requests that failed fast."""
+        for device in devices:
+            if (breaker := device.circuit_breaker) is None:
+                continue
+            device.circuit_breaker = None
+            if breaker.stats["rejected"]:
+                logger.info(
+                    "Circuit breaker of %s opened %d time(s) during the run, %d request(s) failed fast",
+                    device.name,
+                    breaker.stats["trips"],
+                    breaker.stats["rejected"],
+                )
 
-        ctx.end_time = datetime.now(tz=timezone.utc)
-        return ctx
+    def _setup_limiters(self, devices: Iterable[AntaDevice]) -> None:
+        """Attach an adaptive limiter to each device, sharing a run-wide limiter bounded by `max_concurrency`."""
+        device_limits = {device: device.max_connections or MAX_CONCURRENT_REQUESTS for device in devices}
+        global_limit = min(self._settings.max_concurrency, sum(device_limits.values()))
+        global_limiter = AntaAdaptiveLimiter("global", initial_limit=global_limit, max_limit=global_limit)
+        for device, max_limit in device_limits.items():
+            device.limiter = AntaAdaptiveLimiter(device.name, initial_limit=DEFAULT_INITIAL_LIMIT, max_limit=max_limit, parent=global_limiter)
+
+    def _detach_limiter(self, ctx: AntaRunContext, device: AntaDevice) -> None:
+        """Detach the adaptive limiter of a device found unreachable by the pipelined connection and lower the run-wide limit sized for it."""
+        if device.limiter is None:
+            return
+        global_limiter = device.limiter.parent
+        device.limiter = None
+        if global_limiter is not None:
+            device_limits = sum(other.limiter.max_limit for other in ctx.selected_tests if other.limiter is not None)
+            global_limiter.set_max_limit(min(self._settings.max_concurrency, device_limits))
+
+    def _teardown_limiters(self, devices: Iterable[AntaDevice], contexts: list[AntaRunContext]) -> None:
+        """Detach the adaptive limiters from the devices and record their final statistics in the contexts running tests on them."""
+        global_limiter: AntaAdaptiveLimiter | None = None
+        for device in devices:
+            if device.limiter is None:
+                continue
+            global_limiter = device.limiter.parent
+            stats = device.limiter.statistics
+            device.limiter = None
+            selected_contexts = [ctx for ctx in contexts if device in ctx.selected_tests]
+            if not selected_contexts:
+                # Unreachable device with the pipelined connection
+                continue
+            for ctx in selected_contexts:
+                ctx.concurrency_limits[device.name] = stats
+            logger.debug(
+                "Adaptive concurrency limit for '%s': %d (lowest: %d, highest: %d), %d timeout(s), %d rejection(s) / %d request(s)",
+                device.name,
+                stats["limit"],
+                stats["lowest_limit"],
+                stats["highest_limit"],
+                stats["timeouts"],
+                stats["rejections"],
+                stats["requests"],
+            )
+        if global_limiter is not None:
+            stats = global_limiter.statistics
+            for ctx in contexts:
+                ctx.global_concurrency_limit = stats
+            logger.info(
+                "Adaptive concurrency limit for the run: %d (lowest: %d, highest: %d), %d timeout(s), %d rejection(s) / %d request(s)",
+                stats["limit"],
+                stats["lowest_limit"],
+                stats["highest_limit"],
+                stats["timeouts"],
+                stats["rejections"],
+                stats["requests"],
+            )
+
+    async def _execute_workers(self, ctx: AntaRunContext) -> AsyncGenerator[TestResult, None]:
+        """Execute the selected tests with a pool of `max_concurrency` workers in the current event loop.
+
+        With the `historical` schedule, the longest tests of the previous runs are dispatched first
+        and the durations of the tests are recorded for the next runs.
+        With the `pipelined_connect` setting, the devices are connected concurrently with the test execution.
+        With the `test_timeout` and `run_deadline` settings, the tests exceeding them are cancelled.
+        """
+        scheduler, history = self._create_scheduler(ctx)
+        results: Queue[TestResult | None] = Queue()
+        deadline = self._get_run_deadline(ctx)
+        # The tests of a device are scheduled once the device is connected
+        workers = [create_task(self._connect_devices(ctx, scheduler, deadline))] if self._settings.pipelined_connect else []
+        # The running tests of the concurrent runs of `run_many()` share the same budget
+        budget = ctx.concurrency_budget if ctx.concurrency_budget is not None else nullcontext()
+
+        async def worker() -> None:
+            """Instantiate and run the scheduled tests one at a time."""
+            while (item := await scheduler.get()) is not None:
+                device, test_def = item
+                try:
+                    queued_start = perf_counter()
+                    async with budget:
+                        queued = perf_counter() - queued_start
+                        result = await self._run_test(ctx, device, test_def, deadline, history)
+                        if result is not None:
+                            result.timings.queued = queued
+                            results.put_nowait(result)
+                finally:
+                    scheduler.task_done(device)
+
+        workers += [create_task(worker()) for _ in range(min(self._settings.max_concurrency, ctx.total_tests_scheduled))]
+
+        async def wait_workers() -> None:
+            """Wait for all workers and signal the end of the results."""
+            try:
+                await gather(*workers)
+            finally:
+                results.put_nowait(None)
+
+        waiter = create_task(wait_workers())
+        try:
+            while (result := await results.get()) is not None:
+                yield result
+            # Propagate any unexpected exception raised by a worker
+            await waiter
+        finally:
+            # Only relevant if a test raised unexpectedly or if the consumer stopped early
+            for task in (*workers, waiter):
+                task.cancel()
+            await gather(*workers, waiter, return_exceptions=True)
+            if history is not None:
+                history.save()
+
+    async def _run_test(
+        self, ctx: AntaRunContext, device: AntaDevice, test_def: AntaTestDefinition, deadline: float | None, history: AntaDurationHistory | None
+    ) -> TestResult | None:
+        """Run a scheduled test and record its duration in the history. Returns None if the test cannot be created.
+
+        A test dispatched after the run deadline is not run and its result is left unset.
+        """
+        coro = self._create_test_coroutine(device, test_def, ctx.prefetched_commands.get(device), ctx.plan)
+        if coro is None:
+            return None
+        if deadline is not None and get_running_loop().time() >= deadline:
+            return self._skip_test_coroutine(coro)
+        start = perf_counter()
+        result = await self._await_test_coroutine(coro, deadline)
+        if history is not None:
+            history.record(device, test_def, perf_counter() - start)
+        return result
+
+    async def _await_until_deadline(self, coro: Coroutine[Any, Any, None], deadline: float | None, phase: str) -> None:
+        """Await a phase of the run, cancelled with a warning if it exceeds the run deadline."""
+        if deadline is None:
+            await coro
+            return
+        try:
+            await wait_for(coro, deadline - get_running_loop().time())
+        except asyncio.TimeoutError:
+            logger.warning("%s cancelled after exceeding the run deadline of %ss", phase, self._settings.run_deadline)
+
+    def _get_run_deadline(self, ctx: AntaRunContext) -> float | None:
+        """Return the event loop time of the deadline of the run, None if the `run_deadline` setting is not set."""
+        if self._settings.run_deadline is None or ctx.start_time is None:
+            return None
+        elapsed = (datetime.now(tz=timezone.utc) - ctx.start_time).total_seconds()
+        return get_running_loop().time() + self._settings.run_deadline - elapsed
+
+    def _create_scheduler(self, ctx: AntaRunContext) -> tuple[AntaTestScheduler, AntaDurationHistory | None]:
+        """Create the test scheduler of the run and the test duration history of the `historical` schedule.
+
+        The tests of the selected devices are added to the scheduler, unless the devices are connected
+        concurrently with the test execution in which case the scheduler is left open.
+        """
+        history = AntaDurationHistory.load(self._settings.durations_file.expanduser()) if self._settings.schedule == "historical" else None
+        scheduler = AntaHistoricalTestScheduler(history) if history is not None else AntaTestScheduler()
+        if self._settings.pipelined_connect:
+            scheduler.open()
+        else:
+            for device, test_definitions in ctx.selected_tests.items():
+                scheduler.add(device, test_definitions)
+        return scheduler, history
+
+    async def _connect_devices(self, ctx: AntaRunContext, scheduler: AntaTestScheduler, deadline: float | None) -> None:
+        """Connect to the selected devices and schedule the tests of each device as soon as it is connected.
+
+        Devices that are not established are removed from the selected devices when `established_only` is set,
+        like in `_setup_inventory`. The scheduler is closed once all the devices have been processed.
+        The connection and the prefetching of a device are cancelled once the run deadline is exceeded.
+        """
+
+        async def refresh(device: AntaDevice) -> None:
+            try:
+                await device.refresh()
+            except Exception as exc:  # noqa: BLE001
+                anta_log_exception(exc, "Error when refreshing inventory", logger)
+
+        async def connect(device: AntaDevice, test_definitions: set[AntaTestDefinition]) -> None:
+            if ctx.refresh_established or not device.established:
+                await self._await_until_deadline(refresh(device), deadline, f"Connection to {device.name}")
+            if ctx.filters.established_only and not device.established:
+                del ctx.selected_tests[device]
+                self._detach_limiter(ctx, device)
+                if AntaTest.progress is not None:
+                    AntaTest.progress.schedule(device.name, -len(test_definitions))
+                return
+            if self._settings.prefetch:
+                await self._await_until_deadline(self._prefetch_device_commands(ctx, device, test_definitions), deadline, f"Prefetching commands on {device.name}")
+            scheduler.add(device, test_definitions)
+
+        try:
+            with Catchtime(logger=logger, message="Connecting to devices"), trace_span("Connecting to devices"):
+                await gather(*(connect(device, test_definitions) for device, test_definitions in ctx.selected_tests.items()))
+        finally:
+            scheduler.close()
+
+        ctx.selected_inventory = ctx.filtered_inventory.get_inventory(established_only=True) if ctx.filters.established_only else ctx.filtered_inventory
+        ctx.devices_unreachable_at_setup = sorted(set(ctx.filtered_inventory.keys()) - set(ctx.selected_inventory.keys()))
+        self._log_run_information(ctx)
+        if not ctx.selected_inventory:
+            self._log_warning_msg(msg="No reachable devices found for testing after connectivity checks.", ctx=ctx)
+
+    async def _execute_shards(self, ctx: AntaRunContext) -> AsyncGenerator[TestResult, None]:
+        """Execute the selected tests in shard worker processes and yield the test results of each shard once it completes.
+
+        Devices are assigned to the shards to balance the number of tests. Each worker process runs its shard
+        with its own event loop and device connections, and the shard results are merged in the parent process.
+        The progress is coarse: it moves forward by the results of a shard once the whole shard completes.
+        """
+        # Assign the devices with the most tests first to the least loaded shard
+        shard_devices: list[set[str]] = [set() for _ in ctx.shard_reports]
+        for device, test_definitions in sorted(ctx.selected_tests.items(), key=lambda item: len(item[1]), reverse=True):
+            report = min(ctx.shard_reports, key=lambda report: report.tests_scheduled)
+            shard_devices[report.index].add(device.name)
+            report.devices.append(device.name)
+            report.tests_scheduled += len(test_definitions)
+
+        settings = self._settings.model_dump() | {"shards": 1}
+        root_logger = logging.getLogger()
+        log_level = Log.__members__.get(logging.getLevelName(root_logger.getEffectiveLevel())) if root_logger.handlers else None
+        executor = ProcessPoolExecutor(
+            max_workers=len(ctx.shard_reports), mp_context=multiprocessing.get_context("spawn"), initializer=partial(_init_shard_process, log_level)
+        )
+        loop = get_running_loop()
+
+        async def run_shard(report: AntaShardReport, payload: bytes) -> tuple[AntaShardReport, _ShardResult | None]:
+            """Run a shard in a worker process."""
+            report.start_time = datetime.now(tz=timezone.utc)
+            try:
+                return report, await loop.run_in_executor(executor, _run_shard, payload)
+            except Exception as exc:  # noqa: BLE001
+                report.error = exc_to_str(exc)
+                anta_log_exception(exc, f"An error occurred while running shard {report.index}", logger)
+                return report, None
+            finally:
+                report.end_time = datetime.now(tz=timezone.utc)
+
+        tasks = [
+            create_task(run_shard(report, pickle.dumps((ctx.filtered_inventory.get_inventory(devices=devices), ctx.catalog, ctx.filters, settings))))
+            for report, devices in zip(ctx.shard_reports, shard_devices, strict=True)
+        ]
+        selected_devices: set[str] = set()
+        try:
+            for task in as_completed(tasks):
+                report, shard = await task
+                if shard is None:
+                    continue
+                report.total_results = len(shard.manager)
+                selected_devices.update(shard.selected_devices)
+                ctx.devices_unreachable_at_setup.extend(shard.devices_unreachable_at_setup)
+                ctx.warnings_at_setup.extend(shard.warnings_at_setup)
+                logger.info(
+                    "Shard %d completed in %s: %d devices, %d results",
+                    report.index,
+                    format_td(report.duration.total_seconds()) if report.duration else "N/A",
+                    len(shard.selected_devices),
+                    report.total_results,
+                )
+                for result in shard.manager.results:
+                    AntaTest.update_progress(result.name)
+                    yield result
+        finally:
+            for task in tasks:
+                task.cancel()
+            await gather(*tasks, return_exceptions=True)
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        # Update the context with the devices selected by the shards
+        ctx.devices_unreachable_at_setup.sort()
+        ctx.selected_inventory = ctx.filtered_inventory.get_inventory(devices=selected_devices)
+        ctx.selected_tests = defaultdict(set, {device: tests for device, tests in ctx.selected_tests.items() if device.name in selected_devices})
+
+    def _setup_shards(self, ctx: AntaRunContext) -> bool:
+        """Set up the shards of the ANTA run if the `shards` setting is greater than 1.
+
+        Returns True if the run is sharded, otherwise False.
+        """
+        if self._settings.shards <= 1 or len(ctx.filtered_inventory) <= 1:
+            return False
+        try:
+            pickle.dumps((ctx.filtered_inventory, ctx.catalog))
+        except (pickle.PicklingError, AttributeError, TypeError) as exc:
+            msg = f"Cannot send the inventory and the catalog to the shard worker processes: {exc_to_str(exc)}. Running the tests in a single process."
+            self._log_warning_msg(msg=msg, ctx=ctx)
+            return False
+        ctx.shard_reports = [AntaShardReport(index=index) for index in range(min(self._settings.shards, len(ctx.filtered_inventory)))]
+        return True
+
+    async def _prefetch_commands(self, ctx: AntaRunContext) -> None:
+        """Collect the unique commands of the selected tests once per device before running the tests.
+
+        The commands of the selected tests are rendered and deduplicated by `AntaCommand.uid`, so a command
+        shared by several tests is collected once regardless of the device cache size or TTL.
+        Commands with `use_cache` disabled and blocked commands are left to the tests.
+        """
+        await gather(*(self._prefetch_device_commands(ctx, device, test_definitions) for device, test_definitions in ctx.selected_tests.items()))
+
+    async def _prefetch_device_commands(self, ctx: AntaRunContext, device: AntaDevice, test_definitions: set[AntaTestDefinition]) -> None:
+        """Collect the unique commands of the selected tests of a device and store them in the context."""
+        commands: dict[str, AntaCommand] = {}
+        for test_def in test_definitions:
+            try:
+                test = self._get_test(ctx.plan, device, test_def)
+            except Exception:  # noqa: BLE001, S112
+                # The error is reported when the test is created to run
+                continue
+            for command in test.instance_commands:
+                if command.use_cache and command.uid not in commands and not any(re.match(pattern, command.command) for pattern in EOS_BLACKLIST_CMDS):
+                    commands[command.uid] = command
+
+        try:
+            await device.collect_commands(list(commands.values()), collection_id="prefetch")
+        except Exception as exc:  # noqa: BLE001
+            # device._collect() is user-defined code, the tests will collect their commands
+            anta_log_exception(exc, f"Exception raised while prefetching commands on device {device.name}", logger)
+            return
+        ctx.prefetched_commands[device] = commands
+        logger.debug("Prefetched %d unique command(s) for %d test(s) on %s", len(commands), len(test_definitions), device.name)
 
     async def _setup_inventory(self, ctx: AntaRunContext) -> bool:
         """Set up the inventory for the ANTA run.
@@ -357,14 +1333,24 @@ class AntaRunner:
             self._log_warning_msg(msg=" ".join(msg_parts), ctx=ctx)
             return False
 
+        sharded = self._setup_shards(ctx)
+
         # In dry-run mode, set the selected inventory to the filtered inventory
-        if ctx.dry_run:
+        # In sharded mode, the shard worker processes connect to their devices
+        # In pipelined mode, the devices are connected when executing the tests
+        if ctx.dry_run or sharded or self._settings.pipelined_connect:
             ctx.selected_inventory = ctx.filtered_inventory
             return True
 
-        # Attempt to connect to devices that passed filters
-        with Catchtime(logger=logger, message="Connecting to devices"):
-            await ctx.filtered_inventory.connect_inventory()
+        # Attempt to connect to devices that passed filters, unless already connected by `run_many()`
+        if not ctx.inventory_connected:
+            with Catchtime(logger=logger, message="Connecting to devices"), trace_span("Connecting to devices"):
+                if ctx.refresh_established:
+                    await ctx.filtered_inventory.connect_inventory()
+                else:
+                    await ctx.filtered_inventory.get_inventory(
+                        devices={device.name for device in ctx.filtered_inventory.devices if not device.established}
+                    ).connect_inventory()
 
         # Remove devices that are unreachable if required
         ctx.selected_inventory = ctx.filtered_inventory.get_inventory(established_only=True) if ctx.filters.established_only else ctx.filtered_inventory
@@ -402,6 +1388,9 @@ class AntaRunner:
                 # Then add the tests with matching tags from device tags
                 ctx.selected_tests[device].update(ctx.catalog.get_tests_by_tags(device.tags))
 
+        if ctx.filters.test_instances is not None:
+            self._filter_test_instances(ctx, ctx.filters.test_instances)
+
         if ctx.total_tests_scheduled == 0:
             msg_parts = ["No tests scheduled to run after filtering by tags/tests."]
             if ctx.filters.tests:
@@ -414,38 +1403,114 @@ class AntaRunner:
 
         return True
 
+    def _filter_test_instances(self, ctx: AntaRunContext, test_instances: dict[str, set[tuple[str, str | None]]]) -> None:
+        """Keep only the selected tests matching the `(test name, inputs uid)` pairs of their device."""
+        for device in list(ctx.selected_tests):
+            instances = test_instances.get(device.name, set())
+            ctx.selected_tests[device] = {
+                test_def for test_def in ctx.selected_tests[device] if {(test_def.test.name, test_def.inputs.uid), (test_def.test.name, None)} & instances
+            }
+            if not ctx.selected_tests[device]:
+                del ctx.selected_tests[device]
+
     def _get_test_coroutines(self, ctx: AntaRunContext) -> list[Coroutine[Any, Any, TestResult]]:
-        """Get the test coroutines for the ANTA run."""
-        coros = []
-        for device, test_definitions in ctx.selected_tests.items():
-            for test_def in test_definitions:
-                try:
-                    coros.append(test_def.test(device=device, inputs=test_def.inputs).test())
-                except Exception as exc:  # noqa: BLE001, PERF203
-                    # An AntaTest instance is potentially user-defined code.
-                    # We need to catch everything and exit gracefully with an error message.
-                    msg = "\n".join(
-                        [
-                            f"There is an error when creating test {test_def.test.__module__}.{test_def.test.__name__}.",
-                            f"If this is not a custom test implementation: {GITHUB_SUGGESTION}",
-                        ],
-                    )
-                    anta_log_exception(exc, msg, logger)
-        return coros
-
-    def _close_test_coroutines(self, coros: list[Coroutine[Any, Any, TestResult]], ctx: AntaRunContext) -> None:
-        """Close the test coroutines. Used in dry-run."""
+        """Get all the test coroutines for the ANTA run. Used in dry-run."""
+        coros = (
+            self._create_test_coroutine(device, test_def, plan=ctx.plan) for device, test_definitions in ctx.selected_tests.items() for test_def in test_definitions
+        )
+        return [coro for coro in coros if coro is not None]
+
+    def _create_test_coroutine(
+        self,
+        device: AntaDevice,
+        test_def: AntaTestDefinition,
+        prefetched_commands: dict[str, AntaCommand] | None = None,
+        plan: AntaRunPlan | None = None,
+    ) -> Coroutine[Any, Any, TestResult] | None:
+        """Instantiate the `AntaTest` of a test definition for a device, or reset the test prepared in `plan`, and return its test coroutine.
+
+        The output and errors of the test commands found in `prefetched_commands` are loaded in the test instance.
+        Returns None if the test cannot be created.
+        """
+        try:
+            test = self._get_test(plan, device, test_def)
+            if prefetched_commands:
+                for command in test.instance_commands:
+                    if command.use_cache and (prefetched := prefetched_commands.get(command.uid)) is not None:
+                        command.output = prefetched.output
+                        command.errors = list(prefetched.errors)
+                        command.timing = prefetched.timing
+            return test.test()
+        except Exception as exc:  # noqa: BLE001
+            # An AntaTest instance is potentially user-defined code.
+            # We need to catch everything and exit gracefully with an error message.
+            msg = "\n".join(
+                [
+                    f"There is an error when creating test {test_def.test.__module__}.{test_def.test.__name__}.",
+                    f"If this is not a custom test implementation: {GITHUB_SUGGESTION}",
+                ],
+            )
+            anta_log_exception(exc, msg, logger)
+            return None
+
+    def _get_test(self, plan: AntaRunPlan | None, device: AntaDevice, test_def: AntaTestDefinition) -> AntaTest:
+        """Return the test prepared in `plan` for a device, reset to run again, or a new test instance if it is not prepared."""
+        if plan is not None and (test := plan.get_test(device, test_def)) is not None:
+            return test
+        return test_def.test(device=device, inputs=test_def.inputs)
+
+    def _close_test_coroutines(self, coros: list[Coroutine[Any, Any, TestResult]], ctx: AntaRunContext) -> Iterator[TestResult]:
+        """Close the test coroutines and yield the unset test results added to the context manager. Used in dry-run."""
         for coro in coros:
-            # Get the AntaTest instance from the coroutine locals, can be in `args` when decorated
-            coro_locals = getcoroutinelocals(coro)
-            test = coro_locals.get("self") or coro_locals.get("args")
-            if isinstance(test, AntaTest):
-                ctx.manager.add(test.result)
-            elif test and isinstance(test, tuple) and isinstance(test[0], AntaTest):
-                ctx.manager.add(test[0].result)
-            else:
-                logger.error("Coroutine %s does not have an AntaTest instance.", coro)
+            result = self._get_test_result(coro)
             coro.close()
+            if result is not None:
+                ctx.manager.add(result)
+                ctx.results.append(result)
+                yield result
+
+    def _get_test_result(self, coro: Coroutine[Any, Any, TestResult]) -> TestResult | None:
+        """Return the result of the `AntaTest` instance of a test coroutine that has not started yet."""
+        # Get the AntaTest instance from the coroutine locals, can be in `args` when decorated
+        coro_locals = getcoroutinelocals(coro)
+        test = coro_locals.get("self") or coro_locals.get("args")
+        if isinstance(test, AntaTest):
+            return test.result
+        if test and isinstance(test, tuple) and isinstance(test[0], AntaTest):
+            return test[0].result
+        logger.error("Coroutine %s does not have an AntaTest instance.", coro)
+        return None
+
+    async def _await_test_coroutine(self, coro: Coroutine[Any, Any, TestResult], deadline: float | None) -> TestResult | None:
+        """Await a test coroutine, bounded by the `test_timeout` setting and the run deadline.
+
+        A test exceeding the bound is cancelled and its result is set to error. Returns None if the result of a
+        cancelled test cannot be found.
+        """
+        timeout = self._settings.test_timeout
+        reason = f"Test cancelled after exceeding the test timeout of {timeout}s"
+        if deadline is not None and (timeout is None or deadline - get_running_loop().time() < timeout):
+            timeout = deadline - get_running_loop().time()
+            reason = f"Test cancelled after exceeding the run deadline of {self._settings.run_deadline}s"
+        if timeout is None:
+            return await coro
+        result = self._get_test_result(coro)
+        try:
+            return await wait_for(coro, timeout)
+        except asyncio.TimeoutError:
+            if result is not None:
+                result.is_error(reason)
+            AntaTest.update_progress(result.name if result is not None else None)
+            return result
+
+    def _skip_test_coroutine(self, coro: Coroutine[Any, Any, TestResult]) -> TestResult | None:
+        """Close a test coroutine dispatched after the run deadline and return its unset result, reported as not run."""
+        result = self._get_test_result(coro)
+        coro.close()
+        if result is not None:
+            result.messages.append(f"Test not run, the run deadline of {self._settings.run_deadline}s was exceeded")
+        AntaTest.update_progress(result.name if result is not None else None)
+        return result
 
     def _log_run_information(self, ctx: AntaRunContext) -> None:
         """Log ANTA run information and potential resource limit warnings."""
@@ -482,8 +1547,70 @@ class AntaRunner:
             )
             self._log_warning_msg(msg=msg, ctx=ctx)
 
+    def _plan_costs(self, ctx: AntaRunContext) -> None:
+        """Estimate the cost of the selected tests per device and log the cost plan of the run. Used in dry-run."""
+        history = AntaDurationHistory.load(self._settings.durations_file.expanduser())
+        for device, test_definitions in ctx.selected_tests.items():
+            ctx.cost_plans[device.name] = self._plan_device_cost(device, test_definitions, history)
+            logger.debug("Cost plan of %s: %s", device.name, ctx.cost_plans[device.name])
+
+        total = ctx.total_cost_plan
+        logger.info(
+            "Cost plan: %d command(s) rendered, %d unique command(s), %d eAPI request(s) predicted across %d device(s)",
+            total.commands,
+            total.unique_commands,
+            total.requests,
+            len(ctx.cost_plans),
+        )
+        if total.expected_duration is not None:
+            logger.info(
+                "Cumulated test duration from the previous runs: %s (%d/%d tests with history)",
+                format_td(total.expected_duration),
+                total.tests_with_history,
+                total.tests,
+            )
+
+    def _plan_device_cost(self, device: AntaDevice, test_definitions: set[AntaTestDefinition], history: AntaDurationHistory) -> AntaCostPlan:
+        """Estimate the cost of the selected tests of a device.
+
+        The commands of a device are collected once per `AntaCommand.uid` when the device cache or prefetching is enabled,
+        and coalesced in requests of up to `max_size` commands with the same output format and version when batching is enabled.
+        Tests that cannot be created or have blocked commands do not collect any command.
+        """
+        plan = AntaCostPlan(tests=len(test_definitions))
+        commands: list[AntaCommand] = []
+        for test_def in test_definitions:
+            if (duration := history.expected_duration(device, test_def)) is not None:
+                plan.expected_duration = (plan.expected_duration or 0.0) + duration
+                plan.tests_with_history += 1
+            try:
+                test = test_def.test(device=device, inputs=test_def.inputs)
+            except Exception:  # noqa: BLE001, S112
+                # The error is reported when the test is created to run
+                continue
+            blocked = any(re.match(pattern, command.command) for command in test.instance_commands for pattern in EOS_BLACKLIST_CMDS)
+            if test.result.result == AntaTestStatus.UNSET and not blocked:
+                commands.extend(test.instance_commands)
+
+        plan.commands = len(commands)
+        plan.unique_commands = len({command.uid for command in commands})
+        if device.cache is not None or self._settings.prefetch:
+            collected = list({command.uid: command for command in commands if command.use_cache}.values())
+            collected.extend(command for command in commands if not command.use_cache)
+        else:
+            collected = commands
+        if device.batcher is None:
+            plan.requests = len(collected)
+        else:
+            batches = Counter((command.ofmt, command.version) for command in collected)
+            plan.requests = sum(ceil(count / device.batcher.max_size) for count in batches.values())
+        return plan
+
     def _log_cache_statistics(self, ctx: AntaRunContext) -> None:
         """Log cache statistics for each device in the inventory."""
+        if ctx.shard_reports:
+            # Devices of a sharded run are used in the shard worker processes
+            return
         for device in ctx.selected_inventory.devices:
             if device.cache_statistics is not None:
                 msg = (
@@ -494,6 +1621,41 @@ class AntaRunner:
                 logger.debug(msg)
             else:
                 logger.debug("Caching is not enabled on %s", device.name)
+            if (batch_statistics := device.batch_statistics) is not None:
+                logger.debug(
+                    "Batching statistics for '%s': %s command(s) in %s batch(es) (average batch size: %s)",
+                    device.name,
+                    batch_statistics["batched_commands"],
+                    batch_statistics["batches_sent"],
+                    batch_statistics["average_batch_size"],
+                )
+            if (decode_statistics := device.decode_statistics) is not None:
+                logger.debug(
+                    "Decoding statistics for '%s': %s response(s) decoded in the event loop in %s (longest: %s), %s response(s) offloaded",
+                    device.name,
+                    decode_statistics["inline_responses"],
+                    decode_statistics["inline_decode_time"],
+                    decode_statistics["max_inline_decode_time"],
+                    decode_statistics["offloaded_responses"],
+                )
+
+    def _log_timing_statistics(self, ctx: AntaRunContext) -> None:
+        """Log the cumulated timings of the test phases and the slowest tests, devices and commands of the run."""
+        if not ctx.manager.results:
+            return
+        totals = ctx.timing_statistics
+        logger.debug(
+            "Cumulated test timings: setup %s, queued %s, collection %s (device wait %s, network %s), evaluation %s, %d cache hit(s) / %d miss(es)",
+            *(format_td(totals[phase]) for phase in ("setup", "queued", "collection", "wait", "network", "evaluation")),
+            totals["cache_hits"],
+            totals["cache_misses"],
+        )
+        for result in ctx.slowest_tests():
+            logger.debug("Slowest test: %s on %s, %s", result.test, result.name, format_td(result.timings.duration))
+        for device, duration in ctx.slowest_devices():
+            logger.debug("Slowest device: %s, %s of cumulated test duration", device, format_td(duration))
+        for device, command, network in ctx.slowest_commands():
+            logger.debug("Slowest command: '%s' on %s, %s of network time", command, device, format_td(network))
 
     def _log_warning_msg(self, msg: str, ctx: AntaRunContext) -> None:
         """Log the provided message at WARNING level and add it to the context warnings_at_setup list."""
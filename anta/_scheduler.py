@@ -0,0 +1,291 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""ANTA test schedulers used by the runner."""
+
+from __future__ import annotations
+
+import heapq
+import json
+import logging
+from asyncio import Event
+from collections import deque
+from itertools import count
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from anta.catalog import AntaTestDefinition
+    from anta.device import AntaDevice
+
+logger = logging.getLogger(__name__)
+
+
+class AntaDurationHistory:
+    """Durations of the tests from previous ANTA runs, persisted in a JSON file.
+
+    Durations are stored per device name, test name and hash of the test inputs.
+    A new duration is averaged with the previous one to smooth out the variations between runs.
+
+    Examples
+    --------
+    ```python
+    history = AntaDurationHistory.load(Path("durations.json"))
+    history.expected_duration(device, test_definition)
+    history.record(device, test_definition, 1.5)
+    history.save()
+    ```
+    """
+
+    def __init__(self, path: Path, durations: dict[str, dict[str, float]] | None = None) -> None:
+        """Initialize an AntaDurationHistory.
+
+        Parameters
+        ----------
+        path
+            Path of the JSON file storing the durations.
+        durations
+            Durations in seconds per device name and test key.
+        """
+        self.path = path
+        self.durations: dict[str, dict[str, float]] = durations if durations is not None else {}
+        self._recorded: dict[str, dict[str, float]] = {}
+
+    @classmethod
+    def load(cls, path: Path) -> AntaDurationHistory:
+        """Load the durations from a JSON file. An empty history is returned if the file does not exist or is invalid."""
+        return cls(path, cls._read(path))
+
+    @staticmethod
+    def _read(path: Path) -> dict[str, dict[str, float]]:
+        """Read the durations from a JSON file."""
+        if not path.exists():
+            return {}
+        try:
+            durations = json.loads(path.read_text(encoding="UTF-8"))
+        except (OSError, ValueError) as e:
+            logger.warning("Unable to load the test durations from %s: %s", path, e)
+            return {}
+        if not isinstance(durations, dict):
+            logger.warning("Unable to load the test durations from %s: invalid format", path)
+            return {}
+        return durations
+
+    @staticmethod
+    def test_key(test_definition: AntaTestDefinition) -> str:
+        """Return the key of a test definition in the history, built from the test name and the hash of its inputs."""
+        return f"{test_definition.test.name}:{test_definition.inputs.uid}"
+
+    def expected_duration(self, device: AntaDevice, test_definition: AntaTestDefinition) -> float | None:
+        """Return the expected duration in seconds of a test on a device, None if the test has never run."""
+        return self.durations.get(device.name, {}).get(self.test_key(test_definition))
+
+    def record(self, device: AntaDevice, test_definition: AntaTestDefinition, duration: float) -> None:
+        """Record the duration in seconds of a test on a device."""
+        key = self.test_key(test_definition)
+        device_durations = self.durations.setdefault(device.name, {})
+        if (previous := device_durations.get(key)) is not None:
+            duration = (previous + duration) / 2
+        device_durations[key] = duration
+        self._recorded.setdefault(device.name, {})[key] = duration
+
+    def save(self) -> None:
+        """Save the recorded durations to the JSON file.
+
+        The file is read again before being replaced atomically, so the durations recorded by concurrent runs
+        on other devices, e.g. by the shards of a run, are preserved.
+        """
+        if not self._recorded:
+            return
+        try:
+            durations = self._read(self.path)
+            for device, device_durations in self._recorded.items():
+                durations.setdefault(device, {}).update(device_durations)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with NamedTemporaryFile("w", encoding="UTF-8", dir=self.path.parent, prefix=f".{self.path.name}.", delete=False) as file:
+                json.dump(durations, file)
+            Path(file.name).replace(self.path)
+        except OSError as e:
+            logger.warning("Unable to save the test durations to %s: %s", self.path, e)
+            return
+        self._recorded.clear()
+
+
+class AntaTestScheduler:
+    """Per-device fair-share scheduler for the tests of an ANTA run.
+
+    Tests are kept in per-device queues and dispatched round-robin across devices.
+    A device is set aside while its running tests count reached its limit, which is
+    derived from `AntaDevice.max_connections`, so concurrency slots of the runner are
+    handed over to other devices instead of waiting on a single device connection limit.
+
+    Workers call `get()` to retrieve the next test to run and must call `task_done()`
+    once the test has completed. Tests can be added while the workers are running
+    between `open()` and `close()`.
+
+    Examples
+    --------
+    ```python
+    scheduler = AntaTestScheduler()
+    scheduler.add(device, test_definitions)
+    while (item := await scheduler.get()) is not None:
+        device, test_definition = item
+        ...
+        scheduler.task_done(device)
+    ```
+    """
+
+    def __init__(self) -> None:
+        """Initialize an AntaTestScheduler."""
+        self._queues: dict[AntaDevice, deque[AntaTestDefinition]] = {}
+        self._running: dict[AntaDevice, int] = {}
+        # Devices with pending tests and available capacity, in round-robin order
+        self._ready: deque[AntaDevice] = deque()
+        # Devices with pending tests that reached their limit
+        self._saturated: set[AntaDevice] = set()
+        self._pending = 0
+        # When open, tests can still be added and the workers wait for them once the queues are empty
+        self._open = False
+        self._changed = Event()
+
+    def __len__(self) -> int:
+        """Return the number of tests that have not been dispatched yet."""
+        return self._pending
+
+    @staticmethod
+    def device_limit(device: AntaDevice) -> int | None:
+        """Return the maximum number of tests that can run concurrently on a device, None if unlimited."""
+        return device.max_connections
+
+    def open(self) -> None:
+        """Signal that tests will be added while the workers are running, until `close()` is called."""
+        self._open = True
+
+    def close(self) -> None:
+        """Signal that no more tests will be added."""
+        self._open = False
+        # Wake up the waiting workers so they can exit
+        self._changed.set()
+
+    def _push_ready(self, device: AntaDevice) -> None:
+        """Put a device in the ready rotation."""
+        self._ready.append(device)
+
+    def _pop_ready(self) -> AntaDevice | None:
+        """Return the next device of the ready rotation, None if no device is ready."""
+        return self._ready.popleft() if self._ready else None
+
+    def add(self, device: AntaDevice, tests: Iterable[AntaTestDefinition]) -> None:
+        """Add tests to the queue of a device.
+
+        Parameters
+        ----------
+        device
+            Device on which the tests will run.
+        tests
+            Tests definitions to run on the device.
+        """
+        queue = self._queues.setdefault(device, deque())
+        self._running.setdefault(device, 0)
+        was_empty = not queue
+        previous_size = len(queue)
+        queue.extend(tests)
+        self._pending += len(queue) - previous_size
+        if was_empty and queue:
+            self._make_ready(device)
+
+    def _make_ready(self, device: AntaDevice) -> None:
+        """Put a device with pending tests in the ready rotation or in the saturated set."""
+        limit = self.device_limit(device)
+        if limit is not None and self._running[device] >= limit:
+            self._saturated.add(device)
+        else:
+            self._push_ready(device)
+            self._changed.set()
+
+    def get_nowait(self) -> tuple[AntaDevice, AntaTestDefinition] | None:
+        """Return the next test to run or None if no device can run a test right now."""
+        if (device := self._pop_ready()) is None:
+            return None
+        queue = self._queues[device]
+        test = queue.popleft()
+        self._pending -= 1
+        self._running[device] += 1
+        if queue:
+            self._make_ready(device)
+        return device, test
+
+    async def get(self) -> tuple[AntaDevice, AntaTestDefinition] | None:
+        """Wait for the next test to run.
+
+        Returns
+        -------
+        tuple[AntaDevice, AntaTestDefinition] | None
+            The device and the test definition to run, or None when there are no more tests to dispatch and the scheduler is closed.
+        """
+        while (item := self.get_nowait()) is None:
+            if not self._pending and not self._open:
+                return None
+            # All devices with pending tests reached their limit, wait for a test to complete
+            self._changed.clear()
+            await self._changed.wait()
+        return item
+
+    def task_done(self, device: AntaDevice) -> None:
+        """Signal that a test dispatched for a device has completed.
+
+        Parameters
+        ----------
+        device
+            Device on which the test ran.
+        """
+        self._running[device] -= 1
+        if device in self._saturated:
+            self._saturated.discard(device)
+            self._make_ready(device)
+        elif not self._pending:
+            # Wake up the waiting workers so they can exit
+            self._changed.set()
+
+
+class AntaHistoricalTestScheduler(AntaTestScheduler):
+    """Longest-processing-time-first scheduler based on the test durations of previous runs.
+
+    The tests of each device are dispatched by decreasing expected duration and the ready device
+    with the longest next test is served first, so the slow tests do not start at the end of the run.
+    Tests that have never run are considered the longest. Device limits are enforced like `AntaTestScheduler`.
+    """
+
+    def __init__(self, history: AntaDurationHistory) -> None:
+        """Initialize an AntaHistoricalTestScheduler.
+
+        Parameters
+        ----------
+        history
+            Durations of the tests from previous runs.
+        """
+        super().__init__()
+        self.history = history
+        # Heap of the ready devices by decreasing expected duration of their next test
+        self._heap: list[tuple[float, int, AntaDevice]] = []
+        self._counter = count()
+
+    def _expected_duration(self, device: AntaDevice, test: AntaTestDefinition) -> float:
+        """Return the expected duration of a test, infinite if the test has never run."""
+        duration = self.history.expected_duration(device, test)
+        return duration if duration is not None else float("inf")
+
+    def add(self, device: AntaDevice, tests: Iterable[AntaTestDefinition]) -> None:
+        """Add tests to the queue of a device, sorted by decreasing expected duration."""
+        super().add(device, sorted(tests, key=lambda test: self._expected_duration(device, test), reverse=True))
+
+    def _push_ready(self, device: AntaDevice) -> None:
+        """Put a device in the ready heap."""
+        heapq.heappush(self._heap, (-self._expected_duration(device, self._queues[device][0]), next(self._counter), device))
+
+    def _pop_ready(self) -> AntaDevice | None:
+        """Return the ready device with the longest next test, None if no device is ready."""
+        return heapq.heappop(self._heap)[2] if self._heap else None
@@ -0,0 +1,148 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""ANTA tracing of the runs to Chrome trace-event files, viewable offline with Perfetto or chrome://tracing."""
+
+from __future__ import annotations
+
+import json
+import logging
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+import asynceapi
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+RUN_TRACK = "ANTA"
+"""Track of the spans that are not related to a device, e.g. the runner spans."""
+
+# Returned by `trace_span()` when tracing is disabled
+_NO_SPAN: AbstractContextManager[None] = nullcontext()
+
+# Track and lane of the span running in the current context
+_current_lane: ContextVar[tuple[str, int] | None] = ContextVar("anta_trace_lane", default=None)
+
+_tracer: AntaTracer | None = None
+
+
+class AntaTracer:
+    """Record spans as Chrome trace events, with one track per device.
+
+    Each track is a trace process and the concurrent spans of a track are laid out on lanes, i.e. trace threads.
+    A span opened with a track takes the first free lane of this track, unless it is nested in a span of the same track.
+    A span opened without a track is nested in the current span, or laid out on the `ANTA` track.
+
+    Examples
+    --------
+    ```python
+    with tracing(Path("run.json")):
+        await runner.run(inventory, catalog)
+    ```
+    """
+
+    def __init__(self) -> None:
+        """Initialize an AntaTracer."""
+        self.events: list[dict[str, Any]] = []
+        self._start = perf_counter()
+        # Busy flags of the lanes of each track
+        self._lanes: dict[str, list[bool]] = {RUN_TRACK: [False]}
+        # Trace process ID of each track, assigned when the track is created
+        self._pids: dict[str, int] = {RUN_TRACK: 0}
+
+    @contextmanager
+    def span(self, name: str, track: str | None = None, **args: Any) -> Iterator[None]:  # noqa: ANN401
+        """Record a span of the code running in the context.
+
+        Parameters
+        ----------
+        name
+            Name of the span.
+        track
+            Track of the span, e.g. a device name. None to nest the span in the current span.
+        args
+            Arguments of the span displayed by the trace viewers.
+        """
+        current = _current_lane.get()
+        token = None
+        if track is None or (current is not None and current[0] == track):
+            track, lane = current if current is not None else (RUN_TRACK, 0)
+        else:
+            lane = self._acquire_lane(track)
+            token = _current_lane.set((track, lane))
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            end = perf_counter()
+            self.events.append(
+                {
+                    "name": name,
+                    "ph": "X",
+                    "ts": (start - self._start) * 1e6,
+                    "dur": (end - start) * 1e6,
+                    "pid": self._pids[track],
+                    "tid": lane,
+                    "args": args,
+                }
+            )
+            if token is not None:
+                self._lanes[track][lane] = False
+                _current_lane.reset(token)
+
+    def _acquire_lane(self, track: str) -> int:
+        """Return the first free lane of a track and mark it as busy."""
+        if (lanes := self._lanes.get(track)) is None:
+            lanes = self._lanes[track] = []
+            self._pids[track] = len(self._pids)
+        lane = next((index for index, busy in enumerate(lanes) if not busy), len(lanes))
+        if lane == len(lanes):
+            lanes.append(True)
+        else:
+            lanes[lane] = True
+        return lane
+
+    def save(self, path: Path) -> None:
+        """Save the recorded spans to a Chrome trace-event JSON file."""
+        metadata: list[dict[str, Any]] = []
+        for track, lanes in self._lanes.items():
+            pid = self._pids[track]
+            metadata.append({"name": "process_name", "ph": "M", "pid": pid, "args": {"name": track}})
+            metadata.extend({"name": "thread_name", "ph": "M", "pid": pid, "tid": lane, "args": {"name": f"lane {lane}"}} for lane in range(len(lanes)))
+        with path.open("w", encoding="UTF-8") as file:
+            json.dump({"traceEvents": metadata + self.events, "displayTimeUnit": "ms"}, file)
+
+
+def trace_span(name: str, track: str | None = None, **args: Any) -> AbstractContextManager[None]:  # noqa: ANN401
+    """Return a context manager recording a span with the current tracer, a no-op if tracing is disabled.
+
+    Parameters are the same as `AntaTracer.span()`.
+    """
+    if _tracer is None:
+        return _NO_SPAN
+    return _tracer.span(name, track, **args)
+
+
+@contextmanager
+def tracing(path: Path) -> Iterator[AntaTracer]:
+    """Enable tracing in the context and save the recorded spans to a Chrome trace-event JSON file on exit.
+
+    The eAPI requests of `asynceapi.Device` are traced as well.
+    """
+    global _tracer  # noqa: PLW0603
+    tracer = AntaTracer()
+    _tracer = tracer
+    asynceapi.Device.trace_span = tracer.span
+    try:
+        yield tracer
+    finally:
+        _tracer = None
+        asynceapi.Device.trace_span = None
+        tracer.save(path)
+        logger.info("Trace of %d span(s) saved to %s", len(tracer.events), path)
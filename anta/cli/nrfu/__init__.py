@@ -6,18 +6,20 @@
 from __future__ import annotations
 
 import sys
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import click
 
 from anta.cli.nrfu import commands
-from anta.cli.utils import AliasedGroup, catalog_options, inventory_options
+from anta.cli.utils import AliasedGroup, catalog_options, inventory_options, load_results, parse_statuses, transport_options
 from anta.result_manager import ResultManager
 from anta.result_manager.models import AntaTestStatus
 
 if TYPE_CHECKING:
     from anta.catalog import AntaCatalog
     from anta.inventory import AntaInventory
+    from anta.result_manager.models import TestResult
 
 if sys.version_info >= (3, 12):
     from typing import override
@@ -62,6 +64,7 @@ HIDE_STATUS.remove("unset")
 
 
 @click.group(invoke_without_command=True, cls=IgnoreRequiredWithHelp)
+@transport_options
 @inventory_options
 @catalog_options()
 @click.option(
@@ -118,6 +121,62 @@ HIDE_STATUS.remove("unset")
     default=True,
     show_default=True,
 )
+@click.option(
+    "--progress-per-device",
+    help="Display a progress bar per device in addition to the progress bar of the run.",
+    type=bool,
+    show_envvar=True,
+    is_flag=True,
+    default=False,
+)
+@click.option(
+    "--shards",
+    help="Number of worker processes running the tests, the selected inventory is split across the processes. Defaults to the ANTA_SHARDS runner setting.",
+    type=click.IntRange(min=1),
+    show_envvar=True,
+    default=None,
+)
+@click.option(
+    "--schedule",
+    help="Scheduling strategy of the tests: 'fair' dispatches the tests round-robin across devices, "
+    "'historical' dispatches the longest tests of the previous runs first. Defaults to the ANTA_SCHEDULE runner setting.",
+    type=click.Choice(["fair", "historical"]),
+    show_envvar=True,
+    default=None,
+)
+@click.option(
+    "--watch",
+    help="Re-run the tests every INTERVAL seconds on the connected inventory and print only the test status changes. Stop with Ctrl+C.",
+    type=click.FloatRange(min=0, min_open=True),
+    metavar="INTERVAL",
+    show_envvar=True,
+    default=None,
+)
+@click.option(
+    "--rerun-from",
+    help="Path to the JSON results of a previous run. Only re-run the tests of these results matching --status, "
+    "the instances of a test with different inputs are told apart.",
+    type=click.Path(file_okay=True, dir_okay=False, exists=True, readable=True, path_type=Path),
+    callback=load_results,
+    show_envvar=True,
+    default=None,
+)
+@click.option(
+    "--status",
+    help="Comma-separated statuses of the test results to re-run with --rerun-from.",
+    callback=parse_statuses,
+    show_envvar=True,
+    default="failure,error",
+    show_default=True,
+)
+@click.option(
+    "--trace",
+    help="Path to a Chrome trace-event JSON file recording the spans of the run, with one track per device. "
+    "Open it with https://ui.perfetto.dev or chrome://tracing.",
+    type=click.Path(file_okay=True, dir_okay=False, writable=True, path_type=Path),
+    show_envvar=True,
+    default=None,
+)
 @click.pass_context
 def nrfu(
     ctx: click.Context,
@@ -132,6 +191,13 @@ def nrfu(
     ignore_error: bool,
     dry_run: bool,
     disconnect: bool,
+    progress_per_device: bool,
+    shards: int | None,
+    schedule: str | None,
+    watch: float | None,
+    rerun_from: list[TestResult] | None,
+    status: set[AntaTestStatus],
+    trace: Path | None,
     catalog_format: str = "yaml",
 ) -> None:
     """Run ANTA tests on selected inventory devices."""
@@ -153,6 +219,13 @@ def nrfu(
     ctx.obj["test"] = test
     ctx.obj["dry_run"] = dry_run
     ctx.obj["disconnect"] = disconnect
+    ctx.obj["progress_per_device"] = progress_per_device
+    ctx.obj["shards"] = shards
+    ctx.obj["schedule"] = schedule
+    ctx.obj["watch"] = watch
+    ctx.obj["rerun_from"] = rerun_from
+    ctx.obj["status"] = status
+    ctx.obj["trace"] = trace
 
     # Invoke `anta nrfu table` if no command is passed
     if not ctx.invoked_subcommand:
@@ -5,29 +5,35 @@
 
 from __future__ import annotations
 
-import asyncio
-import json
 import logging
+from contextlib import aclosing, contextmanager, nullcontext
 from typing import TYPE_CHECKING, Any, Literal
 
 from rich._spinners import SPINNERS
 from rich.panel import Panel
-from rich.progress import BarColumn, MofNCompleteColumn, Progress, SpinnerColumn, TextColumn, TimeElapsedColumn, TimeRemainingColumn
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, SpinnerColumn, TaskID, TextColumn, TimeElapsedColumn, TimeRemainingColumn
 
 from anta import __version__ as anta_version
+from anta._loop import run as run_event_loop
+from anta._progress import AntaProgress
 from anta._runner import AntaRunContext, AntaRunFilters, AntaRunner
+from anta._tracing import tracing
 from anta.cli.console import console
 from anta.cli.utils import ExitCode
 from anta.models import AntaTest
 from anta.reporter import ReportJinja, ReportTable
 from anta.reporter.csv_reporter import ReportCsv
 from anta.reporter.md_reporter import MDReportGenerator
+from anta.settings import AntaRunnerSettings, get_json_settings
+from asynceapi.codec import get_codec
 
 if TYPE_CHECKING:
     import pathlib
+    from collections.abc import Iterator
 
     import click
 
+    from anta._progress import AntaProgressUpdate
     from anta.catalog import AntaCatalog
     from anta.inventory import AntaInventory
     from anta.result_manager import ResultManager
@@ -46,21 +52,42 @@ def run_tests(ctx: click.Context) -> AntaRunContext:
     test = nrfu_ctx_params["test"] or None
     dry_run = nrfu_ctx_params["dry_run"]
     disconnect = nrfu_ctx_params["disconnect"]
+    watch = nrfu_ctx_params["watch"]
+    rerun_from = nrfu_ctx_params["rerun_from"]
+    trace = nrfu_ctx_params["trace"]
+    settings = {name: nrfu_ctx_params[name] for name in ("shards", "schedule") if nrfu_ctx_params[name] is not None}
 
     catalog: AntaCatalog = ctx.obj["catalog"]
     inventory: AntaInventory = ctx.obj["inventory"]
 
     print_settings(inventory, catalog)
-    with anta_progress_bar() as AntaTest.progress:
-        runner = AntaRunner()
+    runner = AntaRunner(settings=AntaRunnerSettings(**settings)) if settings else AntaRunner()
+    if rerun_from is not None:
+        # Only re-run the selected results of the previous run, narrowed down by the device and test filters
+        results = [result for result in rerun_from if (device is None or result.name in device) and (test is None or result.test in test)]
+        filters = AntaRunFilters.from_results(results, statuses=nrfu_ctx_params["status"], tags=tags)
+        if not filters.test_instances:
+            console.print("No test results to re-run with the selected statuses.", style="cyan")
+            ctx.exit()
+    else:
         filters = AntaRunFilters(
             devices=set(device) if device else None,
             tests=set(test) if test else None,
             tags=tags,
         )
-        run_ctx = asyncio.run(
-            runner.run(inventory=inventory, catalog=catalog, result_manager=ctx.obj["result_manager"], filters=filters, dry_run=dry_run, disconnect=disconnect)
-        )
+    with tracing(trace) if trace is not None else nullcontext():
+        if watch is not None and not dry_run:
+            try:
+                run_event_loop(watch_tests(runner, inventory, catalog, filters, interval=watch), runner.settings)
+            except KeyboardInterrupt:
+                console.print("Watch mode stopped.", style="cyan")
+            ctx.exit()
+
+        with anta_progress(per_device=nrfu_ctx_params["progress_per_device"]):
+            run_ctx = run_event_loop(
+                runner.run(inventory=inventory, catalog=catalog, result_manager=ctx.obj["result_manager"], filters=filters, dry_run=dry_run, disconnect=disconnect),
+                runner.settings,
+            )
 
     if dry_run:
         ctx.exit()
@@ -68,6 +95,18 @@ def run_tests(ctx: click.Context) -> AntaRunContext:
     return run_ctx
 
 
+async def watch_tests(runner: AntaRunner, inventory: AntaInventory, catalog: AntaCatalog, filters: AntaRunFilters, *, interval: float) -> None:
+    """Run the tests every `interval` seconds and print the test status changes of each iteration."""
+    async with aclosing(runner.run_periodic(inventory, catalog, interval, filters)) as iterations:
+        async for run_ctx, changes in iterations:
+            time = run_ctx.end_time.astimezone().strftime("%Y-%m-%d %H:%M:%S") if run_ctx.end_time is not None else "N/A"
+            console.print(f"[{time}] {len(run_ctx.manager)} results, {len(changes)} status change(s)", style="cyan", highlight=False)
+            for change in changes:
+                previous = f"[{change.previous}]{change.previous.upper()}[/{change.previous}]" if change.previous is not None else "NEW"
+                result = change.result
+                console.print(f"{result.name} :: {result.test} :: {previous} -> [{result.result}]{result.result.upper()}[/{result.result}]", highlight=False)
+
+
 def _get_result_manager(ctx: click.Context, *, apply_hide_filter: bool = True) -> ResultManager:
     """Get a ResultManager instance based on Click context."""
     if apply_hide_filter:
@@ -145,7 +184,7 @@ def print_jinja(results: ResultManager, template: pathlib.Path, output: pathlib.
     """Print result based on template."""
     console.print()
     reporter = ReportJinja(template_path=template)
-    json_data = json.loads(results.json)
+    json_data = get_codec(get_json_settings().codec).loads(results.json)
     report = reporter.render(json_data)
     console.print(report)
     if output is not None:
@@ -250,3 +289,27 @@ def anta_progress_bar() -> Progress:
         TimeRemainingColumn(),
         expand=True,
     )
+
+
+@contextmanager
+def anta_progress(*, per_device: bool = False) -> Iterator[None]:
+    """Display the progress of the tests with a progress bar, and a progress bar per device if `per_device` is set."""
+    with anta_progress_bar() as progress_bar:
+        # The progress bars are added with the first progress report
+        tasks: dict[str | None, TaskID] = {}
+
+        def update_bar(key: str | None, description: str, completed: int, total: int) -> None:
+            if key not in tasks:
+                tasks[key] = progress_bar.add_task(description, total=total)
+            progress_bar.update(tasks[key], completed=completed, total=total)
+
+        def report(update: AntaProgressUpdate) -> None:
+            update_bar(None, "Running NRFU Tests ...", update.completed, update.total)
+            for device, (completed, total) in update.devices.items():
+                update_bar(device, device, completed, total)
+
+        AntaTest.progress = AntaProgress(report, per_device=per_device)
+        try:
+            yield
+        finally:
+            AntaTest.progress = None
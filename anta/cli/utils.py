@@ -19,6 +19,9 @@ from anta.catalog import AntaCatalog
 from anta.inventory import AntaInventory
 from anta.inventory.exceptions import InventoryIncorrectSchemaError, InventoryRootKeyError
 from anta.logger import anta_log_exception
+from anta.result_manager.models import AntaTestStatus, TestResult
+from anta.settings import get_json_settings
+from asynceapi.codec import get_codec
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -56,6 +59,28 @@ def parse_tags(_ctx: click.Context, _param: Option, value: str | None) -> set[st
     return None
 
 
+def parse_statuses(_ctx: click.Context, _param: Option, value: str) -> set[AntaTestStatus]:
+    """Click option callback to parse a comma-separated list of test statuses."""
+    try:
+        return {AntaTestStatus(status.strip().lower()) for status in value.split(",")}
+    except ValueError as e:
+        raise click.BadParameter(str(e)) from e
+
+
+def load_results(_ctx: click.Context, _param: Option, value: Path | None) -> list[TestResult] | None:
+    """Click option callback to load the test results of a ResultManager JSON dump.
+
+    The atomic results are not loaded.
+    """
+    if value is None:
+        return None
+    try:
+        return [TestResult.model_validate({**result, "atomic_results": []}) for result in get_codec(get_json_settings().codec).loads(value.read_bytes())]
+    except (OSError, TypeError, ValueError) as e:
+        msg = f"Cannot load the test results from {value}: {e}"
+        raise click.BadParameter(msg) from e
+
+
 def exit_with_code(ctx: click.Context) -> None:
     """Exit the Click application with an exit code.
 
@@ -123,7 +148,10 @@ class AliasedGroup(click.Group):
 
 
 def core_options(f: Callable[..., R]) -> Callable[..., R]:
-    """Click common options when requiring an inventory to interact with devices."""
+    """Click common options when requiring an inventory to interact with devices.
+
+    The inventory is parsed with the `--batch-window` and `--http2` options of the commands decorated with `transport_options`.
+    """
 
     @click.option(
         "--username",
@@ -233,6 +261,8 @@ def core_options(f: Callable[..., R]) -> Callable[..., R]:
         disable_cache: bool,
         use_session_auth: bool | None,
         inventory_format: Literal["json", "yaml"],
+        batch_window: float | None = None,
+        http2: bool = False,
         **kwargs: Any,  # noqa: ANN401
     ) -> R:
         # If help is invoke somewhere, do not parse inventory
@@ -269,6 +299,8 @@ def core_options(f: Callable[..., R]) -> Callable[..., R]:
                 insecure=insecure,
                 disable_cache=disable_cache,
                 use_session_auth=use_session_auth,
+                batch_window=batch_window,
+                http2=http2,
                 file_format=inventory_format,
             )
         except (TypeError, ValueError, YAMLError, OSError, InventoryIncorrectSchemaError, InventoryRootKeyError) as e:
@@ -279,6 +311,33 @@ def core_options(f: Callable[..., R]) -> Callable[..., R]:
     return wrapper
 
 
+def transport_options(f: Callable[..., R]) -> Callable[..., R]:
+    """Click options tuning the transport of the devices when running tests. Must decorate a command decorated with `inventory_options`."""
+
+    @click.option(
+        "--batch-window",
+        help="Time in seconds during which concurrent commands sent to a device are coalesced into a single eAPI request. Batching is disabled when unset.",
+        show_envvar=True,
+        envvar="ANTA_BATCH_WINDOW",
+        type=click.FloatRange(min=0),
+        default=None,
+    )
+    @click.option(
+        "--http2",
+        help="Multiplex the eAPI requests sent to a device over a single HTTP/2 connection. Falls back to HTTP/1.1 if HTTP/2 is not available.",
+        show_envvar=True,
+        envvar="ANTA_HTTP2",
+        is_flag=True,
+        default=False,
+    )
+    @functools.wraps(f)
+    def wrapper(*, batch_window: float | None, http2: bool, **kwargs: Any) -> R:  # noqa: ANN401
+        # Parsed with the inventory by `core_options`
+        return f(batch_window=batch_window, http2=http2, **kwargs)
+
+    return wrapper
+
+
 def inventory_options(f: Callable[..., R]) -> Callable[..., R]:
     """Click common options when requiring an inventory to interact with devices."""
 
@@ -173,12 +173,12 @@ def skip_on_platforms(platforms: list[str]) -> T_TestAsyncDecorator:
             anta_test = args[0]
 
             if anta_test.result.result != "unset":
-                AntaTest.update_progress()
+                AntaTest.update_progress(anta_test.device.name)
                 return anta_test.result
 
             if anta_test.device.hw_model in platforms:
                 anta_test.result.is_skipped(f"{anta_test.__class__.__name__} test is not supported on {anta_test.device.hw_model}")
-                AntaTest.update_progress()
+                AntaTest.update_progress(anta_test.device.name)
                 return anta_test.result
 
             return await function(*args, **kwargs)
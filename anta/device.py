@@ -7,34 +7,50 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import multiprocessing
+import socket
 from abc import ABC, abstractmethod
 from collections import OrderedDict, defaultdict
-from dataclasses import dataclass
-from time import monotonic
-from typing import TYPE_CHECKING, Any, ClassVar, Literal
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from contextlib import AbstractAsyncContextManager, nullcontext
+from dataclasses import dataclass, field
+from functools import cache, partial
+from threading import Lock
+from time import monotonic, perf_counter
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, ParamSpec, TypeVar
 
 import asyncssh
 import httpcore
 from asyncssh import SSHClientConnection, SSHClientConnectionOptions
-from httpx import ConnectError, HTTPError, TimeoutException
+from httpx import ConnectError, HTTPError, Limits, Timeout, TimeoutException
 
 import asynceapi
 from anta import __DEBUG__
+from anta._tracing import trace_span
 from anta.logger import anta_log_exception, exc_to_str
 from anta.models import AntaCommand
-from anta.settings import get_httpx_settings
+from anta.result_manager.models import CommandTiming
+from anta.settings import get_httpx_settings, get_json_settings, get_session_store_settings
 from asynceapi._models import EAPIClientConnectionOptions
 from asynceapi._types import EapiComplexCommand
+from asynceapi.codec import get_codec
+from asynceapi.device import DEFAULT_LIMITS
 from asynceapi.errors import EapiAuthenticationError
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Callable, Iterator
     from pathlib import Path
 
+    from anta._limiter import AntaAdaptiveLimiter
+    from anta.inventory.models import AntaTransportProfile
     from asynceapi._types import EapiSimpleCommand
+    from asynceapi.session_store import EapiSessionStore
 
 logger = logging.getLogger(__name__)
 
+P = ParamSpec("P")
+T = TypeVar("T")
+
 # Do not load the default keypairs multiple times due to a performance issue introduced in cryptography 37.0
 # https://github.com/pyca/cryptography/issues/7236#issuecomment-1131908472
 CLIENT_KEYS = asyncssh.public_key.load_default_keypairs()
@@ -43,6 +59,9 @@ CLIENT_KEYS = asyncssh.public_key.load_default_keypairs()
 # See: https://github.com/encode/httpx/issues/3215
 MAX_CONCURRENT_REQUESTS = 100
 
+# Maximum number of commands coalesced in a single batch by the AntaCommandBatcher
+MAX_BATCH_SIZE = 50
+
 
 @dataclass(frozen=True, slots=True)
 class AntaDeviceCapabilities:
@@ -88,26 +107,28 @@ class AntaCache:
 
     async def get(self, key: str) -> Any:  # noqa: ANN401
         """Return the cached entry for key."""
-        self.stats["total"] += 1
-        if key in self.cache:
-            timestamp, value = self.cache[key]
-            if monotonic() - timestamp < self.ttl:
-                # checking the value is still valid
-                self.cache.move_to_end(key)
-                self.stats["hits"] += 1
-                return value
-            # Time expired
-            del self.cache[key]
-            del self.locks[key]
-        return None
+        with trace_span("AntaCache.get"):
+            self.stats["total"] += 1
+            if key in self.cache:
+                timestamp, value = self.cache[key]
+                if monotonic() - timestamp < self.ttl:
+                    # checking the value is still valid
+                    self.cache.move_to_end(key)
+                    self.stats["hits"] += 1
+                    return value
+                # Time expired
+                del self.cache[key]
+                del self.locks[key]
+            return None
 
     async def set(self, key: str, value: Any) -> bool:  # noqa: ANN401
         """Set the cached entry for key to value."""
-        timestamp = monotonic()
-        if len(self.cache) > self.max_size:
-            self.cache.popitem(last=False)
-        self.cache[key] = timestamp, value
-        return True
+        with trace_span("AntaCache.set"):
+            timestamp = monotonic()
+            if len(self.cache) > self.max_size:
+                self.cache.popitem(last=False)
+            self.cache[key] = timestamp, value
+            return True
 
     def clear(self) -> None:
         """Empty the cache."""
@@ -116,6 +137,288 @@ class AntaCache:
         self._init_stats()
 
 
+@dataclass(slots=True)
+class _CommandBatch:
+    """Commands waiting to be collected together by an AntaCommandBatcher."""
+
+    commands: list[AntaCommand]
+    done: asyncio.Future[None]
+    timer: asyncio.TimerHandle
+    collection_ids: list[str] = field(default_factory=list)
+
+
+class AntaCommandBatcher:  # pylint: disable=too-few-public-methods
+    """Coalesce the commands collected concurrently on a device into batches.
+
+    Commands sharing the same output format and version submitted within `window` seconds
+    are collected together with a single call to `AntaDevice._collect_batch()`.
+    A batch is flushed when the window expires or when it reaches `max_size` commands.
+
+    Example
+    -------
+
+    ```python
+    batcher = AntaCommandBatcher(device, window=0.01)
+    await asyncio.gather(batcher.collect(command1), batcher.collect(command2))
+    ```
+    """
+
+    def __init__(self, device: AntaDevice, window: float, max_size: int = MAX_BATCH_SIZE) -> None:
+        """Initialize the batcher."""
+        self.device = device
+        self.window = window
+        self.max_size = max_size
+        self._batches: dict[tuple[str, int | str], _CommandBatch] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+
+        # Stats
+        self.stats: dict[str, int] = {"commands": 0, "batches": 0}
+
+    async def collect(self, command: AntaCommand, *, collection_id: str | None = None) -> None:
+        """Add a command to the pending batch for its output format and version and wait for it to be collected.
+
+        The collection IDs of the commands of a batch are joined to build the eAPI request ID.
+        """
+        key = (command.ofmt, command.version)
+        if (batch := self._batches.get(key)) is None:
+            loop = asyncio.get_running_loop()
+            batch = _CommandBatch(commands=[], done=loop.create_future(), timer=loop.call_later(self.window, self._flush, key))
+            self._batches[key] = batch
+        batch.commands.append(command)
+        if collection_id is not None and collection_id not in batch.collection_ids:
+            batch.collection_ids.append(collection_id)
+        if len(batch.commands) >= self.max_size:
+            self._flush(key)
+        # Shield the batch so a cancelled caller does not cancel the collection of the other commands
+        await asyncio.shield(batch.done)
+
+    def _flush(self, key: tuple[str, int | str]) -> None:
+        """Start the collection of the pending batch for key."""
+        if (batch := self._batches.pop(key, None)) is None:
+            return
+        batch.timer.cancel()
+        self.stats["commands"] += len(batch.commands)
+        self.stats["batches"] += 1
+        task = asyncio.create_task(self._collect(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _collect(self, batch: _CommandBatch) -> None:
+        """Collect a batch and notify the waiting callers."""
+        try:
+            await self.device._collect_batch(batch.commands, collection_id="+".join(batch.collection_ids) or None)  # noqa: SLF001
+        except asyncio.CancelledError:
+            batch.done.cancel()
+            raise
+        except Exception as e:  # noqa: BLE001
+            batch.done.set_exception(e)
+        else:
+            batch.done.set_result(None)
+
+
+class _CircuitOpenError(Exception):
+    """Raised when a queued request is rejected by a circuit breaker that opened while it was waiting."""
+
+
+class AntaCircuitBreaker:
+    """Fail fast the requests to a device after consecutive transport failures.
+
+    After `threshold` consecutive failures the circuit opens and `allow()` rejects the requests.
+    If `cooldown` is set, one probe request is allowed every `cooldown` seconds while the circuit is open:
+    the circuit closes when a request succeeds.
+
+    Example
+    -------
+
+    ```python
+    breaker = AntaCircuitBreaker("device", threshold=3, cooldown=30)
+    if breaker.allow():
+        try:
+            await send_request()
+        except TransportError as e:
+            breaker.record_failure(str(e))
+        else:
+            breaker.record_success()
+    ```
+    """
+
+    def __init__(self, device: str, threshold: int, cooldown: float | None = None) -> None:
+        """Initialize an AntaCircuitBreaker.
+
+        Parameters
+        ----------
+        device
+            Name of the device.
+        threshold
+            Number of consecutive failures opening the circuit.
+        cooldown
+            Time in seconds between two probe requests while the circuit is open. None disables probing.
+        """
+        self.device = device
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.last_error: str | None = None
+        self._opened_at: float | None = None
+
+        # Stats
+        self.stats: dict[str, int] = {"trips": 0, "rejected": 0}
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the circuit is open."""
+        return self._opened_at is not None
+
+    @property
+    def reason(self) -> str:
+        """Error reported on the requests rejected by the open circuit."""
+        return f"Circuit breaker open after {self.failures} consecutive transport failures on {self.device}, last error: {self.last_error}"
+
+    def allow(self) -> bool:
+        """Return True if a request can be sent, False if it must fail fast."""
+        if self._opened_at is None:
+            return True
+        if self.cooldown is not None and monotonic() - self._opened_at >= self.cooldown:
+            # Probe request, the next one is allowed after another cool-down
+            self._opened_at = monotonic()
+            logger.debug("%s: circuit breaker cool-down elapsed, probing the device", self.device)
+            return True
+        self.stats["rejected"] += 1
+        return False
+
+    def record_success(self) -> None:
+        """Record a successful request, closing the circuit if it is open."""
+        if self._opened_at is not None:
+            logger.info("%s: circuit breaker closed, the device is responding again", self.device)
+        self.failures = 0
+        self._opened_at = None
+
+    def record_failure(self, error: str) -> None:
+        """Record a transport failure, opening the circuit once the threshold is reached."""
+        self.failures += 1
+        self.last_error = error
+        if self._opened_at is not None:
+            # Failed probe, wait for another cool-down
+            self._opened_at = monotonic()
+        elif self.failures >= self.threshold:
+            self._opened_at = monotonic()
+            self.stats["trips"] += 1
+            logger.warning("%s: circuit breaker opened after %d consecutive transport failures, the remaining commands will fail fast", self.device, self.failures)
+
+
+def _command_timing(command: AntaCommand) -> CommandTiming:
+    """Return the timing of a command, initialized if the command has not been timed yet."""
+    if command.timing is None:
+        command.timing = CommandTiming()
+    return command.timing
+
+
+class _DecodeProcessPool(Executor):
+    """Process pool decoding the large eAPI responses.
+
+    The worker processes are spawned on the first submission, so that they are not forked from the threads
+    of the event loop, and shut down with `shutdown()` once the run ends. The next submission starts a new pool.
+    """
+
+    def __init__(self) -> None:
+        self._pool: ProcessPoolExecutor | None = None
+        self._lock = Lock()
+
+    def submit(self, fn: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs) -> Future[T]:
+        """Submit a call to the process pool, starting the pool if required."""
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))
+            return self._pool.submit(fn, *args, **kwargs)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:  # noqa: FBT001, FBT002
+        """Shut down the process pool if it is started."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+
+@cache
+def _decode_executor() -> Executor:
+    """Return the executor decoding the large eAPI responses, shared by the devices."""
+    return _DecodeProcessPool()
+
+
+def shutdown_decode_executor() -> None:
+    """Shut down the process pool decoding the large eAPI responses. It is started again by the next offloaded response."""
+    if _decode_executor.cache_info().currsize:
+        # Do not wait for the responses of other runs still being decoded
+        _decode_executor().shutdown(wait=False)
+
+
+@cache
+def _session_store() -> EapiSessionStore | None:
+    """Return the eAPI session store shared by the devices, None if the session store is disabled."""
+    settings = get_session_store_settings()
+    if settings.path is None or settings.key is None:
+        return None
+    from asynceapi.session_store import EapiSessionStore  # noqa: PLC0415
+
+    return EapiSessionStore(settings.path, settings.key.get_secret_value())
+
+
+async def save_session_store() -> None:
+    """Save the cookies of the eAPI session store shared by the devices once per run, if it is enabled and was used.
+
+    The devices then skip saving the store when they are closed.
+    """
+    if _session_store.cache_info().currsize and (store := _session_store()) is not None:
+        await store.asave()
+
+
+def _transport_options(timeout: float | None, profile: AntaTransportProfile | None) -> dict[str, Any]:
+    """Return the HTTPX client options of a device from its transport profile, then the `ANTA_HTTPX_*` settings.
+
+    Parameters
+    ----------
+    timeout
+        Global timeout in seconds of the device, used for the timeouts not set. None means no timeout.
+    profile
+        Transport profile of the device.
+    """
+    settings = get_httpx_settings()
+
+    def option(name: str, default: Any = None) -> Any:  # noqa: ANN401
+        for source in (profile, settings):
+            if source is not None and (value := getattr(source, name)) is not None:
+                return value
+        return default
+
+    limits = Limits(
+        max_connections=option("max_connections", DEFAULT_LIMITS.max_connections),
+        max_keepalive_connections=option("max_keepalive_connections", DEFAULT_LIMITS.max_keepalive_connections),
+        keepalive_expiry=option("keepalive_expiry", DEFAULT_LIMITS.keepalive_expiry),
+    )
+    timeouts = {phase: value for phase in ("connect", "read", "write", "pool") if (value := option(f"{phase}_timeout")) is not None}
+    socket_options = None
+    if option("tcp_keepalive"):
+        socket_options = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+        # TCP_KEEPIDLE is not available on all platforms, e.g. macOS
+        if (idle := option("tcp_keepalive_idle")) is not None and hasattr(socket, "TCP_KEEPIDLE"):
+            socket_options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, idle))
+    return {"timeout": Timeout(timeout, **timeouts), "limits": limits, "socket_options": socket_options}
+
+
+def _record_timings(commands: list[AntaCommand], wait: float, network: float) -> None:
+    """Add the wait and network times of a device request to the timings of its commands."""
+    for command in commands:
+        timing = _command_timing(command)
+        timing.wait += wait
+        timing.network += network
+
+
+def _reject_commands(commands: list[AntaCommand], reason: str) -> None:
+    """Fail the commands of a request rejected by the circuit breaker of the device."""
+    for command in commands:
+        command.errors = [reason]
+
+
 class AntaDevice(ABC):
     """Abstract class representing a device in ANTA.
 
@@ -139,10 +442,20 @@ class AntaDevice(ABC):
     cache_locks : defaultdict[str, asyncio.Lock] | None
         Dictionary mapping keys to asyncio locks to guarantee exclusive access to the cache if not disabled.
         Deprecated, will be removed in ANTA v2.0.0, use self.cache.locks instead.
+    batcher : AntaCommandBatcher | None
+        Batcher coalescing the commands collected concurrently on this device (None if batching is disabled).
+    limiter : AntaAdaptiveLimiter | None
+        Adaptive limiter of the concurrent requests to this device, set by the runner when adaptive concurrency is enabled.
+    circuit_breaker : AntaCircuitBreaker | None
+        Circuit breaker failing fast the requests to this device after consecutive transport failures, set by the runner when enabled.
     max_connections : int | None
-        For informational/logging purposes only. Can be used by the runner to verify that
-        the total potential connections of a run do not exceed the system file descriptor limit.
+        Maximum number of concurrent connections allowed by the device, used by the runner to bound the
+        concurrent requests to the device when adaptive concurrency is enabled.
         This does **not** affect the actual device configuration. None if not available.
+    potential_connections : int | None
+        For informational/logging purposes only. Used by the runner to verify that
+        the total potential connections of a run do not exceed the system file descriptor limit.
+        Defaults to `max_connections`. None if not available.
     capabilities : AntaDeviceCapabilities
         Class-level declaration of which optional features this device type supports.
         Subclasses override this to advertise their capabilities.
@@ -150,7 +463,7 @@ class AntaDevice(ABC):
 
     capabilities: ClassVar[AntaDeviceCapabilities] = AntaDeviceCapabilities()
 
-    def __init__(self, name: str, tags: set[str] | None = None, *, disable_cache: bool = False) -> None:
+    def __init__(self, name: str, tags: set[str] | None = None, *, disable_cache: bool = False, batch_window: float | None = None) -> None:
         """Initialize an AntaDevice.
 
         Parameters
@@ -161,6 +474,8 @@ class AntaDevice(ABC):
             Tags for this device.
         disable_cache
             Disable caching for all commands for this device.
+        batch_window
+            Time in seconds during which concurrent commands are coalesced into a single batch. None disables batching.
 
         """
         self.name: str = name
@@ -178,6 +493,10 @@ class AntaDevice(ABC):
         if not disable_cache:
             self._init_cache()
 
+        self.batcher: AntaCommandBatcher | None = AntaCommandBatcher(self, window=batch_window) if batch_window is not None else None
+        self.limiter: AntaAdaptiveLimiter | None = None
+        self.circuit_breaker: AntaCircuitBreaker | None = None
+
     @property
     @abstractmethod
     def _keys(self) -> tuple[Any, ...]:
@@ -188,6 +507,11 @@ class AntaDevice(ABC):
         """Maximum number of concurrent connections allowed by the device. Can be overridden by subclasses, returns None if not available."""
         return None
 
+    @property
+    def potential_connections(self) -> int | None:
+        """Maximum number of connections opened to the device. Can be overridden by subclasses, returns None if not available."""
+        return self.max_connections
+
     def __eq__(self, other: object) -> bool:
         """Implement equality for AntaDevice objects."""
         return self._keys == other._keys if isinstance(other, self.__class__) else False
@@ -210,6 +534,34 @@ class AntaDevice(ABC):
             return {"total_commands_sent": stats["total"], "cache_hits": stats["hits"], "cache_hit_ratio": f"{ratio * 100:.2f}%"}
         return None
 
+    def _request_slot(self, overload: tuple[type[BaseException], ...] = (), rejected: tuple[type[BaseException], ...] = ()) -> AbstractAsyncContextManager[None]:
+        """Return a context waiting for a slot of the adaptive limiter for a request, a no-op context if there is no limiter.
+
+        Parameters
+        ----------
+        overload
+            Exceptions signaling that the device is overloaded, e.g. timeouts.
+        rejected
+            Exceptions signaling that the device rejected the request, e.g. command errors.
+        """
+        if self.limiter is None:
+            return nullcontext()
+        return self.limiter.slot(overload=overload, rejected=rejected)
+
+    @property
+    def decode_statistics(self) -> dict[str, Any] | None:
+        """Return the device response decoding statistics for logging purposes. None if the device does not decode responses."""
+        return None
+
+    @property
+    def batch_statistics(self) -> dict[str, Any] | None:
+        """Return the device command batching statistics for logging purposes."""
+        if self.batcher is not None:
+            stats = self.batcher.stats
+            ratio = stats["commands"] / stats["batches"] if stats["batches"] > 0 else 0
+            return {"batched_commands": stats["commands"], "batches_sent": stats["batches"], "average_batch_size": f"{ratio:.2f}"}
+        return None
+
     def __rich_repr__(self) -> Iterator[tuple[str, Any]]:
         """Implement Rich Repr Protocol.
 
@@ -255,6 +607,29 @@ class AntaDevice(ABC):
             An identifier used to build the eAPI request ID.
         """
 
+    async def _collect_batch(self, commands: list[AntaCommand], *, collection_id: str | None = None) -> None:
+        """Collect the outputs of a batch of commands sharing the same output format and version.
+
+        Used when command batching is enabled on the device. The default implementation collects
+        each command with `_collect()`, subclasses can override it to send all the commands in a single request.
+        The same error handling contract as `_collect()` applies to each command of the batch.
+
+        Parameters
+        ----------
+        commands
+            The commands to collect.
+        collection_id
+            An identifier used to build the eAPI request ID.
+        """
+        await asyncio.gather(*(self._collect(command=command, collection_id=collection_id) for command in commands))
+
+    async def _collect_or_batch(self, command: AntaCommand, *, collection_id: str | None = None) -> None:
+        """Collect a command using the batcher if batching is enabled, `_collect()` otherwise."""
+        if self.batcher is not None:
+            await self.batcher.collect(command, collection_id=collection_id)
+        else:
+            await self._collect(command=command, collection_id=collection_id)
+
     async def collect(self, command: AntaCommand, *, collection_id: str | None = None) -> None:
         """Collect the output for a specified command.
 
@@ -266,6 +641,9 @@ class AntaDevice(ABC):
         When caching is NOT enabled, either at the device or command level, the method directly collects the output
         via the private `_collect` method without interacting with the cache.
 
+        When batching is enabled on the device, the command is queued to the device batcher and collected
+        together with the other commands submitted within the batching window.
+
         Parameters
         ----------
         command
@@ -273,18 +651,21 @@ class AntaDevice(ABC):
         collection_id
             An identifier used to build the eAPI request ID.
         """
-        if self.cache is not None and command.use_cache:
-            async with self.cache.locks[command.uid]:
-                cached_output = await self.cache.get(command.uid)
-
-                if cached_output is not None:
-                    logger.debug("Cache hit for %s on %s", command.command, self.name)
-                    command.output = cached_output
-                else:
-                    await self._collect(command=command, collection_id=collection_id)
-                    await self.cache.set(command.uid, command.output)
-        else:
-            await self._collect(command=command, collection_id=collection_id)
+        with trace_span("AntaDevice.collect", self.name, command=command.command):
+            if self.cache is not None and command.use_cache:
+                async with self.cache.locks[command.uid]:
+                    cached_output = await self.cache.get(command.uid)
+
+                    if cached_output is not None:
+                        logger.debug("Cache hit for %s on %s", command.command, self.name)
+                        command.output = cached_output
+                        command.timing = CommandTiming(cache_hit=True)
+                    else:
+                        await self._collect_or_batch(command, collection_id=collection_id)
+                        await self.cache.set(command.uid, command.output)
+                        _command_timing(command).cache_hit = False
+            else:
+                await self._collect_or_batch(command, collection_id=collection_id)
 
     async def collect_commands(self, commands: list[AntaCommand], *, collection_id: str | None = None) -> None:
         """Collect multiple commands.
@@ -364,6 +745,8 @@ class AsyncEOSDevice(AntaDevice):
         Tags for this device.
     enable : bool
         When True, commands are collected in privileged (enable) mode.
+    transport_profile : AntaTransportProfile | None
+        Transport profile tuning the HTTPX client of the device.
     """
 
     capabilities = AntaDeviceCapabilities(supports_session_auth=True)
@@ -400,6 +783,9 @@ class AsyncEOSDevice(AntaDevice):
         insecure: bool = False,
         disable_cache: bool = False,
         use_session_auth: bool = False,
+        batch_window: float | None = None,
+        http2: bool = False,
+        transport_profile: AntaTransportProfile | None = None,
     ) -> None:
         """Instantiate an AsyncEOSDevice.
 
@@ -433,6 +819,15 @@ class AsyncEOSDevice(AntaDevice):
             Disable caching for all commands for this device.
         use_session_auth
             Use eAPI cookie-session authentication for this device.
+        batch_window
+            Time in seconds during which concurrent commands with the same output format and version
+            are coalesced into a single eAPI request. None disables batching.
+        http2
+            Multiplex the concurrent eAPI requests over a single HTTP/2 connection. Falls back to HTTP/1.1
+            if the device does not negotiate HTTP/2, if `proto` is 'http' or if the `h2` package is not installed.
+        transport_profile
+            Transport profile tuning the connection pool, the timeouts and the TCP options of the HTTPX client.
+            The settings not set in the profile use the `ANTA_HTTPX_*` environment variables.
         """
         if host is None:
             message = "'host' is required to create an AsyncEOSDevice"
@@ -440,7 +835,7 @@ class AsyncEOSDevice(AntaDevice):
             raise ValueError(message)
         if name is None:
             name = f"{host}{f':{port}' if port else ''}"
-        super().__init__(name, tags, disable_cache=disable_cache)
+        super().__init__(name, tags, disable_cache=disable_cache, batch_window=batch_window)
         if username is None:
             message = f"'username' is required to instantiate device '{self.name}'"
             logger.error(message)
@@ -451,8 +846,16 @@ class AsyncEOSDevice(AntaDevice):
             raise ValueError(message)
         self.enable = enable
         self._enable_password = enable_password
+        self.transport_profile = transport_profile
         self._eapi_opts = EAPIClientConnectionOptions(
-            host=host, username=username, password=password, port=port, proto=proto, timeout=timeout, use_session_auth=use_session_auth
+            host=host,
+            username=username,
+            password=password,
+            port=port,
+            proto=proto,
+            timeout=timeout,
+            use_session_auth=use_session_auth,
+            http2=http2,
         )
         self._client = self._create_client()
         ssh_params: dict[str, Any] = {}
@@ -460,20 +863,35 @@ class AsyncEOSDevice(AntaDevice):
             ssh_params["known_hosts"] = None
         self._ssh_opts = SSHClientConnectionOptions(host=host, port=ssh_port, username=username, password=password, client_keys=CLIENT_KEYS, **ssh_params)
 
-        self._command_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self._command_semaphore = asyncio.Semaphore(self._max_concurrent_requests())
+
+    def _max_concurrent_requests(self) -> int:
+        """Return the maximum number of concurrent requests to the device.
+
+        The requests are bounded by the connections of the HTTPX client so that they do not time out waiting for a
+        connection of the pool. The requests multiplexed over HTTP/2 are bounded by `MAX_CONCURRENT_REQUESTS` at least.
+        """
+        limit = self.max_connections or MAX_CONCURRENT_REQUESTS
+        return max(limit, MAX_CONCURRENT_REQUESTS) if self.http2 else limit
 
     def _create_client(self) -> asynceapi.Device:
         """Create and return a new asynceapi.Device client using stored connection options."""
         eapi_opts = self._eapi_opts
+        json_settings = get_json_settings()
         return asynceapi.Device(
             host=eapi_opts.host,
             port=eapi_opts.port,
             username=eapi_opts.username,
             password=eapi_opts.password,
             proto=eapi_opts.proto,
-            timeout=eapi_opts.timeout,
             trust_env=get_httpx_settings().trust_env,
             use_session_auth=eapi_opts.use_session_auth,
+            http2=eapi_opts.http2,
+            codec=get_codec(json_settings.codec),
+            decode_offload_threshold=json_settings.decode_offload_threshold,
+            decode_executor=_decode_executor() if json_settings.decode_offload_threshold is not None else None,
+            session_store=_session_store() if eapi_opts.use_session_auth else None,
+            **_transport_options(eapi_opts.timeout, self.transport_profile),
         )
 
     def __rich_repr__(self) -> Iterator[tuple[str, Any]]:
@@ -520,6 +938,34 @@ class AsyncEOSDevice(AntaDevice):
             f"insecure={self._ssh_opts.known_hosts is None!r})"
         )
 
+    def __reduce__(self) -> tuple[Callable[..., AsyncEOSDevice], tuple[()]]:
+        """Support pickling, e.g. to send the device to another process.
+
+        The device is recreated from its constructor arguments: the connection state,
+        the cache content and the hardware model are not preserved.
+        """
+        eapi_opts = self._eapi_opts
+        kwargs: dict[str, Any] = {
+            "host": eapi_opts.host,
+            "username": eapi_opts.username,
+            "password": eapi_opts.password,
+            "name": self.name,
+            "enable_password": self._enable_password,
+            "port": eapi_opts.port,
+            "ssh_port": self._ssh_opts.port,
+            "tags": self.tags,
+            "timeout": eapi_opts.timeout,
+            "proto": eapi_opts.proto,
+            "enable": self.enable,
+            "insecure": self._ssh_opts.known_hosts is None,
+            "disable_cache": self.cache is None,
+            "use_session_auth": eapi_opts.use_session_auth,
+            "batch_window": self.batcher.window if self.batcher is not None else None,
+            "http2": eapi_opts.http2,
+            "transport_profile": self.transport_profile,
+        }
+        return partial(self.__class__, **kwargs), ()
+
     @property
     def _keys(self) -> tuple[Any, ...]:
         """Two AsyncEOSDevice objects are equal if the hostname and the port are the same.
@@ -541,6 +987,30 @@ class AsyncEOSDevice(AntaDevice):
         """Whether eAPI cookie-session authentication is enabled for this device."""
         return self._eapi_opts.use_session_auth
 
+    @property
+    def http2(self) -> bool:
+        """Whether the eAPI requests of this device are multiplexed over HTTP/2, False if HTTP/2 is not available."""
+        return self._client.http2 and self._eapi_opts.proto == "https"
+
+    @property
+    def potential_connections(self) -> int | None:
+        """Maximum number of connections opened to the device, a single connection when the requests are multiplexed over HTTP/2."""
+        return 1 if self.http2 else self.max_connections
+
+    @property
+    def decode_statistics(self) -> dict[str, Any] | None:
+        """Return the eAPI response decoding statistics for logging purposes.
+
+        The responses decoded in the event loop block it, the responses offloaded to an executor do not.
+        """
+        stats = self._client.decode_stats
+        return {
+            "inline_responses": int(stats["inline"]),
+            "offloaded_responses": int(stats["offloaded"]),
+            "inline_decode_time": f"{stats['inline_time']:.3f}s",
+            "max_inline_decode_time": f"{stats['max_inline_time']:.3f}s",
+        }
+
     async def _collect(self, command: AntaCommand, *, collection_id: str | None = None) -> None:
         """Collect device command output from EOS using asynceapi.
 
@@ -555,6 +1025,27 @@ class AsyncEOSDevice(AntaDevice):
         collection_id
             An identifier used to build the eAPI request ID.
 
+        Raises
+        ------
+        RuntimeError
+            If the eAPI client is closed. Call `refresh()` first to reconnect.
+        """
+        await self._collect_batch([command], collection_id=collection_id)
+
+    async def _collect_batch(self, commands: list[AntaCommand], *, collection_id: str | None = None) -> None:
+        """Collect the outputs of a batch of commands from EOS in a single eAPI request.
+
+        The commands must share the same output format and version. On a command error, eAPI stops
+        the execution: the commands that ran before get their output, the failed command gets the errors
+        and the commands that were not executed are collected again in a new request.
+
+        Parameters
+        ----------
+        commands
+            The commands to collect.
+        collection_id
+            An identifier used to build the eAPI request ID.
+
         Raises
         ------
         RuntimeError
@@ -563,57 +1054,135 @@ class AsyncEOSDevice(AntaDevice):
         if self._client.is_closed:
             msg = f"Device {self.name}: httpx client is closed. Call refresh() to reconnect before collecting commands."
             raise RuntimeError(msg)
+        if self.circuit_breaker is not None and not self.circuit_breaker.allow():
+            _reject_commands(commands, self.circuit_breaker.reason)
+            return
+        # A request allowed while the circuit is open is the probe of the cool-down
+        probe = self.circuit_breaker is not None and self.circuit_breaker.is_open
+        not_executed: list[AntaCommand] = []
+        start = perf_counter()
         async with self._command_semaphore:
-            commands: list[EapiComplexCommand | EapiSimpleCommand] = []
-            if self.enable and self._enable_password is not None:
-                commands.append(
-                    {
-                        "cmd": "enable",
-                        "input": str(self._enable_password),
-                    },
-                )
-            elif self.enable:
-                # No password
-                commands.append(EapiComplexCommand(cmd="enable"))
-            commands += [EapiComplexCommand(cmd=command.command, revision=command.revision)] if command.revision else [EapiComplexCommand(cmd=command.command)]
+            sent = perf_counter()
+            eapi_commands = self._build_eapi_commands(commands)
+            first = commands[0]
             try:
-                response = await self._client.cli(
-                    commands=commands,
-                    ofmt=command.ofmt,
-                    version=command.version,
-                    req_id=f"ANTA-{collection_id}-{id(command)}" if collection_id else f"ANTA-{id(command)}",
-                )
+                async with self._request_slot(overload=(TimeoutException,), rejected=(asynceapi.EapiCommandError,)):
+                    self._check_circuit_breaker(probe=probe)
+                    response = await self._client.cli(
+                        commands=eapi_commands,
+                        ofmt=first.ofmt,
+                        version=first.version,
+                        req_id=f"ANTA-{collection_id}-{id(first)}" if collection_id else f"ANTA-{id(first)}",
+                    )
                 # Do not keep response of 'enable' command
-                command.output = response[-1]
+                for index, command in enumerate(commands, start=-len(commands)):
+                    command.output = response[index]
+                self._record_request()
+            except _CircuitOpenError as e:
+                # Raised within the limiter slot so the rejected request is not observed by the limiter
+                _reject_commands(commands, str(e))
+                return
             except asynceapi.EapiCommandError as e:
                 # This block catches exceptions related to EOS issuing an error.
+                not_executed = self._handle_batch_eapi_command_error(commands, e, offset=len(eapi_commands) - len(commands))
+                self._record_request()
+            except (EapiAuthenticationError, TimeoutException, ConnectError, OSError, HTTPError) as e:
+                # This block catches transport and authentication errors, the whole batch failed.
+                for command in commands:
+                    command.errors = [exc_to_str(e)]
+                self._handle_request_error(e)
+                self._record_request(e)
+            _record_timings(commands, wait=sent - start, network=perf_counter() - sent)
+            for command in commands[: len(commands) - len(not_executed)]:
+                logger.debug("%s: %s", self.name, command)
+        if not_executed:
+            # eAPI stops at the first failing command, send the remaining commands again
+            await self._collect_batch(not_executed, collection_id=collection_id)
+
+    def _check_circuit_breaker(self, *, probe: bool) -> None:
+        """Reject a request allowed with the circuit closed if the circuit opened while the request was waiting for a slot.
+
+        Raises
+        ------
+        _CircuitOpenError
+            If the circuit breaker rejects the request.
+        """
+        breaker = self.circuit_breaker
+        if breaker is not None and not probe and breaker.is_open and not breaker.allow():
+            raise _CircuitOpenError(breaker.reason)
+
+    def _build_eapi_commands(self, commands: list[AntaCommand]) -> list[EapiComplexCommand | EapiSimpleCommand]:
+        """Build the eAPI commands of a request, prepending the 'enable' command if required."""
+        eapi_commands: list[EapiComplexCommand | EapiSimpleCommand] = []
+        if self.enable and self._enable_password is not None:
+            eapi_commands.append(
+                {
+                    "cmd": "enable",
+                    "input": str(self._enable_password),
+                },
+            )
+        elif self.enable:
+            # No password
+            eapi_commands.append(EapiComplexCommand(cmd="enable"))
+        eapi_commands += [
+            EapiComplexCommand(cmd=command.command, revision=command.revision) if command.revision else EapiComplexCommand(cmd=command.command)
+            for command in commands
+        ]
+        return eapi_commands
+
+    def _handle_batch_eapi_command_error(self, commands: list[AntaCommand], e: asynceapi.EapiCommandError, offset: int) -> list[AntaCommand]:
+        """Split an EapiCommandError raised for a batch of commands.
+
+        The commands executed before the failure get their output and the failed command gets the errors.
+        `offset` is the number of commands prepended to the batch in the request (e.g. 'enable').
+
+        Returns
+        -------
+        list[AntaCommand]
+            The commands that were not executed by eAPI.
+        """
+        failed_index = len(e.passed) - offset
+        if failed_index < 0:
+            # A prepended command failed, none of the commands has been executed
+            for command in commands:
                 self._handle_eapi_command_error(command, e)
-            except EapiAuthenticationError as e:
-                # This block catches authentication errors (HTTP 401) from eAPI when session auth is enabled.
-                command.errors = [exc_to_str(e)]
-                logger.error("Authentication failed while sending a command to %s: %s", self.name, e)
-            except TimeoutException as e:
-                # This block catches Timeout exceptions.
-                command.errors = [exc_to_str(e)]
-                timeouts = self._client.timeout.as_dict()
-                logger.error(
-                    "%s occurred while sending a command to %s. Consider increasing the timeout.\nCurrent timeouts: Connect: %s | Read: %s | Write: %s | Pool: %s",
-                    exc_to_str(e),
-                    self.name,
-                    timeouts["connect"],
-                    timeouts["read"],
-                    timeouts["write"],
-                    timeouts["pool"],
-                )
-            except (ConnectError, OSError) as e:
-                # This block catches OSError and socket issues related exceptions.
-                command.errors = [exc_to_str(e)]
-                self._handle_connect_error(e)
-            except HTTPError as e:
-                # This block catches most of the httpx Exceptions and logs a general message.
-                command.errors = [exc_to_str(e)]
-                anta_log_exception(e, f"An error occurred while issuing an eAPI request to {self.name}", logger)
-            logger.debug("%s: %s", self.name, command)
+            return []
+        for index in range(failed_index):
+            commands[index].output = e.passed[offset + index]
+        self._handle_eapi_command_error(commands[failed_index], e)
+        return commands[failed_index + 1 :]
+
+    def _record_request(self, error: Exception | None = None) -> None:
+        """Record the outcome of an eAPI request in the circuit breaker, `error` being the transport error if any."""
+        if self.circuit_breaker is None:
+            return
+        if error is None:
+            self.circuit_breaker.record_success()
+        else:
+            self.circuit_breaker.record_failure(exc_to_str(error))
+
+    def _handle_request_error(self, e: EapiAuthenticationError | TimeoutException | ConnectError | OSError | HTTPError) -> None:
+        """Log an exception raised while issuing an eAPI request."""
+        if isinstance(e, EapiAuthenticationError):
+            # Authentication errors (HTTP 401) from eAPI when session auth is enabled.
+            logger.error("Authentication failed while sending a command to %s: %s", self.name, e)
+        elif isinstance(e, TimeoutException):
+            timeouts = self._client.timeout.as_dict()
+            logger.error(
+                "%s occurred while sending a command to %s. Consider increasing the timeout.\nCurrent timeouts: Connect: %s | Read: %s | Write: %s | Pool: %s",
+                exc_to_str(e),
+                self.name,
+                timeouts["connect"],
+                timeouts["read"],
+                timeouts["write"],
+                timeouts["pool"],
+            )
+        elif isinstance(e, (ConnectError, OSError)):
+            # OSError and socket issues related exceptions.
+            self._handle_connect_error(e)
+        else:
+            # Most of the httpx Exceptions, log a general message.
+            anta_log_exception(e, f"An error occurred while issuing an eAPI request to {self.name}", logger)
 
     def _handle_eapi_command_error(self, command: AntaCommand, e: asynceapi.EapiCommandError) -> None:
         """Handle and appropriately log an EapiCommandError exception."""
@@ -17,7 +17,7 @@ from yaml import YAMLError, safe_load
 
 from anta.device import AntaDevice, AntaDeviceCapabilities, AsyncEOSDevice
 from anta.inventory.exceptions import InventoryIncorrectSchemaError, InventoryRootKeyError
-from anta.inventory.models import AntaInventoryHost, AntaInventoryInput
+from anta.inventory.models import AntaInventoryHost, AntaInventoryInput, AntaTransportProfile
 from anta.logger import anta_log_exception, exc_to_str
 
 logger = logging.getLogger(__name__)
@@ -107,6 +107,13 @@ class AntaInventory(dict[str, AntaDevice]):
         logger.warning("Device '%s' does not support session authentication; session auth disabled for this device.", device_name)
         return False
 
+    @staticmethod
+    def _get_transport_profile(inventory_input: AntaInventoryInput, name: str | None) -> AntaTransportProfile | None:
+        """Return the transport profile of an inventory entry, None if the entry has no transport profile."""
+        if name is None or inventory_input.transport_profiles is None:
+            return None
+        return inventory_input.transport_profiles[name]
+
     @staticmethod
     def _parse_hosts(
         inventory_input: AntaInventoryInput,
@@ -134,6 +141,8 @@ class AntaInventory(dict[str, AntaDevice]):
 
         for host in inventory_input.hosts:
             updated_kwargs = AntaInventory._update_disable_cache(kwargs, inventory_disable_cache=host.disable_cache)
+            updated_kwargs["http2"] = host.http2 or kwargs.get("http2", False)
+            updated_kwargs["transport_profile"] = AntaInventory._get_transport_profile(inventory_input, host.transport_profile)
             device_name = host.name or f"{host.host}{f':{host.port}' if host.port else ''}"
             updated_kwargs["use_session_auth"] = AntaInventory._resolve_session_auth(
                 device_name,
@@ -183,6 +192,8 @@ class AntaInventory(dict[str, AntaDevice]):
         try:
             for network in inventory_input.networks:
                 updated_kwargs = AntaInventory._update_disable_cache(kwargs, inventory_disable_cache=network.disable_cache)
+                updated_kwargs["http2"] = network.http2 or kwargs.get("http2", False)
+                updated_kwargs["transport_profile"] = AntaInventory._get_transport_profile(inventory_input, network.transport_profile)
                 for host_ip in ip_network(str(network.network)):
                     updated_kwargs["use_session_auth"] = AntaInventory._resolve_session_auth(
                         str(host_ip),
@@ -230,6 +241,8 @@ class AntaInventory(dict[str, AntaDevice]):
         try:
             for range_def in inventory_input.ranges:
                 updated_kwargs = AntaInventory._update_disable_cache(kwargs, inventory_disable_cache=range_def.disable_cache)
+                updated_kwargs["http2"] = range_def.http2 or kwargs.get("http2", False)
+                updated_kwargs["transport_profile"] = AntaInventory._get_transport_profile(inventory_input, range_def.transport_profile)
                 range_increment = ip_address(str(range_def.start))
                 range_stop = ip_address(str(range_def.end))
                 while range_increment <= range_stop:  # type: ignore[operator]
@@ -254,7 +267,7 @@ class AntaInventory(dict[str, AntaDevice]):
             raise InventoryIncorrectSchemaError(message) from e
 
     @staticmethod
-    def parse(
+    def parse(  # noqa: PLR0913
         filename: str | Path,
         username: str,
         password: str,
@@ -266,6 +279,8 @@ class AntaInventory(dict[str, AntaDevice]):
         insecure: bool = False,
         disable_cache: bool = False,
         use_session_auth: bool | None = None,
+        batch_window: float | None = None,
+        http2: bool = False,
     ) -> AntaInventory:
         """Create an AntaInventory instance from an inventory file.
 
@@ -295,6 +310,10 @@ class AntaInventory(dict[str, AntaDevice]):
             Session authentication override. ``True`` forces session auth on for all devices,
             ``False`` (``--no-session-auth``) forces it off regardless of inventory settings,
             ``None`` (unset) defers to the per-device inventory value.
+        batch_window
+            Time in seconds during which concurrent commands are coalesced into a single eAPI request. None disables batching.
+        http2
+            Multiplex the eAPI requests to each device over a single HTTP/2 connection. If False, defers to the inventory value.
 
         Raises
         ------
@@ -317,6 +336,8 @@ class AntaInventory(dict[str, AntaDevice]):
             "timeout": timeout,
             "insecure": insecure,
             "disable_cache": disable_cache,
+            "batch_window": batch_window,
+            "http2": http2,
         }
 
         try:
@@ -399,24 +420,23 @@ class AntaInventory(dict[str, AntaDevice]):
     def _get_potential_connections(self) -> int | None:
         """Calculate the total potential concurrent connections for the current inventory.
 
-        This method sums the maximum concurrent connections allowed for each
-        AntaDevice in the inventory.
+        This method sums the potential connections of each AntaDevice in the inventory.
 
         Returns
         -------
         int | None
-            The total sum of the `max_connections` attribute for all AntaDevice objects
-            in the inventory. Returns None if any AntaDevice does not have a `max_connections`
+            The total sum of the `potential_connections` attribute for all AntaDevice objects
+            in the inventory. Returns None if any AntaDevice does not have a `potential_connections`
             attribute or if its value is None, as the total count cannot be determined.
         """
         potential_connections = 0
         all_have_connections = True
         for device in self.devices:
-            if device.max_connections is None:
+            if device.potential_connections is None:
                 all_have_connections = False
                 logger.debug("Device %s 'max_connections' is not available", device.name)
                 break
-            potential_connections += device.max_connections
+            potential_connections += device.potential_connections
         return None if not all_have_connections else potential_connections
 
     ###########################################################################
@@ -474,17 +494,25 @@ class AntaInventory(dict[str, AntaDevice]):
     def dump(self) -> AntaInventoryInput:
         """Dump the AntaInventory to an AntaInventoryInput.
 
-        Each hosts is dumped individually.
+        Each hosts is dumped individually. A transport profile without name is dumped with the name of its first device.
         """
-        hosts = [
-            AntaInventoryHost(
-                name=device.name,
-                host=device.host if not self.is_base_class(device) else device.name,
-                port=device.port if not self.is_base_class(device) else None,
-                tags=device.tags,
-                disable_cache=device.cache is None,
-                use_session_auth=device.use_session_auth if isinstance(device, AsyncEOSDevice) else False,
+        hosts = []
+        transport_profiles: dict[str, AntaTransportProfile] = {}
+        for device in self.devices:
+            transport_profile = None
+            if isinstance(device, AsyncEOSDevice) and (profile := device.transport_profile) is not None:
+                transport_profile = profile.name if profile.name is not None else device.name
+                transport_profiles.setdefault(transport_profile, profile.model_copy())
+            hosts.append(
+                AntaInventoryHost(
+                    name=device.name,
+                    host=device.host if not self.is_base_class(device) else device.name,
+                    port=device.port if not self.is_base_class(device) else None,
+                    tags=device.tags,
+                    disable_cache=device.cache is None,
+                    use_session_auth=device.use_session_auth if isinstance(device, AsyncEOSDevice) else False,
+                    http2=device.http2 if isinstance(device, AsyncEOSDevice) else False,
+                    transport_profile=transport_profile,
+                )
             )
-            for device in self.devices
-        ]
-        return AntaInventoryInput(hosts=hosts)
+        return AntaInventoryInput(transport_profiles=transport_profiles or None, hosts=hosts)
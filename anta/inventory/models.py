@@ -7,12 +7,29 @@ from __future__ import annotations
 
 import logging
 import math
+from typing import TYPE_CHECKING
 
 import yaml
-from pydantic import BaseModel, ConfigDict, FieldSerializationInfo, IPvAnyAddress, IPvAnyNetwork, field_serializer
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    FieldSerializationInfo,
+    IPvAnyAddress,
+    IPvAnyNetwork,
+    NonNegativeFloat,
+    NonNegativeInt,
+    PositiveFloat,
+    PositiveInt,
+    field_serializer,
+    model_validator,
+)
 
 from anta.custom_types import Hostname, Port
 
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,6 +45,50 @@ class AntaInventoryBaseModel(BaseModel):
         return sorted(tags)
 
 
+class AntaTransportProfile(BaseModel):
+    """Transport profile of AntaInventoryInput, tuning the HTTPX client of the devices referencing it.
+
+    The settings that are not set use the `ANTA_HTTPX_*` environment variables, then the HTTPX defaults.
+
+    Attributes
+    ----------
+    name : str | None
+        Name of the profile, set from its key in `AntaInventoryInput.transport_profiles`.
+    max_connections : PositiveInt | None
+        Maximum number of concurrent connections to a device.
+    max_keepalive_connections : NonNegativeInt | None
+        Maximum number of idle connections kept alive to a device.
+    keepalive_expiry : NonNegativeFloat | None
+        Time in seconds after which an idle connection is closed.
+    connect_timeout : PositiveFloat | None
+        Timeout in seconds to establish a connection. Defaults to the global timeout.
+    read_timeout : PositiveFloat | None
+        Timeout in seconds to receive a chunk of a response. Defaults to the global timeout.
+    write_timeout : PositiveFloat | None
+        Timeout in seconds to send a chunk of a request. Defaults to the global timeout.
+    pool_timeout : PositiveFloat | None
+        Timeout in seconds to acquire a connection from the pool. Defaults to the global timeout.
+    tcp_keepalive : bool | None
+        Enable TCP keepalive probes on the connections.
+    tcp_keepalive_idle : PositiveInt | None
+        Idle time in seconds before the first TCP keepalive probe, on the platforms supporting it.
+
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    name: str | None = Field(default=None, exclude=True)
+    max_connections: PositiveInt | None = None
+    max_keepalive_connections: NonNegativeInt | None = None
+    keepalive_expiry: NonNegativeFloat | None = None
+    connect_timeout: PositiveFloat | None = None
+    read_timeout: PositiveFloat | None = None
+    write_timeout: PositiveFloat | None = None
+    pool_timeout: PositiveFloat | None = None
+    tcp_keepalive: bool | None = None
+    tcp_keepalive_idle: PositiveInt | None = None
+
+
 class AntaInventoryHost(AntaInventoryBaseModel):
     """Host entry of AntaInventoryInput.
 
@@ -45,6 +106,10 @@ class AntaInventoryHost(AntaInventoryBaseModel):
         Disable cache for this device.
     use_session_auth : bool
         Use session based authentication for this device if supported.
+    http2 : bool
+        Multiplex the eAPI requests to this device over a single HTTP/2 connection.
+    transport_profile : str | None
+        Name of the transport profile of this device.
 
     """
 
@@ -54,6 +119,8 @@ class AntaInventoryHost(AntaInventoryBaseModel):
     tags: set[str] | None = None
     disable_cache: bool = False
     use_session_auth: bool = False
+    http2: bool = False
+    transport_profile: str | None = None
 
 
 class AntaInventoryNetwork(AntaInventoryBaseModel):
@@ -69,6 +136,10 @@ class AntaInventoryNetwork(AntaInventoryBaseModel):
         Disable cache for all devices in this network.
     use_session_auth : bool
         Use session based authentication for all devices if supported in this network.
+    http2 : bool
+        Multiplex the eAPI requests to all devices in this network over a single HTTP/2 connection per device.
+    transport_profile : str | None
+        Name of the transport profile of all devices in this network.
 
     """
 
@@ -76,6 +147,8 @@ class AntaInventoryNetwork(AntaInventoryBaseModel):
     tags: set[str] | None = None
     disable_cache: bool = False
     use_session_auth: bool = False
+    http2: bool = False
+    transport_profile: str | None = None
 
 
 class AntaInventoryRange(AntaInventoryBaseModel):
@@ -93,6 +166,10 @@ class AntaInventoryRange(AntaInventoryBaseModel):
         Disable cache for all devices in this IP range.
     use_session_auth : bool
         Use session based authentication for all devices if supported in this IP range.
+    http2 : bool
+        Multiplex the eAPI requests to all devices in this IP range over a single HTTP/2 connection per device.
+    transport_profile : str | None
+        Name of the transport profile of all devices in this IP range.
 
     """
 
@@ -101,6 +178,8 @@ class AntaInventoryRange(AntaInventoryBaseModel):
     tags: set[str] | None = None
     disable_cache: bool = False
     use_session_auth: bool = False
+    http2: bool = False
+    transport_profile: str | None = None
 
 
 class AntaInventoryInput(BaseModel):
@@ -108,10 +187,24 @@ class AntaInventoryInput(BaseModel):
 
     model_config = ConfigDict(extra="forbid")
 
+    transport_profiles: dict[str, AntaTransportProfile] | None = None
     networks: list[AntaInventoryNetwork] | None = None
     hosts: list[AntaInventoryHost] | None = None
     ranges: list[AntaInventoryRange] | None = None
 
+    @model_validator(mode="after")
+    def validate_transport_profiles(self) -> Self:
+        """Validate that the transport profiles referenced by the entries are defined and name the profiles."""
+        profiles = self.transport_profiles or {}
+        for name, profile in profiles.items():
+            profile.name = name
+        entries: list[AntaInventoryHost | AntaInventoryNetwork | AntaInventoryRange] = [*(self.hosts or []), *(self.networks or []), *(self.ranges or [])]
+        for entry in entries:
+            if entry.transport_profile is not None and entry.transport_profile not in profiles:
+                msg = f"Transport profile '{entry.transport_profile}' is not defined in 'transport_profiles'"
+                raise ValueError(msg)
+        return self
+
     def yaml(self) -> str:
         """Return a YAML representation string of this model.
 
@@ -11,20 +11,21 @@ import re
 from abc import ABC, abstractmethod
 from functools import wraps
 from string import Formatter
+from time import perf_counter
 from typing import TYPE_CHECKING, Any, ClassVar, Literal
 
-from pydantic import BaseModel, ConfigDict, ValidationError, create_model, field_serializer
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, create_model, field_serializer
 
+from anta._tracing import trace_span
 from anta.constants import EOS_BLACKLIST_CMDS, KNOWN_EOS_ERRORS, UNSUPPORTED_PLATFORM_ERRORS
 from anta.custom_types import Revision
 from anta.logger import anta_log_exception, exc_to_str
-from anta.result_manager.models import TestResult
+from anta.result_manager.models import CommandTiming, TestResult
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Coroutine
 
-    from rich.progress import Progress, TaskID
-
+    from anta._progress import AntaProgress
     from anta.device import AntaDevice
 
 # Proper way to type input class - revisit this later if we get any issue @gmuloc
@@ -164,6 +165,8 @@ class AntaCommand(BaseModel):
         Pydantic Model containing the variables values used to render the template.
     use_cache
         Enable or disable caching for this AntaCommand if the AntaDevice supports it.
+    timing
+        Timings of the collection of this command, populated by the AntaDevice. Excluded from the dumps.
 
     """
 
@@ -178,6 +181,7 @@ class AntaCommand(BaseModel):
     errors: list[str] = []
     params: AntaParamsBaseModel = AntaParamsBaseModel()
     use_cache: bool = True
+    timing: CommandTiming | None = Field(default=None, exclude=True, repr=False)
 
     @property
     def uid(self) -> str:
@@ -358,9 +362,8 @@ class AntaTest(ABC):
     # for a documentation perspective
     _atomic_support: ClassVar[bool] = False
 
-    # Class variables to handle the progress bar of ANTA CLI
-    progress: Progress | None = None
-    nrfu_task: TaskID | None = None
+    # Class variable to report the progress of the tests, e.g. to the progress bar of ANTA CLI
+    progress: AntaProgress | None = None
 
     # Instance attributes
     device: AntaDevice
@@ -402,6 +405,11 @@ class AntaTest(ABC):
             """
             return hash(self.model_dump_json())
 
+        @property
+        def uid(self) -> str:
+            """Generate a unique identifier for these inputs, telling apart the instances of a test with different inputs."""
+            return hashlib.sha256(self.model_dump_json().encode()).hexdigest()[:16]
+
         class ResultOverwrite(BaseModel):
             """Test inputs model to overwrite result fields.
 
@@ -457,12 +465,14 @@ class AntaTest(ABC):
             Populate outputs of the test commands instead of collecting from devices.
             This list must have the same length and order than the `instance_commands` instance attribute.
         """
+        start = perf_counter()
         self.logger = logging.getLogger(f"{self.module}.{self.__class__.__name__}")
         self.device = device
         self.instance_commands = []
         self.result = TestResult(name=device.name, test=self.name, categories=self.categories, description=self.description)
         self._init_inputs(inputs)
         if hasattr(self, "inputs"):
+            self.result.inputs_uid = self.inputs.uid
             self._init_commands(eos_data)
             if res_ow := self.inputs.result_overwrite:
                 if res_ow.categories:
@@ -471,6 +481,7 @@ class AntaTest(ABC):
                     self.result.description = res_ow.description
                 if res_ow.custom_field:
                     self.result.custom_field = res_ow.custom_field
+        self.result.timings.setup = perf_counter() - start
 
     def _init_inputs(self, inputs: dict[str, Any] | AntaTest.Input | None) -> None:
         """Instantiate the `inputs` instance attribute with an `AntaTest.Input` instance to validate test inputs using the model.
@@ -539,6 +550,28 @@ class AntaTest(ABC):
         for index, data in enumerate(eos_data or []):
             self.instance_commands[index].output = data
 
+    def reset(self) -> None:
+        """Reset the result and the command outputs of this test instance to run it again.
+
+        The validated inputs and the rendered commands are kept. The previous `TestResult` instance is left untouched,
+        e.g. in a `ResultManager`. Only instances initialized without error can be reset.
+        """
+        start = perf_counter()
+        previous = self.result
+        self.result = TestResult(
+            name=previous.name,
+            test=previous.test,
+            categories=list(previous.categories),
+            description=previous.description,
+            custom_field=previous.custom_field,
+            inputs_uid=previous.inputs_uid,
+        )
+        for command in self.instance_commands:
+            command.output = None
+            command.errors = []
+            command.timing = None
+        self.result.timings.setup = perf_counter() - start
+
     def __init_subclass__(cls) -> None:
         """Verify that the mandatory class attributes are defined and set name and description if not set."""
         mandatory_attributes = ["categories", "commands"]
@@ -596,10 +629,15 @@ class AntaTest(ABC):
         return state
 
     async def collect(self) -> None:
-        """Collect outputs of all commands of this test class from the device of this test instance."""
+        """Collect outputs of all commands of this test class from the device of this test instance.
+
+        Commands that already have an output or errors, e.g. populated from commands prefetched by the runner,
+        are not collected again.
+        """
         try:
             if self.blocked is False:
-                await self.device.collect_commands(self.instance_commands, collection_id=self.name)
+                commands = [command for command in self.instance_commands if command.output is None and not command.error]
+                await self.device.collect_commands(commands, collection_id=self.name)
         except Exception as e:  # noqa: BLE001
             # device._collect() is user-defined code.
             # We need to catch everything if we want the AntaTest object
@@ -641,37 +679,42 @@ class AntaTest(ABC):
             if self.result.result != "unset":
                 return self.result
 
-            # Data
-            if eos_data is not None:
-                self.save_commands_data(eos_data)
-                self.logger.debug("Test %s initialized with input data %s", self.name, eos_data)
-
-            # If some data is missing, try to collect
-            if not self.collected:
-                await self.collect()
-                if self.result.result != "unset":
-                    AntaTest.update_progress()
-                    return self.result
-
-                if self.failed_commands:
-                    self._handle_failed_commands()
-
-                    AntaTest.update_progress()
-                    return self.result
-
-            try:
-                function(self)
-            except Exception as e:  # noqa: BLE001
-                # test() is user-defined code.
-                # We need to catch everything if we want the AntaTest object
-                # to live until the reporting
-                message = f"Exception raised for test {self.name} (on device {self.device.name})"
-                anta_log_exception(e, message, self.logger)
-                self.result.is_error(message=exc_to_str(e))
-
-            # TODO: find a correct way to time test execution
-            AntaTest.update_progress()
-            return self.result
+            with trace_span(self.name, self.device.name):
+                # Data
+                if eos_data is not None:
+                    self.save_commands_data(eos_data)
+                    self.logger.debug("Test %s initialized with input data %s", self.name, eos_data)
+
+                # If some data is missing, try to collect
+                if not self.collected:
+                    start = perf_counter()
+                    await self.collect()
+                    self.result.timings.collection = perf_counter() - start
+                    self.result.timings.commands = {command.command: command.timing for command in self.instance_commands if command.timing is not None}
+                    if self.result.result != "unset":
+                        AntaTest.update_progress(self.device.name)
+                        return self.result
+
+                    if self.failed_commands:
+                        self._handle_failed_commands()
+
+                        AntaTest.update_progress(self.device.name)
+                        return self.result
+
+                start = perf_counter()
+                try:
+                    function(self)
+                except Exception as e:  # noqa: BLE001
+                    # test() is user-defined code.
+                    # We need to catch everything if we want the AntaTest object
+                    # to live until the reporting
+                    message = f"Exception raised for test {self.name} (on device {self.device.name})"
+                    anta_log_exception(e, message, self.logger)
+                    self.result.is_error(message=exc_to_str(e))
+                self.result.timings.evaluation = perf_counter() - start
+
+                AntaTest.update_progress(self.device.name)
+                return self.result
 
         return wrapper
 
@@ -696,10 +739,16 @@ class AntaTest(ABC):
         self.result.is_error(message="\n".join([f"{c.command} has failed: {', '.join(c.errors)}" for c in cmds]))
 
     @classmethod
-    def update_progress(cls: type[AntaTest]) -> None:
-        """Update progress bar for all AntaTest objects if it exists."""
-        if cls.progress and (cls.nrfu_task is not None):
-            cls.progress.update(cls.nrfu_task, advance=1)
+    def update_progress(cls: type[AntaTest], device: str | None = None) -> None:
+        """Count a completed test in the progress of the tests if it is enabled.
+
+        Parameters
+        ----------
+        device
+            Name of the device of the test.
+        """
+        if cls.progress is not None:
+            cls.progress.advance(device)
 
     @abstractmethod
     def test(self) -> Coroutine[Any, Any, TestResult]:
@@ -262,7 +262,7 @@ class ResultManager:
         results = self._results if status is None else list(chain.from_iterable(self.results_by_status.get(status, []) for status in status))
 
         if sort_by:
-            accepted_fields = TestResult.model_fields.keys()
+            accepted_fields = [name for name, field in TestResult.model_fields.items() if not field.exclude]
             if not set(sort_by).issubset(set(accepted_fields)):
                 msg = f"Invalid sort_by fields: {sort_by}. Accepted fields are: {list(accepted_fields)}"
                 raise ValueError(msg)
@@ -304,7 +304,7 @@ class ResultManager:
         sort_by
             List of TestResult fields to sort the results.
         """
-        accepted_fields = TestResult.model_fields.keys()
+        accepted_fields = [name for name, field in TestResult.model_fields.items() if not field.exclude]
         if not set(sort_by).issubset(set(accepted_fields)):
             msg = f"Invalid sort_by fields: {sort_by}. Accepted fields are: {list(accepted_fields)}"
             raise ValueError(msg)
@@ -138,6 +138,65 @@ class AtomicTestResult(BaseTestResult):
             self.parent.messages.append(f"{self.description} - {message}")
 
 
+@dataclass
+class CommandTiming:
+    """Timings of the collection of a command.
+
+    Attributes
+    ----------
+    cache_hit : bool | None
+        Whether the command output was retrieved from the device cache. None if the cache was not used.
+    wait : float
+        Time in seconds spent waiting for the device to accept the request.
+    network : float
+        Time in seconds spent in the device request.
+    """
+
+    cache_hit: bool | None = None
+    wait: float = 0.0
+    network: float = 0.0
+
+
+@dataclass
+class TestTimings:
+    """Timings of the phases of a test.
+
+    Attributes
+    ----------
+    setup : float
+        Time in seconds spent instantiating the test, validating the inputs and rendering the commands.
+    queued : float
+        Time in seconds spent waiting for the concurrency budget shared by the runs of `AntaRunner.run_many()`.
+    collection : float
+        Time in seconds spent collecting the commands.
+    evaluation : float
+        Time in seconds spent in the `test()` method.
+    commands : dict[str, CommandTiming]
+        Timings of the collected commands.
+    """
+
+    setup: float = 0.0
+    queued: float = 0.0
+    collection: float = 0.0
+    evaluation: float = 0.0
+    commands: dict[str, CommandTiming] = field(default_factory=dict)
+
+    @property
+    def duration(self) -> float:
+        """Time in seconds spent running the test, from its instantiation to the end of the evaluation."""
+        return self.setup + self.collection + self.evaluation
+
+    @property
+    def wait(self) -> float:
+        """Time in seconds spent waiting for the device to accept the requests of the commands."""
+        return sum(timing.wait for timing in self.commands.values())
+
+    @property
+    def network(self) -> float:
+        """Time in seconds spent in the device requests of the commands."""
+        return sum(timing.network for timing in self.commands.values())
+
+
 class TestResult(BaseTestResult):
     """Describe the result of a test from a single device.
 
@@ -160,6 +219,10 @@ class TestResult(BaseTestResult):
         These are used to generate a detailed breakdown in the final report, supplementing the global TestResult.
     custom_field : str | None
         Custom field to store a string for flexibility in integrating with ANTA.
+    inputs_uid : str | None
+        Unique identifier of the test inputs, telling apart the results of a test with different inputs.
+    timings : TestTimings
+        Timings of the phases of the test. Excluded from the dumps.
     """
 
     name: str
@@ -170,6 +233,8 @@ class TestResult(BaseTestResult):
     messages: list[str] = []
     atomic_results: list[AtomicTestResult] = []
     custom_field: str | None = None
+    inputs_uid: str | None = None
+    timings: TestTimings = Field(default_factory=TestTimings, exclude=True, repr=False)
 
     @override
     def __str__(self) -> str:
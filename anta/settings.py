@@ -5,12 +5,16 @@
 
 from __future__ import annotations
 
+import binascii
 import logging
 import os
 import sys
+from base64 import urlsafe_b64decode
 from functools import cache
+from pathlib import Path
+from typing import Literal
 
-from pydantic import Field, PositiveInt, PrivateAttr, ValidationError, model_validator
+from pydantic import Field, NonNegativeFloat, NonNegativeInt, PositiveFloat, PositiveInt, PrivateAttr, SecretStr, ValidationError, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from anta.logger import exc_to_str
@@ -23,9 +27,54 @@ DEFAULT_MAX_CONCURRENCY = 50000
 DEFAULT_NOFILE = 16384
 """Default value for the maximum number of open file descriptors for the ANTA process."""
 
+DEFAULT_PREFETCH = False
+"""Default value for prefetching the commands of the selected tests before running them."""
+
+DEFAULT_SHARDS = 1
+"""Default value for the number of processes running the tests of an ANTA run."""
+
+DEFAULT_ADAPTIVE_CONCURRENCY = False
+"""Default value for adapting the concurrent requests per device to the observed eAPI latency and timeouts."""
+
+DEFAULT_PIPELINED_CONNECT = False
+"""Default value for connecting to the devices concurrently with the test execution."""
+
+DEFAULT_CIRCUIT_BREAKER_THRESHOLD = None
+"""Default value for the number of consecutive transport failures opening the circuit breaker of a device, None disables it."""
+
+DEFAULT_CIRCUIT_BREAKER_COOLDOWN = None
+"""Default value for the time in seconds between two probe requests to a device with an open circuit breaker, None disables probing."""
+
+DEFAULT_RUN_DEADLINE = None
+"""Default value for the time in seconds after which the tests of an ANTA run are stopped, None disables it."""
+
+DEFAULT_TEST_TIMEOUT = None
+"""Default value for the time in seconds after which a test is cancelled, None disables it."""
+
+DEFAULT_EVENT_LOOP: Literal["asyncio", "uvloop"] = "asyncio"
+"""Default value for the event loop running the tests."""
+
+DEFAULT_EXECUTOR_WORKERS = None
+"""Default value for the number of threads of the default executor of the event loop, None keeps the asyncio default."""
+
+DEFAULT_SLOW_CALLBACK_DURATION = None
+"""Default value for the duration in seconds of the callbacks logged as slow in asyncio debug mode, None keeps the asyncio default."""
+
+DEFAULT_SCHEDULE: Literal["fair", "historical"] = "fair"
+"""Default value for the scheduling strategy of the tests."""
+
+DEFAULT_DURATIONS_FILE = Path("~/.cache/anta/durations.json")
+"""Default value for the file storing the test durations of the previous runs."""
+
 DEFAULT_HTTPX_TRUST_ENV = True
 """Default value for the trust_env parameter of the HTTPX client."""
 
+DEFAULT_JSON_CODEC: Literal["auto", "json", "orjson", "msgspec"] = "json"
+"""Default value for the JSON codec of the eAPI requests and responses."""
+
+DEFAULT_JSON_DECODE_OFFLOAD_THRESHOLD = None
+"""Default value for the size in bytes of the eAPI responses above which the responses are decoded off the event loop."""
+
 
 class AntaRunnerSettings(BaseSettings):
     """Environment variables for configuring the ANTA runner.
@@ -50,12 +99,102 @@ class AntaRunnerSettings(BaseSettings):
         Environment variable: ANTA_MAX_CONCURRENCY
 
         The maximum number of concurrent tests that can run in the event loop. Defaults to 50000.
+
+    prefetch : bool
+        Environment variable: ANTA_PREFETCH
+
+        Render the commands of all the selected tests and collect each unique command once per device
+        before running the tests. Defaults to False.
+
+    shards : PositiveInt
+        Environment variable: ANTA_SHARDS
+
+        The number of worker processes running the tests. When greater than 1, the selected inventory is split
+        across the processes, each with its own event loop and device connections. Defaults to 1.
+
+    adaptive_concurrency : bool
+        Environment variable: ANTA_ADAPTIVE_CONCURRENCY
+
+        Adapt the number of concurrent requests per device and for the whole run to the observed eAPI latency
+        and timeouts, increasing the limits additively and decreasing them multiplicatively. Defaults to False.
+
+    schedule : Literal["fair", "historical"]
+        Environment variable: ANTA_SCHEDULE
+
+        The scheduling strategy of the tests. `fair` dispatches the tests round-robin across devices.
+        `historical` dispatches the longest tests first based on the durations of the previous runs,
+        and records the durations of the run. Defaults to `fair`.
+
+    durations_file : Path
+        Environment variable: ANTA_DURATIONS_FILE
+
+        The file storing the test durations used by the `historical` schedule. Defaults to `~/.cache/anta/durations.json`.
+
+    pipelined_connect : bool
+        Environment variable: ANTA_PIPELINED_CONNECT
+
+        Connect to the devices concurrently with the test execution: the tests of a device are scheduled
+        as soon as the device is connected instead of waiting for the whole inventory. Defaults to False.
+
+    circuit_breaker_threshold : PositiveInt | None
+        Environment variable: ANTA_CIRCUIT_BREAKER_THRESHOLD
+
+        The number of consecutive transport failures, e.g. timeouts or connection errors, after which the requests
+        to a device fail fast instead of waiting for the timeout. Defaults to None, the circuit breaker is disabled.
+
+    circuit_breaker_cooldown : PositiveFloat | None
+        Environment variable: ANTA_CIRCUIT_BREAKER_COOLDOWN
+
+        The time in seconds between two probe requests to a device with an open circuit breaker. The circuit closes
+        when a probe request succeeds. Defaults to None, the device is not probed.
+
+    run_deadline : PositiveFloat | None
+        Environment variable: ANTA_RUN_DEADLINE
+
+        The time in seconds since the start of the run after which the running tests are cancelled and set to error,
+        and the tests not started yet are reported as not run with an unset status. Defaults to None, the run is not bounded.
+
+    test_timeout : PositiveFloat | None
+        Environment variable: ANTA_TEST_TIMEOUT
+
+        The time in seconds after which a running test is cancelled and set to error. Defaults to None, the tests are not bounded.
+
+    event_loop : Literal["asyncio", "uvloop"]
+        Environment variable: ANTA_EVENT_LOOP
+
+        The event loop running the tests. `uvloop` requires the uvloop package, the asyncio event loop is used
+        if it is not installed. Defaults to `asyncio`.
+
+    executor_workers : PositiveInt | None
+        Environment variable: ANTA_EXECUTOR_WORKERS
+
+        The number of threads of the default executor of the event loop, used by the asyncio event loop to resolve
+        the device hostnames. Defaults to None, the asyncio default is used.
+
+    slow_callback_duration : PositiveFloat | None
+        Environment variable: ANTA_SLOW_CALLBACK_DURATION
+
+        The duration in seconds of the callbacks logged as slow when the asyncio debug mode is enabled,
+        e.g. with `PYTHONASYNCIODEBUG=1`. Defaults to None, the asyncio default of 0.1 second is used.
     """
 
     model_config = SettingsConfigDict(env_prefix="ANTA_")
 
     nofile: PositiveInt = Field(default=DEFAULT_NOFILE)
     max_concurrency: PositiveInt = Field(default=DEFAULT_MAX_CONCURRENCY)
+    prefetch: bool = Field(default=DEFAULT_PREFETCH)
+    shards: PositiveInt = Field(default=DEFAULT_SHARDS)
+    adaptive_concurrency: bool = Field(default=DEFAULT_ADAPTIVE_CONCURRENCY)
+    schedule: Literal["fair", "historical"] = Field(default=DEFAULT_SCHEDULE)
+    durations_file: Path = Field(default=DEFAULT_DURATIONS_FILE)
+    pipelined_connect: bool = Field(default=DEFAULT_PIPELINED_CONNECT)
+    circuit_breaker_threshold: PositiveInt | None = Field(default=DEFAULT_CIRCUIT_BREAKER_THRESHOLD)
+    circuit_breaker_cooldown: PositiveFloat | None = Field(default=DEFAULT_CIRCUIT_BREAKER_COOLDOWN)
+    run_deadline: PositiveFloat | None = Field(default=DEFAULT_RUN_DEADLINE)
+    test_timeout: PositiveFloat | None = Field(default=DEFAULT_TEST_TIMEOUT)
+    event_loop: Literal["asyncio", "uvloop"] = Field(default=DEFAULT_EVENT_LOOP)
+    executor_workers: PositiveInt | None = Field(default=DEFAULT_EXECUTOR_WORKERS)
+    slow_callback_duration: PositiveFloat | None = Field(default=DEFAULT_SLOW_CALLBACK_DURATION)
 
     _file_descriptor_limit: PositiveInt = PrivateAttr()
 
@@ -98,17 +237,75 @@ class AntaHttpxSettings(BaseSettings):
 
     When initialized, relevant environment variables are loaded. If not set, default values are used.
 
+    The connection pool, timeout and TCP settings apply to the HTTPX client of all devices. The transport profiles
+    of the inventory override them per group of devices. If not set, the HTTPX defaults are used, the global
+    timeout for the timeouts.
+
     Attributes
     ----------
     trust_env : bool
         Environment variable: ANTA_HTTPX_TRUST_ENV
 
         Set to False to disable the use of environment variables by the HTTPX client. Defaults to True.
+
+    max_connections : PositiveInt | None
+        Environment variable: ANTA_HTTPX_MAX_CONNECTIONS
+
+        Maximum number of concurrent connections to a device.
+
+    max_keepalive_connections : NonNegativeInt | None
+        Environment variable: ANTA_HTTPX_MAX_KEEPALIVE_CONNECTIONS
+
+        Maximum number of idle connections kept alive to a device.
+
+    keepalive_expiry : NonNegativeFloat | None
+        Environment variable: ANTA_HTTPX_KEEPALIVE_EXPIRY
+
+        Time in seconds after which an idle connection is closed.
+
+    connect_timeout : PositiveFloat | None
+        Environment variable: ANTA_HTTPX_CONNECT_TIMEOUT
+
+        Timeout in seconds to establish a connection.
+
+    read_timeout : PositiveFloat | None
+        Environment variable: ANTA_HTTPX_READ_TIMEOUT
+
+        Timeout in seconds to receive a chunk of a response.
+
+    write_timeout : PositiveFloat | None
+        Environment variable: ANTA_HTTPX_WRITE_TIMEOUT
+
+        Timeout in seconds to send a chunk of a request.
+
+    pool_timeout : PositiveFloat | None
+        Environment variable: ANTA_HTTPX_POOL_TIMEOUT
+
+        Timeout in seconds to acquire a connection from the pool.
+
+    tcp_keepalive : bool | None
+        Environment variable: ANTA_HTTPX_TCP_KEEPALIVE
+
+        Enable TCP keepalive probes on the connections.
+
+    tcp_keepalive_idle : PositiveInt | None
+        Environment variable: ANTA_HTTPX_TCP_KEEPALIVE_IDLE
+
+        Idle time in seconds before the first TCP keepalive probe, on the platforms supporting it.
     """
 
     model_config = SettingsConfigDict(env_prefix="ANTA_HTTPX_")
 
     trust_env: bool = Field(default=DEFAULT_HTTPX_TRUST_ENV)
+    max_connections: PositiveInt | None = None
+    max_keepalive_connections: NonNegativeInt | None = None
+    keepalive_expiry: NonNegativeFloat | None = None
+    connect_timeout: PositiveFloat | None = None
+    read_timeout: PositiveFloat | None = None
+    write_timeout: PositiveFloat | None = None
+    pool_timeout: PositiveFloat | None = None
+    tcp_keepalive: bool | None = None
+    tcp_keepalive_idle: PositiveInt | None = None
 
 
 @cache
@@ -130,3 +327,115 @@ def get_httpx_settings() -> AntaHttpxSettings:
     except ValidationError as exc:
         msg = f"Failed to load ANTA HTTPX settings. Check ANTA_HTTPX_* environment variables: {exc_to_str(exc)}"
         raise ValueError(msg) from exc
+
+
+class AntaJsonSettings(BaseSettings):
+    """Environment variables for configuring the JSON codec of ANTA.
+
+    When initialized, relevant environment variables are loaded. If not set, default values are used.
+
+    Attributes
+    ----------
+    codec : Literal["auto", "json", "orjson", "msgspec"]
+        Environment variable: ANTA_JSON_CODEC
+
+        JSON codec encoding the eAPI requests and decoding the eAPI responses and the ANTA results.
+        `auto` opts in to the fastest codec installed. Defaults to `json`.
+
+    decode_offload_threshold : PositiveInt | None
+        Environment variable: ANTA_JSON_DECODE_OFFLOAD_THRESHOLD
+
+        Size in bytes of the eAPI responses above which the responses are decoded in a process pool
+        shared by the devices instead of the event loop. Disabled if not set.
+    """
+
+    model_config = SettingsConfigDict(env_prefix="ANTA_JSON_")
+
+    codec: Literal["auto", "json", "orjson", "msgspec"] = Field(default=DEFAULT_JSON_CODEC)
+    decode_offload_threshold: PositiveInt | None = Field(default=DEFAULT_JSON_DECODE_OFFLOAD_THRESHOLD)
+
+
+@cache
+def get_json_settings() -> AntaJsonSettings:
+    """Return the cached ANTA JSON settings loaded from environment variables.
+
+    Returns
+    -------
+    AntaJsonSettings
+        The JSON settings instance populated from `ANTA_JSON_*` environment variables.
+
+    Raises
+    ------
+    ValueError
+        If any `ANTA_JSON_*` environment variable has an invalid value.
+    """
+    try:
+        return AntaJsonSettings()
+    except ValidationError as exc:
+        msg = f"Failed to load ANTA JSON settings. Check ANTA_JSON_* environment variables: {exc_to_str(exc)}"
+        raise ValueError(msg) from exc
+
+
+class AntaSessionStoreSettings(BaseSettings):
+    """Environment variables for configuring the ANTA eAPI session store.
+
+    When initialized, relevant environment variables are loaded. If not set, default values are used.
+
+    The session store persists the eAPI session cookies of the devices using session-based authentication
+    across the runs, in a file encrypted with a Fernet key.
+
+    Attributes
+    ----------
+    path : Path | None
+        Environment variable: ANTA_SESSION_STORE_PATH
+
+        File storing the encrypted session cookies. The session store is disabled if not set.
+
+    key : SecretStr | None
+        Environment variable: ANTA_SESSION_STORE_KEY
+
+        URL-safe base64-encoded 32-byte Fernet key encrypting the file. Required if `path` is set.
+    """
+
+    model_config = SettingsConfigDict(env_prefix="ANTA_SESSION_STORE_", hide_input_in_errors=True)
+
+    path: Path | None = None
+    key: SecretStr | None = None
+
+    @model_validator(mode="after")
+    def validate_key(self) -> AntaSessionStoreSettings:
+        """Validate that a valid Fernet key is set when the session store is enabled."""
+        if self.path is None:
+            return self
+        if self.key is None:
+            msg = "ANTA_SESSION_STORE_KEY is required when ANTA_SESSION_STORE_PATH is set"
+            raise ValueError(msg)
+        try:
+            valid = len(urlsafe_b64decode(self.key.get_secret_value())) == 32  # noqa: PLR2004
+        except (binascii.Error, ValueError):
+            valid = False
+        if not valid:
+            msg = "ANTA_SESSION_STORE_KEY must be a URL-safe base64-encoded 32-byte key"
+            raise ValueError(msg)
+        return self
+
+
+@cache
+def get_session_store_settings() -> AntaSessionStoreSettings:
+    """Return the cached ANTA session store settings loaded from environment variables.
+
+    Returns
+    -------
+    AntaSessionStoreSettings
+        The session store settings instance populated from `ANTA_SESSION_STORE_*` environment variables.
+
+    Raises
+    ------
+    ValueError
+        If any `ANTA_SESSION_STORE_*` environment variable has an invalid value.
+    """
+    try:
+        return AntaSessionStoreSettings()
+    except ValidationError as exc:
+        msg = f"Failed to load ANTA session store settings. Check ANTA_SESSION_STORE_* environment variables: {exc_to_str(exc)}"
+        raise ValueError(msg) from exc
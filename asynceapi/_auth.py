@@ -26,22 +26,32 @@ def _cookie_fingerprint(cookie: str) -> str:
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator, Generator
 
+    from .session_store import EapiSessionStore
+
 
 class EapiSessionAuth(httpx.Auth):
     """httpx.Auth implementation for eAPI cookie-session authentication.
 
     Performs a single login on the first request and attaches the session cookie thereafter.
     A 401 on any request raises EapiAuthenticationError immediately.
+
+    With a session store, the first request reuses the stored cookie instead of logging in and the cookie
+    of a new login is stored. A 401 with the stored cookie logs in again and retries the request once.
     """
 
-    def __init__(self, host: str, username: str, password: str, login_url: str) -> None:
+    def __init__(self, host: str, port: str | int, username: str, password: str, login_url: str, session_store: EapiSessionStore | None = None) -> None:
         """Initialize EapiSessionAuth with credentials and connection details."""
         self._host = host
+        self._port = port
         self._username = username
         self._password = password
         self._login_url = login_url
-        self.session_cookie: str | None = None
+        self._session_store = session_store
+        self.session_cookie: str | None = session_store.get(host, port, username) if session_store is not None else None
+        self._stored_cookie = self.session_cookie
         self._lock = asyncio.Lock()
+        if self._stored_cookie is not None:
+            LOGGER.debug("Reusing stored session cookie for %s with fingerprint %s", host, _cookie_fingerprint(self._stored_cookie))
 
     @property
     def logged_in(self) -> bool:
@@ -54,7 +64,7 @@ class EapiSessionAuth(httpx.Auth):
     async def reset(self) -> None:
         """Invalidate the current session, waiting for any in-progress login to complete first."""
         async with self._lock:
-            self.session_cookie = None
+            self._forget_cookie()
 
     def sync_auth_flow(self, request: httpx.Request) -> Generator[httpx.Request, httpx.Response, None]:
         """Not supported — this auth class requires an async httpx client."""
@@ -72,25 +82,8 @@ class EapiSessionAuth(httpx.Auth):
             async with self._lock:
                 if not self.logged_in:
                     LOGGER.debug("Performing login for %s...", self._host)
-                    # Send login request
-                    login_request = httpx.Request("POST", self._login_url, json={"username": self._username, "password": self._password})
-                    login_response = yield login_request
-
-                    # Validate response
-                    if login_response.status_code == HTTPStatus.UNAUTHORIZED:
-                        await login_response.aread()
-                        raise EapiAuthenticationError(self._host, response_text=login_response.text.strip())
-                    login_response.raise_for_status()
-
-                    # Extract session cookie
-                    cookie = login_response.cookies.get("Session")
-                    if not cookie:
-                        msg = f"Login to {self._host!r} succeeded (HTTP {login_response.status_code}) but the response contained no Session cookie."
-                        raise RuntimeError(msg)  # device bug or misconfiguration
-
-                    # Update state
-                    self.session_cookie = cookie
-                    LOGGER.debug("Session authentication established for %s with cookie fingerprint %s", self._host, _cookie_fingerprint(cookie))
+                    login_response = yield self._login_request()
+                    await self._handle_login_response(login_response)
                 elif self.session_cookie:
                     LOGGER.debug(
                         "Attempted to login for %s but another coroutine already established session authentication with cookie fingerprint %s",
@@ -103,8 +96,50 @@ class EapiSessionAuth(httpx.Auth):
         request.headers["Cookie"] = f"Session={used_cookie}"
         response = yield request
 
+        if response.status_code == HTTPStatus.UNAUTHORIZED and used_cookie is not None and used_cookie == self._stored_cookie:
+            # The stored cookie of a previous run expired, login again and retry the request once
+            await response.aread()
+            LOGGER.debug("Stored session cookie for %s expired, performing login...", self._host)
+            async with self._lock:
+                if self.session_cookie == used_cookie:
+                    self._forget_cookie()
+                    login_response = yield self._login_request()
+                    await self._handle_login_response(login_response)
+            used_cookie = self.session_cookie
+            request.headers["Cookie"] = f"Session={used_cookie}"
+            response = yield request
+
         if response.status_code == HTTPStatus.UNAUTHORIZED:
             await response.aread()
             if self.session_cookie == used_cookie:
-                self.session_cookie = None
+                self._forget_cookie()
             raise EapiAuthenticationError(self._host, response_text=response.text.strip(), session_expired=True)
+
+    def _login_request(self) -> httpx.Request:
+        """Return the login request of the session."""
+        return httpx.Request("POST", self._login_url, json={"username": self._username, "password": self._password})
+
+    async def _handle_login_response(self, login_response: httpx.Response) -> None:
+        """Validate the login response and store its session cookie."""
+        if login_response.status_code == HTTPStatus.UNAUTHORIZED:
+            await login_response.aread()
+            raise EapiAuthenticationError(self._host, response_text=login_response.text.strip())
+        login_response.raise_for_status()
+
+        # Extract session cookie
+        cookie = login_response.cookies.get("Session")
+        if not cookie:
+            msg = f"Login to {self._host!r} succeeded (HTTP {login_response.status_code}) but the response contained no Session cookie."
+            raise RuntimeError(msg)  # device bug or misconfiguration
+
+        # Update state
+        self.session_cookie = cookie
+        if self._session_store is not None:
+            self._session_store.set(self._host, self._port, self._username, cookie)
+        LOGGER.debug("Session authentication established for %s with cookie fingerprint %s", self._host, _cookie_fingerprint(cookie))
+
+    def _forget_cookie(self) -> None:
+        """Forget the session cookie, also in the session store."""
+        self.session_cookie = None
+        if self._session_store is not None:
+            self._session_store.delete(self._host, self._port, self._username)
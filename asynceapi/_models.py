@@ -256,6 +256,8 @@ class EAPIClientConnectionOptions:
         Global timeout in seconds for outgoing eAPI calls. None means no timeout.
     use_session_auth: bool
         Use eAPI cookie-session authentication.
+    http2: bool
+        Multiplex the eAPI requests over a single HTTP/2 connection.
     """
 
     host: str
@@ -265,3 +267,4 @@ class EAPIClientConnectionOptions:
     proto: Literal["http", "https"] = "https"
     timeout: float | None = None
     use_session_auth: bool = False
+    http2: bool = False
@@ -0,0 +1,115 @@
+# Copyright (c) 2024-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""JSON codecs encoding the eAPI requests and decoding the eAPI responses."""
+
+from __future__ import annotations
+
+import json
+from functools import cache
+from importlib import import_module
+from importlib.util import find_spec
+from logging import getLogger
+from typing import Any, ClassVar
+
+LOGGER = getLogger(__name__)
+__all__ = ["CODECS", "JsonCodec", "MsgspecCodec", "OrjsonCodec", "get_codec"]
+
+
+class JsonCodec:
+    """JSON codec based on the `json` module of the standard library.
+
+    Subclasses implement faster backends with third-party packages, imported when the codec is created.
+    The codecs can be pickled to decode the documents in a process pool.
+    """
+
+    name: ClassVar[str] = "json"
+    """Name of the codec."""
+    package: ClassVar[str | None] = None
+    """Package required by the codec. None if the codec only uses the standard library."""
+
+    def dumps(self, obj: Any) -> bytes:  # noqa: ANN401
+        """Encode an object to compact UTF-8 JSON."""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+    def loads(self, data: bytes | str) -> Any:  # noqa: ANN401
+        """Decode a JSON document."""
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """JSON codec based on the `orjson` package."""
+
+    name = "orjson"
+    package = "orjson"
+
+    def __init__(self) -> None:
+        orjson = import_module("orjson")
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+
+    def dumps(self, obj: Any) -> bytes:  # noqa: ANN401
+        """Encode an object to compact UTF-8 JSON."""
+        return self._dumps(obj)
+
+    def loads(self, data: bytes | str) -> Any:  # noqa: ANN401
+        """Decode a JSON document."""
+        return self._loads(data)
+
+
+class MsgspecCodec(JsonCodec):
+    """JSON codec based on the `msgspec` package."""
+
+    name = "msgspec"
+    package = "msgspec"
+
+    def __init__(self) -> None:
+        msgspec_json = import_module("msgspec.json")
+        self._encode = msgspec_json.encode
+        self._decode = msgspec_json.decode
+
+    def dumps(self, obj: Any) -> bytes:  # noqa: ANN401
+        """Encode an object to compact UTF-8 JSON."""
+        return self._encode(obj)
+
+    def loads(self, data: bytes | str) -> Any:  # noqa: ANN401
+        """Decode a JSON document."""
+        return self._decode(data)
+
+
+CODECS: dict[str, type[JsonCodec]] = {codec.name: codec for codec in (OrjsonCodec, MsgspecCodec, JsonCodec)}
+"""Available codecs by name, in order of preference for the `auto` codec."""
+
+
+@cache
+def get_codec(name: str = "json") -> JsonCodec:
+    """Return the JSON codec with the given name.
+
+    The `auto` codec is the first codec of `CODECS` with its package installed, it must be requested explicitly
+    since the codecs can differ on edge cases, e.g. large integers. If the package of the requested codec is not
+    installed, the `json` codec of the standard library is returned.
+
+    Parameters
+    ----------
+    name
+        Name of the codec: `auto`, `json`, `orjson` or `msgspec`. Defaults to `json`.
+
+    Returns
+    -------
+    JsonCodec
+        The codec instance, shared by the callers requesting the same name.
+
+    Raises
+    ------
+    ValueError
+        If the codec name is unknown.
+    """
+    if name == "auto":
+        return next(codec() for codec in CODECS.values() if codec.package is None or find_spec(codec.package) is not None)
+    if (codec := CODECS.get(name)) is None:
+        msg = f"Unknown JSON codec '{name}', valid codecs are: auto, {', '.join(CODECS)}"
+        raise ValueError(msg)
+    if codec.package is not None and find_spec(codec.package) is None:
+        LOGGER.warning("The %s package is not installed, using the json codec. Install it with `pip install %s`.", codec.package, codec.package)
+        return JsonCodec()
+    return codec()
@@ -9,9 +9,13 @@
 
 from __future__ import annotations
 
+import asyncio
+from contextlib import nullcontext
+from importlib.util import find_spec
 from logging import getLogger
 from socket import getservbyname
-from typing import TYPE_CHECKING, Any, Literal, overload
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, overload
 
 # -----------------------------------------------------------------------------
 # Public Imports
@@ -26,13 +30,18 @@ from ._auth import EapiSessionAuth
 # -----------------------------------------------------------------------------
 from ._constants import EapiCommandFormat
 from .aio_portcheck import port_check_url
+from .codec import JsonCodec, get_codec
 from .config_session import SessionConfig
 from .errors import EapiCommandError
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from concurrent.futures import Executor
+    from contextlib import AbstractContextManager
     from types import TracebackType
 
     from ._types import EapiComplexCommand, EapiJsonOutput, EapiSimpleCommand, EapiTextOutput, JsonRpc
+    from .session_store import EapiSessionStore
 
 # -----------------------------------------------------------------------------
 # Exports
@@ -41,6 +50,9 @@ if TYPE_CHECKING:
 LOGGER = getLogger(__name__)
 __all__ = ["Device"]
 
+DEFAULT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+"""Default connection pool limits of the HTTPX clients."""
+
 
 # -----------------------------------------------------------------------------
 #
@@ -62,7 +74,10 @@ class Device(httpx.AsyncClient):
     EAPI_LOGIN_URL = "/login"
     EAPI_LOGOUT_URL = "/logout"
 
-    def __init__(
+    trace_span: ClassVar[Callable[..., AbstractContextManager[Any]] | None] = None
+    """Factory of context managers recording a span of each JSON-RPC request, called with the span name and arguments. None disables tracing."""
+
+    def __init__(  # noqa: PLR0913
         self,
         host: str | None = None,
         username: str | None = None,
@@ -71,6 +86,12 @@ class Device(httpx.AsyncClient):
         port: str | int | None = None,
         *,
         use_session_auth: bool = False,
+        http2: bool = False,
+        codec: JsonCodec | None = None,
+        decode_offload_threshold: int | None = None,
+        decode_executor: Executor | None = None,
+        socket_options: list[tuple[int, int, int]] | None = None,
+        session_store: EapiSessionStore | None = None,
         **kwargs: Any,  # noqa: ANN401
     ) -> None:
         """Initialize the Device class.
@@ -95,6 +116,27 @@ class Device(httpx.AsyncClient):
         use_session_auth
             When True, authenticate via eAPI cookie session (POST /login) instead
             of HTTP Basic Auth on every request. Requires ``username``, ``password``, and ``host``.
+        http2
+            When True, multiplex the concurrent requests over a single HTTP/2 connection instead of
+            opening a connection per concurrent request. HTTP/2 is negotiated with TLS ALPN, the client
+            falls back to HTTP/1.1 if the device does not support it, if ``proto`` is http or if the
+            ``h2`` package is not installed.
+        codec
+            JSON codec encoding the requests and decoding the responses. Defaults to the `json` codec
+            of the standard library, see `asynceapi.codec.get_codec()`.
+        decode_offload_threshold
+            Size in bytes of the responses above which the responses are decoded in ``decode_executor``
+            instead of the event loop. None decodes all the responses in the event loop.
+        decode_executor
+            Executor decoding the responses larger than ``decode_offload_threshold``. The JSON codecs hold
+            the GIL while decoding, a ``ProcessPoolExecutor`` is required to stop blocking the event loop
+            unless Python is free-threaded. Defaults to the default executor of the event loop.
+        socket_options
+            Options of the sockets connecting to the device as ``(level, option, value)`` tuples,
+            e.g. ``(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)``.
+        session_store
+            Store persisting the session cookie across the clients when ``use_session_auth`` is True.
+            The stored cookie is reused instead of logging in, and the client does not log out when closed.
         kwargs
             Other named keyword arguments, some of them are being used in the function
             cf Other Parameters section below, others are just passed as is to the httpx.AsyncClient.
@@ -113,8 +155,30 @@ class Device(httpx.AsyncClient):
         self.host = host
         self._use_session_auth = use_session_auth
         self._session_auth: EapiSessionAuth | None = None
+        self._session_store = session_store if use_session_auth else None
+        if http2 and find_spec("h2") is None:
+            LOGGER.warning("Device %s: the h2 package is not installed, using HTTP/1.1. Install it with `pip install httpx[http2]`.", self.host)
+            http2 = False
+        self.http2 = http2
+        kwargs["http2"] = http2
+        self.codec = codec if codec is not None else get_codec()
+        self.decode_offload_threshold = decode_offload_threshold
+        self.decode_executor = decode_executor
+        self.decode_stats: dict[str, float] = {"inline": 0, "offloaded": 0, "inline_time": 0.0, "max_inline_time": 0.0}
         kwargs.setdefault("base_url", httpx.URL(f"{proto}://{self.host}:{self.port}"))
         kwargs.setdefault("verify", False)
+        if socket_options is not None:
+            # The socket options are only supported by the HTTPX transports
+            kwargs.setdefault(
+                "transport",
+                httpx.AsyncHTTPTransport(
+                    verify=kwargs["verify"],
+                    http2=http2,
+                    limits=kwargs.get("limits", DEFAULT_LIMITS),
+                    trust_env=kwargs.get("trust_env", True),
+                    socket_options=socket_options,
+                ),
+            )
         if self._use_session_auth:
             if not (username and password):
                 msg = "username and password are required for session authentication"
@@ -123,7 +187,9 @@ class Device(httpx.AsyncClient):
                 msg = "host is required for session authentication"
                 raise ValueError(msg)
             login_url = f"{proto}://{self.host}:{self.port}{self.EAPI_LOGIN_URL}"
-            self._session_auth = EapiSessionAuth(host=self.host, username=username, password=password, login_url=login_url)
+            self._session_auth = EapiSessionAuth(
+                host=self.host, port=self.port, username=username, password=password, login_url=login_url, session_store=session_store
+            )
             kwargs.setdefault("auth", self._session_auth)
             LOGGER.debug("Device %s: eAPI session-based authentication enabled", self.host)
         else:
@@ -163,6 +229,8 @@ class Device(httpx.AsyncClient):
         """
         response = await self.head(self.EAPI_COMMAND_API_URL, timeout=5)
         response.raise_for_status()
+        if self.http2:
+            LOGGER.debug("Device %s: eAPI endpoint reached using %s", self.host, response.http_version)
         return True
 
     # Single command, JSON output, no suppression
@@ -459,9 +527,11 @@ class Device(httpx.AsyncClient):
             The list of command results; either dict or text depending on the
             JSON-RPC format parameter.
         """
-        res = await self.post(self.EAPI_COMMAND_API_URL, json=jsonrpc)
-        res.raise_for_status()
-        body = res.json()
+        trace_span = Device.trace_span
+        with trace_span("jsonrpc_exec", host=self.host, commands=len(jsonrpc["params"]["cmds"])) if trace_span is not None else nullcontext():
+            res = await self.post(self.EAPI_COMMAND_API_URL, content=self.codec.dumps(jsonrpc))
+            res.raise_for_status()
+            body = await self._decode(res.content)
 
         commands = jsonrpc["params"]["cmds"]
         ofmt = jsonrpc["params"].get("format", EapiCommandFormat.JSON)
@@ -503,6 +573,33 @@ class Device(httpx.AsyncClient):
             not_exec=commands[err_at + 1 :],
         )
 
+    async def _decode(self, content: bytes) -> Any:  # noqa: ANN401
+        """Decode a JSON-RPC response with the codec of the device.
+
+        Responses larger than `decode_offload_threshold` are decoded in `decode_executor` so that
+        the event loop keeps serving the other requests, the smaller ones are decoded in the event loop.
+        """
+        if self.decode_offload_threshold is not None and len(content) > self.decode_offload_threshold:
+            self.decode_stats["offloaded"] += 1
+            return await asyncio.get_running_loop().run_in_executor(self.decode_executor, self.codec.loads, content)
+        start = perf_counter()
+        body = self.codec.loads(content)
+        duration = perf_counter() - start
+        stats = self.decode_stats
+        stats["inline"] += 1
+        stats["inline_time"] += duration
+        stats["max_inline_time"] = max(stats["max_inline_time"], duration)
+        return body
+
+    async def _close_session(self) -> None:
+        """Log out of the device session, or save it to the session store to reuse it later."""
+        if not self._use_session_auth:
+            return
+        if self._session_store is not None:
+            await self._session_store.asave()
+            return
+        await self.logout()
+
     async def logout(self) -> None:
         """Log out of the device session and reset local state. No-op if not logged in."""
         if self._session_auth is None or not self._session_auth.logged_in:
@@ -518,9 +615,8 @@ class Device(httpx.AsyncClient):
             LOGGER.debug("Session authentication cleared for %s", self.host)
 
     async def aclose(self) -> None:
-        """Log out and close the underlying HTTPX transport."""
-        if self._use_session_auth:
-            await self.logout()
+        """Log out and close the underlying HTTPX transport. With a session store, save the session instead of logging out."""
+        await self._close_session()
         await super().aclose()
 
     async def __aexit__(
@@ -529,9 +625,8 @@ class Device(httpx.AsyncClient):
         exc_value: BaseException | None = None,
         traceback: TracebackType | None = None,
     ) -> None:
-        """Log out and close on context-manager exit."""
-        if self._use_session_auth:
-            await self.logout()
+        """Log out and close on context-manager exit. With a session store, save the session instead of logging out."""
+        await self._close_session()
         await super().__aexit__(exc_type, exc_value, traceback)
 
     def config_session(self, name: str) -> SessionConfig:
@@ -0,0 +1,143 @@
+# Copyright (c) 2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""asynceapi encrypted on-disk store of the eAPI session cookies."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+from pathlib import Path
+from threading import Lock
+
+from cryptography.fernet import Fernet, InvalidToken
+
+LOGGER = logging.getLogger(__name__)
+__all__ = ["EapiSessionStore"]
+
+
+class EapiSessionStore:
+    """Store the eAPI session cookies in a file encrypted with a Fernet key, keyed by host, port and username.
+
+    The cookies are loaded from the file on the first access and kept in memory. `save()` writes the file
+    if a cookie changed since the last save, merging the changes into the cookies saved in the meantime by other
+    stores of the same file, e.g. other processes. A file that cannot be decrypted, e.g. after a key rotation, is ignored.
+
+    Examples
+    --------
+    ```python
+    key = Fernet.generate_key()
+    store = EapiSessionStore("~/.cache/anta/sessions", key)
+    device = Device(host="leaf1", username="admin", password="admin", use_session_auth=True, session_store=store)
+    ```
+    """
+
+    def __init__(self, path: str | Path, key: str | bytes) -> None:
+        """Initialize an EapiSessionStore.
+
+        Parameters
+        ----------
+        path
+            File storing the encrypted cookies.
+        key
+            URL-safe base64-encoded 32-byte Fernet key encrypting the file.
+
+        Raises
+        ------
+        ValueError
+            If the key is not a valid Fernet key.
+        """
+        self.path = Path(path).expanduser()
+        self._fernet = Fernet(key)
+        self._cookies: dict[str, str] | None = None
+        # Cookies set or deleted (None) since the last save
+        self._changes: dict[str, str | None] = {}
+        self._lock = Lock()
+        self._save_lock = Lock()
+
+    def __repr__(self) -> str:
+        """Return a printable representation of the session store, without the key."""
+        return f"EapiSessionStore(path={str(self.path)!r})"
+
+    @staticmethod
+    def _key(host: str, port: str | int, username: str) -> str:
+        """Return the key of the session cookie of a user on a host and port."""
+        return f"{username}@{host}:{port}"
+
+    @property
+    def cookies(self) -> dict[str, str]:
+        """Session cookies by `username@host:port`, loaded from the file on the first access."""
+        if self._cookies is None:
+            self._cookies = self._load()
+        return self._cookies
+
+    def _load(self) -> dict[str, str]:
+        """Load and decrypt the cookies of the file, no cookies if the file does not exist or cannot be decrypted."""
+        try:
+            cookies = json.loads(self._fernet.decrypt(self.path.read_bytes()))
+        except FileNotFoundError:
+            return {}
+        except (OSError, InvalidToken, ValueError) as exc:
+            LOGGER.warning("Ignoring the eAPI session store %s, it cannot be read or decrypted: %s", self.path, type(exc).__name__)
+            return {}
+        LOGGER.debug("Loaded %d eAPI session cookie(s) from %s", len(cookies), self.path)
+        return cookies
+
+    def get(self, host: str, port: str | int, username: str) -> str | None:
+        """Return the stored session cookie of a user on a host and port, None if there is none."""
+        return self.cookies.get(self._key(host, port, username))
+
+    def set(self, host: str, port: str | int, username: str, cookie: str) -> None:
+        """Store the session cookie of a user on a host and port."""
+        key = self._key(host, port, username)
+        with self._lock:
+            if self.cookies.get(key) != cookie:
+                self.cookies[key] = cookie
+                self._changes[key] = cookie
+
+    def delete(self, host: str, port: str | int, username: str) -> None:
+        """Remove the session cookie of a user on a host and port."""
+        key = self._key(host, port, username)
+        with self._lock:
+            if self.cookies.pop(key, None) is not None:
+                self._changes[key] = None
+
+    def save(self) -> None:
+        """Encrypt and write the cookies to the file if they changed since the last save.
+
+        The changes are merged into the cookies of the file so that the cookies saved by other stores of the same file
+        are kept. The file is replaced atomically and is only readable by its owner. A write error is logged, the cookies
+        are saved again on the next call.
+        """
+        with self._save_lock:
+            with self._lock:
+                changes, self._changes = self._changes, {}
+            if not changes:
+                return
+            cookies = self._load()
+            for key, cookie in changes.items():
+                if cookie is None:
+                    cookies.pop(key, None)
+                else:
+                    cookies[key] = cookie
+            token = self._fernet.encrypt(json.dumps(cookies).encode())
+            tmp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                with os.fdopen(fd, "wb") as file:
+                    file.write(token)
+                tmp_path.replace(self.path)
+            except OSError as exc:
+                LOGGER.warning("Could not save the eAPI session store %s: %s", self.path, exc)
+                with self._lock:
+                    self._changes = changes | self._changes
+                return
+        LOGGER.debug("Saved %d eAPI session cookie(s) to %s", len(cookies), self.path)
+
+    async def asave(self) -> None:
+        """Save the cookies like `save()` in a worker thread, without blocking the event loop on the encryption and the file I/O."""
+        if self._changes:
+            await asyncio.to_thread(self.save)
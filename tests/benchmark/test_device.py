@@ -0,0 +1,98 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Benchmark tests for the eAPI transport of anta.device.AsyncEOSDevice."""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING
+
+import httpx
+import pytest
+
+from anta.device import AsyncEOSDevice
+from anta.models import AntaCommand
+from anta.tests.interfaces import VerifyInterfacesCounterDetails
+from asynceapi import Device
+from asynceapi.codec import CODECS, get_codec
+from tests.units.anta_tests.test_interfaces import DATA
+
+from .utils import EapiServer, create_certificate
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_codspeed import BenchmarkFixture
+
+CONCURRENT_COMMANDS = 50
+INTERFACES_COUNT = 4096
+
+
+@pytest.fixture(name="certificate", scope="module")
+def _certificate_fixture(tmp_path_factory: pytest.TempPathFactory) -> tuple[Path, Path]:
+    """Return the certificate and key files of the local eAPI server."""
+    return create_certificate(tmp_path_factory.mktemp("eapi"))
+
+
+@pytest.mark.parametrize("http2", [False, True], ids=["http1.1", "http2"])
+def test_collect_commands(benchmark: BenchmarkFixture, certificate: tuple[Path, Path], *, http2: bool) -> None:
+    """Benchmark the collection of concurrent commands over HTTP/1.1 and HTTP/2, comparing the connections opened to the device."""
+    pytest.importorskip("h2")
+
+    async def collect() -> int:
+        async with EapiServer(*certificate) as server:
+            device = AsyncEOSDevice(host="127.0.0.1", port=server.port, username="admin", password="admin", disable_cache=True, http2=http2)  # noqa: S106
+            commands = [AntaCommand(command="show version") for _ in range(CONCURRENT_COMMANDS)]
+            await device.collect_commands(commands, collection_id="benchmark")
+            await device.disconnect()
+        assert all(command.collected for command in commands)
+        return server.connections
+
+    connections = benchmark(lambda: asyncio.run(collect()))
+
+    if http2:
+        assert connections == 1
+    else:
+        # Each concurrent request opens its own connection
+        assert connections > 1
+
+
+@pytest.fixture(name="large_response", scope="module")
+def _large_response_fixture() -> bytes:
+    """Return a JSON-RPC response of a large `show interfaces` output, scaled from a recorded output of the unit tests."""
+    recorded = DATA[(VerifyInterfacesCounterDetails, "success")]["eos_data"][0]["interfaces"]
+    interfaces = list(recorded.values())
+    output = {"interfaces": {f"Ethernet{i}": {**interfaces[i % len(interfaces)], "name": f"Ethernet{i}"} for i in range(1, INTERFACES_COUNT + 1)}}
+    return CODECS["json"]().dumps({"jsonrpc": "2.0", "id": "benchmark", "result": [output]})
+
+
+@pytest.mark.parametrize("codec", list(CODECS))
+def test_decode_response(benchmark: BenchmarkFixture, large_response: bytes, codec: str) -> None:
+    """Benchmark the decoding of a large eAPI response with each JSON codec."""
+    if (package := CODECS[codec].package) is not None:
+        pytest.importorskip(package)
+    json_codec = get_codec(codec)
+
+    body = benchmark(json_codec.loads, large_response)
+
+    assert len(body["result"][0]["interfaces"]) == INTERFACES_COUNT
+
+
+@pytest.mark.parametrize("offload", [False, True], ids=["inline", "process"])
+def test_jsonrpc_exec_large_response(benchmark: BenchmarkFixture, large_response: bytes, *, offload: bool) -> None:
+    """Benchmark a large eAPI response decoded in the event loop or in a process pool."""
+
+    async def jsonrpc_exec(executor: ProcessPoolExecutor) -> Device:
+        transport = httpx.MockTransport(lambda _: httpx.Response(200, content=large_response))
+        async with Device(host="127.0.0.1", transport=transport, decode_offload_threshold=1 if offload else None, decode_executor=executor) as device:
+            await device.cli(command="show interfaces")
+        return device
+
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        # Start the worker process outside of the benchmark
+        executor.submit(int).result()
+        device = benchmark(lambda: asyncio.run(jsonrpc_exec(executor)))
+
+    assert device.decode_stats["offloaded" if offload else "inline"] == 1
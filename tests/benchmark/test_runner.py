@@ -5,13 +5,21 @@
 
 from __future__ import annotations
 
+import logging
 from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
 
 import pytest
+import respx
 
+from anta._loop import run
 from anta._runner import AntaRunContext, AntaRunFilters, AntaRunner
 from anta.result_manager import ResultManager
+from anta.result_manager.models import AntaTestStatus
 from anta.runner import get_coroutines, prepare_tests
+from anta.settings import AntaRunnerSettings
+
+from .utils import collect, collect_commands
 
 if TYPE_CHECKING:
     from collections import defaultdict
@@ -96,3 +104,27 @@ def test__get_test_coroutines(benchmark: BenchmarkFixture, catalog: AntaCatalog,
     coroutines = benchmark(bench)
 
     assert ctx.total_tests_scheduled == len(coroutines)
+
+
+@patch("anta.models.AntaTest.collect", collect)
+@patch("anta.device.AntaDevice.collect_commands", collect_commands)
+@respx.mock  # Mock eAPI responses
+@pytest.mark.parametrize("event_loop", ["asyncio", "uvloop"])
+def test_run_event_loop(benchmark: BenchmarkFixture, event_loop: str, catalog: AntaCatalog, inventory: AntaInventory) -> None:
+    """Benchmark `anta._runner.AntaRunner.run` with each event loop of the `event_loop` setting."""
+    if event_loop == "uvloop":
+        pytest.importorskip("uvloop")
+    runner = AntaRunner(settings=AntaRunnerSettings(event_loop=event_loop))
+    # Disable logging during ANTA execution to avoid having these function time in benchmarks
+    logging.disable()
+
+    def bench() -> AntaRunContext:
+        catalog.clear_indexes()
+        return run(runner.run(inventory, catalog), runner.settings)
+
+    ctx = benchmark(bench)
+
+    logging.disable(logging.NOTSET)
+
+    assert len(ctx.manager) == len(inventory) * len(catalog.tests)
+    assert ctx.manager.get_total_results({AntaTestStatus.ERROR}) == 0
@@ -10,17 +10,30 @@ import copy
 import importlib
 import json
 import pkgutil
+import ssl
+from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING, Any
 
+import h2.config
+import h2.connection
+import h2.events
+import h11
 import httpx
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
 
 from anta.catalog import AntaCatalog, AntaTestDefinition
 from anta.models import AntaCommand, AntaTest
 
 if TYPE_CHECKING:
     from collections.abc import Generator
+    from pathlib import Path
     from types import ModuleType
 
+    from typing_extensions import Self
+
     from anta.device import AntaDevice
 
 
@@ -171,3 +184,100 @@ class AntaMockEnvironment:  # pylint: disable=too-few-public-methods
             )
         msg = f"The following eAPI Request has not been mocked: {jsonrpc}"
         raise NotImplementedError(msg)
+
+
+def create_certificate(directory: Path) -> tuple[Path, Path]:
+    """Create a self-signed certificate for localhost in `directory` and return the paths of the certificate and its key."""
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = datetime.now(tz=timezone.utc)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now)
+        .not_valid_after(now + timedelta(days=1))
+        .sign(key, hashes.SHA256())
+    )
+    cert_file, key_file = directory / "cert.pem", directory / "key.pem"
+    cert_file.write_bytes(certificate.public_bytes(serialization.Encoding.PEM))
+    key_file.write_bytes(key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()))
+    return cert_file, key_file
+
+
+class EapiServer:
+    """Local HTTPS server answering the eAPI requests over HTTP/1.1 or HTTP/2, as negotiated with ALPN.
+
+    The server counts the TCP connections opened by the clients. It answers all the requests with the same 'show version' output.
+    """
+
+    RESPONSE = json.dumps({"jsonrpc": "2.0", "id": "benchmark", "result": [{"modelName": "pytest"}]}).encode()
+
+    def __init__(self, cert_file: Path, key_file: Path) -> None:
+        self.connections = 0
+        self.port = 0
+        self._ssl = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        self._ssl.load_cert_chain(cert_file, key_file)
+        self._ssl.set_alpn_protocols(["h2", "http/1.1"])
+        self._server: asyncio.Server | None = None
+
+    async def __aenter__(self) -> Self:
+        """Start the server on a random port of the loopback interface."""
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0, ssl=self._ssl)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        """Stop the server."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve a client connection with the negotiated protocol."""
+        self.connections += 1
+        try:
+            if writer.get_extra_info("ssl_object").selected_alpn_protocol() == "h2":
+                await self._serve_h2(reader, writer)
+            else:
+                await self._serve_h11(reader, writer)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _serve_h11(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Answer the HTTP/1.1 requests of a connection, one at a time."""
+        conn = h11.Connection(h11.SERVER)
+        while True:
+            event = conn.next_event()
+            if event is h11.NEED_DATA:
+                data = await reader.read(65536)
+                conn.receive_data(data)
+                if not data:
+                    return
+            elif isinstance(event, h11.EndOfMessage):
+                headers = [("content-type", "application/json"), ("content-length", str(len(self.RESPONSE)))]
+                writer.write(conn.send(h11.Response(status_code=200, headers=headers)) + conn.send(h11.Data(data=self.RESPONSE)) + conn.send(h11.EndOfMessage()))
+                await writer.drain()
+                conn.start_next_cycle()
+            elif isinstance(event, h11.ConnectionClosed):
+                return
+
+    async def _serve_h2(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Answer the concurrent HTTP/2 requests multiplexed over a connection."""
+        conn = h2.connection.H2Connection(config=h2.config.H2Configuration(client_side=False))
+        conn.initiate_connection()
+        writer.write(conn.data_to_send())
+        while data := await reader.read(65536):
+            for event in conn.receive_data(data):
+                if isinstance(event, h2.events.DataReceived):
+                    conn.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                elif isinstance(event, h2.events.StreamEnded):
+                    headers = [(":status", "200"), ("content-type", "application/json"), ("content-length", str(len(self.RESPONSE)))]
+                    conn.send_headers(event.stream_id, headers)
+                    conn.send_data(event.stream_id, self.RESPONSE, end_stream=True)
+            writer.write(conn.data_to_send())
+            await writer.drain()
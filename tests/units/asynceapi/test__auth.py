@@ -7,19 +7,26 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from typing import TYPE_CHECKING
 
 import httpx
 import pytest
+from cryptography.fernet import Fernet
 
 from asynceapi._auth import EapiSessionAuth, _cookie_fingerprint
 from asynceapi.errors import EapiAsyncOnlyError, EapiAuthenticationError
+from asynceapi.session_store import EapiSessionStore
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 _HOST = "192.0.2.1"
+_PORT = 443
 _USERNAME = "admin"
 _PASSWORD = "test1234"
 
-_LOGIN_URL = f"https://{_HOST}:443/login"
-_COMMAND_URL = f"https://{_HOST}:443/command-api"
+_LOGIN_URL = f"https://{_HOST}:{_PORT}/login"
+_COMMAND_URL = f"https://{_HOST}:{_PORT}/command-api"
 
 _SESSION_COOKIE = "aabbccdd11223344"
 
@@ -27,7 +34,13 @@ _SESSION_COOKIE = "aabbccdd11223344"
 @pytest.fixture(name="session_auth")
 def _session_auth_fixture() -> EapiSessionAuth:
     """Return a fresh EapiSessionAuth with known credentials."""
-    return EapiSessionAuth(host=_HOST, username=_USERNAME, password=_PASSWORD, login_url=_LOGIN_URL)
+    return EapiSessionAuth(host=_HOST, port=_PORT, username=_USERNAME, password=_PASSWORD, login_url=_LOGIN_URL)
+
+
+@pytest.fixture(name="session_store")
+def _session_store_fixture(tmp_path: Path) -> EapiSessionStore:
+    """Return an empty EapiSessionStore in a temporary directory."""
+    return EapiSessionStore(tmp_path / "sessions", Fernet.generate_key())
 
 
 def test_eapi_session_auth_initial_state(session_auth: EapiSessionAuth) -> None:
@@ -235,3 +248,67 @@ async def test_auth_flow_session_expired_includes_response_text(session_auth: Ea
         await gen.asend(httpx.Response(401, text="Session expired", request=cmd_req))
 
     assert exc_info.value.response_text == "Session expired"
+
+
+async def test_auth_flow_stores_login_cookie(session_store: EapiSessionStore) -> None:
+    """Test that the cookie of a new login is stored in the session store."""
+    session_auth = EapiSessionAuth(host=_HOST, port=_PORT, username=_USERNAME, password=_PASSWORD, login_url=_LOGIN_URL, session_store=session_store)
+    gen = session_auth.async_auth_flow(request=httpx.Request("POST", _COMMAND_URL))
+    login_req = await anext(gen)
+    await gen.asend(httpx.Response(200, headers={"Set-Cookie": f"Session={_SESSION_COOKIE}; Path=/"}, request=login_req))
+    await gen.aclose()
+
+    assert session_store.get(_HOST, _PORT, _USERNAME) == _SESSION_COOKIE
+
+
+async def test_auth_flow_reuses_stored_cookie(session_store: EapiSessionStore) -> None:
+    """Test that a stored cookie is attached to the first request without a login."""
+    session_store.set(_HOST, _PORT, _USERNAME, _SESSION_COOKIE)
+    session_auth = EapiSessionAuth(host=_HOST, port=_PORT, username=_USERNAME, password=_PASSWORD, login_url=_LOGIN_URL, session_store=session_store)
+    assert session_auth.logged_in is True
+
+    gen = session_auth.async_auth_flow(request=httpx.Request("POST", _COMMAND_URL))
+    cmd_req = await anext(gen)
+    assert cmd_req.url == _COMMAND_URL
+    assert cmd_req.headers["Cookie"] == f"Session={_SESSION_COOKIE}"
+
+    with pytest.raises(StopAsyncIteration):
+        await gen.asend(httpx.Response(200, request=cmd_req))
+
+
+async def test_auth_flow_stored_cookie_401_logs_in_and_retries(session_store: EapiSessionStore) -> None:
+    """Test that a 401 with the stored cookie logs in again, stores the new cookie and retries the request once."""
+    session_store.set(_HOST, _PORT, _USERNAME, "expiredcookie")
+    session_auth = EapiSessionAuth(host=_HOST, port=_PORT, username=_USERNAME, password=_PASSWORD, login_url=_LOGIN_URL, session_store=session_store)
+
+    gen = session_auth.async_auth_flow(request=httpx.Request("POST", _COMMAND_URL))
+    cmd_req = await anext(gen)
+    login_req = await gen.asend(httpx.Response(401, request=cmd_req))
+    assert login_req.url == _LOGIN_URL
+
+    retry_req = await gen.asend(httpx.Response(200, headers={"Set-Cookie": f"Session={_SESSION_COOKIE}; Path=/"}, request=login_req))
+    assert retry_req.url == _COMMAND_URL
+    assert retry_req.headers["Cookie"] == f"Session={_SESSION_COOKIE}"
+    assert session_store.get(_HOST, _PORT, _USERNAME) == _SESSION_COOKIE
+
+    # A 401 on the retried request is not retried again
+    with pytest.raises(EapiAuthenticationError):
+        await gen.asend(httpx.Response(401, request=retry_req))
+    assert session_auth.logged_in is False
+    assert session_store.get(_HOST, _PORT, _USERNAME) is None
+
+
+async def test_auth_flow_stored_cookie_401_relogin_failure(session_store: EapiSessionStore) -> None:
+    """Test that a failed login after a 401 with the stored cookie raises and removes the stored cookie."""
+    session_store.set(_HOST, _PORT, _USERNAME, "expiredcookie")
+    session_auth = EapiSessionAuth(host=_HOST, port=_PORT, username=_USERNAME, password=_PASSWORD, login_url=_LOGIN_URL, session_store=session_store)
+
+    gen = session_auth.async_auth_flow(request=httpx.Request("POST", _COMMAND_URL))
+    cmd_req = await anext(gen)
+    login_req = await gen.asend(httpx.Response(401, request=cmd_req))
+
+    with pytest.raises(EapiAuthenticationError) as exc_info:
+        await gen.asend(httpx.Response(401, text="Unauthorized", request=login_req))
+
+    assert exc_info.value.response_text == "Unauthorized"
+    assert session_store.get(_HOST, _PORT, _USERNAME) is None
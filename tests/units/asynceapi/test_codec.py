@@ -0,0 +1,70 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Unit tests for the asynceapi.codec module."""
+
+from __future__ import annotations
+
+import pickle
+from typing import TYPE_CHECKING
+from unittest.mock import ANY, patch
+
+import pytest
+
+from asynceapi.codec import CODECS, JsonCodec, OrjsonCodec, get_codec
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@pytest.fixture(autouse=True)
+def clear_codec_cache() -> Iterator[None]:
+    """Clear the cached codecs before and after each test."""
+    get_codec.cache_clear()
+    yield
+    get_codec.cache_clear()
+
+
+@pytest.mark.parametrize("name", list(CODECS))
+def test_codec_round_trip(name: str) -> None:
+    """Test that each codec encodes compact UTF-8 JSON and decodes it back."""
+    if (package := CODECS[name].package) is not None:
+        pytest.importorskip(package)
+    codec = get_codec(name)
+    obj = {"description": "Uplink to Zürich", "mtu": 9214, "bandwidth": 1e11, "counters": [0, 18446744073709551615], "enabled": True, "vrf": None}
+    data = codec.dumps(obj)
+    assert isinstance(data, bytes)
+    assert data == CODECS["json"]().dumps(obj)
+    assert codec.loads(data) == obj
+    assert codec.loads(data.decode()) == obj
+    assert pickle.loads(pickle.dumps(codec)).loads(data) == obj  # noqa: S301
+
+
+def test_get_codec_cached() -> None:
+    """Test that get_codec returns the same codec instance for the same name."""
+    assert get_codec("json") is get_codec("json")
+
+
+@pytest.mark.parametrize(("installed", "expected"), [({"orjson", "msgspec"}, OrjsonCodec), (set(), JsonCodec)])
+def test_get_codec_auto(installed: set[str], expected: type[JsonCodec]) -> None:
+    """Test that the auto codec is the first codec with its package installed."""
+    with patch("asynceapi.codec.find_spec", side_effect=lambda package: ANY if package in installed else None), patch("asynceapi.codec.import_module"):
+        codec = get_codec("auto")
+        # The auto codec is opt-in
+        default = get_codec()
+    assert codec.name == expected.name
+    assert default.name == JsonCodec.name
+
+
+def test_get_codec_not_installed(caplog: pytest.LogCaptureFixture) -> None:
+    """Test that get_codec falls back to the json codec when the package of the codec is not installed."""
+    with patch("asynceapi.codec.find_spec", return_value=None):
+        codec = get_codec("msgspec")
+    assert codec.name == JsonCodec.name
+    assert "The msgspec package is not installed, using the json codec. Install it with `pip install msgspec`." in caplog.messages
+
+
+def test_get_codec_unknown() -> None:
+    """Test that get_codec raises a ValueError for an unknown codec."""
+    with pytest.raises(ValueError, match=r"Unknown JSON codec 'ujson', valid codecs are: auto, orjson, msgspec, json"):
+        get_codec("ujson")
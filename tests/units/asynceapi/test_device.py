@@ -6,16 +6,21 @@
 from __future__ import annotations
 
 import asyncio
+import socket
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from typing import TYPE_CHECKING
 from unittest.mock import ANY, AsyncMock, patch
 
 import pytest
 import respx
-from httpx import ConnectError, HTTPStatusError, Response
+from cryptography.fernet import Fernet
+from httpx import ConnectError, HTTPStatusError, Limits, Response
 
 from asynceapi import Device, EapiCommandError
 from asynceapi._constants import EapiCommandFormat
+from asynceapi.codec import CODECS, get_codec
 from asynceapi.errors import EapiAuthenticationError
+from asynceapi.session_store import EapiSessionStore
 
 from .test_data import ERROR_EAPI_RESPONSE, JSONRPC_REQUEST_TEMPLATE, SUCCESS_EAPI_RESPONSE
 
@@ -26,6 +31,8 @@ _BASE_URL = f"https://{_HOST}"
 
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from pytest_httpx import HTTPXMock
 
     from asynceapi._types import EapiComplexCommand, EapiSimpleCommand, JsonRpc
@@ -75,6 +82,33 @@ async def test_jsonrpc_exec_success(
     assert result == SUCCESS_EAPI_RESPONSE["result"]
 
 
+@pytest.mark.parametrize(("threshold", "offloaded"), [(None, False), (1, True), (1024 * 1024, False)], ids=["disabled", "offloaded", "below-threshold"])
+async def test_jsonrpc_exec_decode_offload(httpx_mock: HTTPXMock, threshold: int | None, *, offloaded: bool) -> None:
+    """Test that Device.jsonrpc_exec decodes the responses larger than the threshold in the decode executor."""
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        device = Device(host=_HOST, username="admin", password=_PASSWORD, decode_offload_threshold=threshold, decode_executor=executor)
+        httpx_mock.add_response(json=SUCCESS_EAPI_RESPONSE)
+        with patch.object(executor, "submit", wraps=executor.submit) as submit:
+            result = await device.jsonrpc_exec(jsonrpc=JSONRPC_REQUEST_TEMPLATE)
+
+    assert result == SUCCESS_EAPI_RESPONSE["result"]
+    assert submit.called is offloaded
+    assert device.decode_stats["offloaded"] == int(offloaded)
+    assert device.decode_stats["inline"] == int(not offloaded)
+    assert (device.decode_stats["max_inline_time"] > 0) is not offloaded
+
+
+async def test_jsonrpc_exec_decode_offload_process_pool(httpx_mock: HTTPXMock) -> None:
+    """Test that Device.jsonrpc_exec decodes the responses in a process pool."""
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        device = Device(host=_HOST, username="admin", password=_PASSWORD, decode_offload_threshold=1, decode_executor=executor)
+        httpx_mock.add_response(json=SUCCESS_EAPI_RESPONSE)
+        result = await device.jsonrpc_exec(jsonrpc=JSONRPC_REQUEST_TEMPLATE)
+
+    assert result == SUCCESS_EAPI_RESPONSE["result"]
+    assert device.decode_stats["offloaded"] == 1
+
+
 @pytest.mark.parametrize(
     "cmds",
     [
@@ -105,6 +139,20 @@ async def test_jsonrpc_exec_eapi_command_error(
     assert exc_info.value.not_exec == [jsonrpc_request["params"]["cmds"][2]]
 
 
+@pytest.mark.parametrize("codec", list(CODECS))
+async def test_jsonrpc_exec_codec(httpx_mock: HTTPXMock, codec: str) -> None:
+    """Test that Device.jsonrpc_exec encodes the request and decodes the response with the codec of the device."""
+    if (package := CODECS[codec].package) is not None:
+        pytest.importorskip(package)
+    device = Device(host=_HOST, username="admin", password=_PASSWORD, codec=get_codec(codec))
+    assert device.codec is get_codec(codec)
+    httpx_mock.add_response(json=SUCCESS_EAPI_RESPONSE, match_json=JSONRPC_REQUEST_TEMPLATE, match_headers={"Content-Type": "application/json-rpc"})
+
+    result = await device.jsonrpc_exec(jsonrpc=JSONRPC_REQUEST_TEMPLATE)
+
+    assert result == SUCCESS_EAPI_RESPONSE["result"]
+
+
 async def test_jsonrpc_exec_http_status_error(asynceapi_device: Device, httpx_mock: HTTPXMock) -> None:
     """Test the Device.jsonrpc_exec method with an HTTPStatusError."""
     jsonrpc_request = JSONRPC_REQUEST_TEMPLATE.copy()
@@ -172,6 +220,49 @@ async def test_aclose_skips_logout_when_session_disabled() -> None:
     mock_logout.assert_not_called()
 
 
+async def test_device_session_store_reused_across_devices(tmp_path: Path) -> None:
+    """Test that a device saves its session cookie instead of logging out, and that the next device reuses it without a login."""
+    key = Fernet.generate_key()
+    with respx.mock as respx_mock:
+        login_route = respx_mock.post(f"{_BASE_URL}/login").respond(status_code=200, headers={"Set-Cookie": f"Session={_SESSION_COOKIE}; Path=/"})
+        command_route = respx_mock.post(f"{_BASE_URL}/command-api").respond(json=_jsonrpc_response())
+        logout_route = respx_mock.post(f"{_BASE_URL}/logout").respond(status_code=200)
+
+        for _ in range(2):
+            store = EapiSessionStore(tmp_path / "sessions", key)
+            async with Device(host=_HOST, username="admin", password=_PASSWORD, use_session_auth=True, session_store=store) as device:
+                await device.jsonrpc_exec(jsonrpc=_jsonrpc_request())
+
+        assert login_route.call_count == 1
+        assert command_route.call_count == 2
+        assert logout_route.call_count == 0
+        assert all(call.request.headers.get("cookie") == f"Session={_SESSION_COOKIE}" for call in command_route.calls)
+
+
+async def test_device_session_store_same_host(tmp_path: Path) -> None:
+    """Test that devices on the same host and different ports, e.g. port-forwarded to localhost, store their own session cookie."""
+    store = EapiSessionStore(tmp_path / "sessions", Fernet.generate_key())
+    with respx.mock as respx_mock:
+        for port, cookie in ((8443, "cookie8443"), (9443, "cookie9443")):
+            respx_mock.post(f"https://localhost:{port}/login").respond(status_code=200, headers={"Set-Cookie": f"Session={cookie}; Path=/"})
+            respx_mock.post(f"https://localhost:{port}/command-api").respond(json=_jsonrpc_response())
+            async with Device(host="localhost", port=port, username="admin", password=_PASSWORD, use_session_auth=True, session_store=store) as device:
+                await device.jsonrpc_exec(jsonrpc=_jsonrpc_request())
+
+    assert store.get("localhost", 8443, "admin") == "cookie8443"
+    assert store.get("localhost", 9443, "admin") == "cookie9443"
+
+
+async def test_device_session_store_ignored_without_session_auth(tmp_path: Path) -> None:
+    """Test that the session store is not used when use_session_auth=False."""
+    store = EapiSessionStore(tmp_path / "sessions", Fernet.generate_key())
+    device = Device(host=_HOST, username="admin", password=_PASSWORD, session_store=store)
+    with patch.object(store, "save") as mock_save:
+        await device.aclose()
+    assert device._session_store is None
+    mock_save.assert_not_called()
+
+
 async def test_device_session_logout_sends_cookie_and_resets_state() -> None:
     """Test that logout() POSTs /logout with the session cookie and resets session state."""
     with respx.mock as respx_mock:
@@ -231,6 +322,27 @@ def test_device_init_session_raises_without_host() -> None:
         Device(host=None, username="admin", password=_PASSWORD, use_session_auth=True)
 
 
+@pytest.mark.parametrize(("http2", "h2_installed", "expected"), [(False, True, False), (True, True, True), (True, False, False)])
+def test_device_init_http2(caplog: pytest.LogCaptureFixture, *, http2: bool, h2_installed: bool, expected: bool) -> None:
+    """Test that Device enables HTTP/2 on the HTTPX transport and falls back to HTTP/1.1 when the h2 package is not installed."""
+    with patch("asynceapi.device.find_spec", return_value=ANY if h2_installed else None):
+        device = Device(host=_HOST, username="admin", password=_PASSWORD, http2=http2)
+    assert device.http2 is expected
+    assert device._transport._pool._http2 is expected  # type: ignore[attr-defined]
+    assert ("the h2 package is not installed, using HTTP/1.1" in caplog.text) is (http2 and not h2_installed)
+
+
+@pytest.mark.parametrize("http2", [False, True])
+def test_device_init_socket_options(*, http2: bool) -> None:
+    """Test that Device creates a transport with the socket options, the limits and the HTTP version of the client."""
+    socket_options = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    device = Device(host=_HOST, username="admin", password=_PASSWORD, http2=http2, limits=Limits(max_connections=5), socket_options=socket_options)
+    pool = device._transport._pool  # type: ignore[attr-defined]
+    assert pool._socket_options == socket_options
+    assert pool._max_connections == 5
+    assert pool._http2 is http2
+
+
 async def test_logout_noop_when_session_auth_is_none() -> None:
     """Test that logout() is a no-op when the device is not using session auth."""
     device = Device(host=_HOST, username="admin", password=_PASSWORD, use_session_auth=False)
@@ -0,0 +1,146 @@
+# Copyright (c) 2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Unit tests for the asynceapi.session_store module."""
+
+from __future__ import annotations
+
+import logging
+import stat
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from cryptography.fernet import Fernet
+
+from asynceapi.session_store import EapiSessionStore
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_HOST = "192.0.2.1"
+_PORT = 443
+_USERNAME = "admin"
+_SESSION_COOKIE = "aabbccdd11223344"
+_KEY = Fernet.generate_key()
+
+
+@pytest.fixture(name="store_path")
+def _store_path_fixture(tmp_path: Path) -> Path:
+    """Return the path of a session store file in a temporary directory."""
+    return tmp_path / "cache" / "sessions"
+
+
+def test_session_store_round_trip(store_path: Path) -> None:
+    """Test that the saved cookies are loaded by another store with the same key."""
+    store = EapiSessionStore(store_path, _KEY)
+    assert store.get(_HOST, _PORT, _USERNAME) is None
+    store.set(_HOST, _PORT, _USERNAME, _SESSION_COOKIE)
+    store.save()
+
+    assert _SESSION_COOKIE.encode() not in store_path.read_bytes()
+    assert stat.S_IMODE(store_path.stat().st_mode) == 0o600
+    assert EapiSessionStore(store_path, _KEY).get(_HOST, _PORT, _USERNAME) == _SESSION_COOKIE
+    assert EapiSessionStore(store_path, _KEY).get(_HOST, _PORT, "other") is None
+    assert EapiSessionStore(store_path, _KEY).get(_HOST, 8443, _USERNAME) is None
+
+
+def test_session_store_delete(store_path: Path) -> None:
+    """Test that a deleted cookie is removed from the file."""
+    store = EapiSessionStore(store_path, _KEY)
+    store.set(_HOST, _PORT, _USERNAME, _SESSION_COOKIE)
+    store.save()
+    store.delete(_HOST, _PORT, _USERNAME)
+    store.save()
+    assert EapiSessionStore(store_path, _KEY).get(_HOST, _PORT, _USERNAME) is None
+
+
+def test_session_store_save_unchanged(store_path: Path) -> None:
+    """Test that the file is not written when no cookie changed."""
+    store = EapiSessionStore(store_path, _KEY)
+    store.save()
+    assert not store_path.exists()
+
+    store.set(_HOST, _PORT, _USERNAME, _SESSION_COOKIE)
+    store.save()
+    mtime = store_path.stat().st_mtime_ns
+    store.set(_HOST, _PORT, _USERNAME, _SESSION_COOKIE)
+    store.delete(_HOST, _PORT, "other")
+    store.save()
+    assert store_path.stat().st_mtime_ns == mtime
+
+
+def test_session_store_merge(store_path: Path) -> None:
+    """Test that the stores of the same file, e.g. in other processes, keep the cookies saved by each other."""
+    store = EapiSessionStore(store_path, _KEY)
+    other = EapiSessionStore(store_path, _KEY)
+    assert other.get(_HOST, _PORT, _USERNAME) is None
+    store.set(_HOST, _PORT, _USERNAME, _SESSION_COOKIE)
+    store.save()
+    other.set(_HOST, 8443, _USERNAME, "othercookie")
+    other.save()
+    assert EapiSessionStore(store_path, _KEY).cookies == {f"{_USERNAME}@{_HOST}:{_PORT}": _SESSION_COOKIE, f"{_USERNAME}@{_HOST}:8443": "othercookie"}
+
+    store.delete(_HOST, _PORT, _USERNAME)
+    store.save()
+    assert EapiSessionStore(store_path, _KEY).cookies == {f"{_USERNAME}@{_HOST}:8443": "othercookie"}
+
+
+async def test_session_store_asave(store_path: Path) -> None:
+    """Test that asave() saves the cookies in a worker thread only if they changed."""
+    store = EapiSessionStore(store_path, _KEY)
+    with patch("asynceapi.session_store.asyncio.to_thread", new_callable=AsyncMock) as to_thread_mock:
+        await store.asave()
+    to_thread_mock.assert_not_awaited()
+
+    store.set(_HOST, _PORT, _USERNAME, _SESSION_COOKIE)
+    await store.asave()
+    assert EapiSessionStore(store_path, _KEY).get(_HOST, _PORT, _USERNAME) == _SESSION_COOKIE
+
+
+@pytest.mark.parametrize(("content"), [pytest.param(None, id="other-key"), pytest.param(b"corrupted", id="corrupted")])
+def test_session_store_ignores_unreadable_file(store_path: Path, content: bytes | None, caplog: pytest.LogCaptureFixture) -> None:
+    """Test that a file encrypted with another key or corrupted is ignored and overwritten on save."""
+    if content is None:
+        other = EapiSessionStore(store_path, Fernet.generate_key())
+        other.set(_HOST, _PORT, _USERNAME, _SESSION_COOKIE)
+        other.save()
+    else:
+        store_path.parent.mkdir(parents=True)
+        store_path.write_bytes(content)
+
+    store = EapiSessionStore(store_path, _KEY)
+    with caplog.at_level(logging.WARNING):
+        assert store.get(_HOST, _PORT, _USERNAME) is None
+    assert "cannot be read or decrypted: InvalidToken" in caplog.text
+
+    store.set(_HOST, _PORT, _USERNAME, "newcookie")
+    store.save()
+    assert EapiSessionStore(store_path, _KEY).get(_HOST, _PORT, _USERNAME) == "newcookie"
+
+
+def test_session_store_save_error(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    """Test that a write error is logged and the cookies are saved again on the next call."""
+    blocker = tmp_path / "blocker"
+    blocker.write_text("")
+    store = EapiSessionStore(blocker / "sessions", _KEY)
+    store.set(_HOST, _PORT, _USERNAME, _SESSION_COOKIE)
+    with caplog.at_level(logging.WARNING):
+        store.save()
+    assert "Could not save the eAPI session store" in caplog.text
+
+    blocker.unlink()
+    store.save()
+    assert EapiSessionStore(blocker / "sessions", _KEY).get(_HOST, _PORT, _USERNAME) == _SESSION_COOKIE
+
+
+def test_session_store_invalid_key(store_path: Path) -> None:
+    """Test that an invalid Fernet key raises ValueError."""
+    with pytest.raises(ValueError, match="Fernet key"):
+        EapiSessionStore(store_path, "invalid")
+
+
+def test_session_store_repr_masks_key(store_path: Path) -> None:
+    """Test that repr includes the path but not the key."""
+    assert repr(EapiSessionStore(store_path, _KEY)) == f"EapiSessionStore(path={str(store_path)!r})"
+    assert _KEY.decode() not in repr(EapiSessionStore(store_path, _KEY))
@@ -5,19 +5,29 @@
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
 from typing import TYPE_CHECKING
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from anta._runner import AntaStatusChange
 from anta.cli import anta
 from anta.cli.utils import ExitCode
 from anta.inventory import AntaInventory
+from anta.models import AntaTest
+from anta.result_manager import ResultManager
+from anta.result_manager.models import AntaTestStatus, TestResult
+from anta.settings import AntaRunnerSettings
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
     from click.testing import CliRunner
 
+    from anta._runner import AntaRunContext
+
 DATA_DIR: Path = Path(__file__).parents[3].resolve() / "data"
 
 # TODO: write unit tests for ignore-status and ignore-error
@@ -76,6 +86,134 @@ def test_anta_nrfu_disconnect(click_runner: CliRunner, args: list[str], env: dic
     assert run_mock.await_args.kwargs["disconnect"] is expected
 
 
+@pytest.mark.parametrize(
+    ("args", "expected"),
+    [
+        pytest.param(["nrfu"], None, id="default"),
+        pytest.param(["nrfu", "--shards", "4"], 4, id="option"),
+    ],
+)
+def test_anta_nrfu_shards(click_runner: CliRunner, args: list[str], expected: int | None) -> None:
+    """Test anta nrfu shards input is passed to the runner settings."""
+    with (
+        patch("anta.cli.nrfu.utils.AntaRunner.run", new=AsyncMock()),
+        patch("anta.cli.nrfu.utils.AntaRunnerSettings", wraps=AntaRunnerSettings) as settings_mock,
+    ):
+        result = click_runner.invoke(anta, args)
+
+    assert result.exit_code == ExitCode.OK
+    if expected is None:
+        settings_mock.assert_not_called()
+    else:
+        settings_mock.assert_called_once_with(shards=expected)
+
+
+@pytest.mark.parametrize(
+    ("args", "env", "expected"),
+    [
+        pytest.param(["nrfu"], {}, None, id="default"),
+        pytest.param(["nrfu", "--schedule", "historical"], {}, "historical", id="option"),
+        pytest.param(["nrfu"], {"ANTA_NRFU_SCHEDULE": "fair"}, "fair", id="env-var"),
+    ],
+)
+def test_anta_nrfu_schedule(click_runner: CliRunner, args: list[str], env: dict[str, str], expected: str | None) -> None:
+    """Test anta nrfu schedule input is passed to the runner settings."""
+    with (
+        patch("anta.cli.nrfu.utils.AntaRunner.run", new=AsyncMock()),
+        patch("anta.cli.nrfu.utils.AntaRunnerSettings", wraps=AntaRunnerSettings) as settings_mock,
+    ):
+        result = click_runner.invoke(anta, args, env=env)
+
+    assert result.exit_code == ExitCode.OK
+    if expected is None:
+        settings_mock.assert_not_called()
+    else:
+        settings_mock.assert_called_once_with(schedule=expected)
+
+
+def test_anta_nrfu_watch(click_runner: CliRunner) -> None:
+    """Test anta nrfu --watch prints the status changes of each iteration."""
+    result = TestResult(name="leaf1", test="VerifyEOSVersion", categories=[], description="", result=AntaTestStatus.FAILURE)
+
+    async def run_periodic(*_args: object, **_kwargs: object) -> AsyncGenerator[tuple[AntaRunContext, list[AntaStatusChange]], None]:
+        manager = ResultManager()
+        manager.add(result)
+        run_ctx = MagicMock(manager=manager, end_time=None)
+        yield run_ctx, [AntaStatusChange(result=result, previous=AntaTestStatus.SUCCESS)]
+        raise KeyboardInterrupt
+
+    with patch("anta.cli.nrfu.utils.AntaRunner.run_periodic", new=run_periodic):
+        result_cli = click_runner.invoke(anta, ["nrfu", "--watch", "60"])
+
+    assert result_cli.exit_code == ExitCode.OK
+    assert "1 results, 1 status change(s)" in result_cli.output
+    assert "leaf1 :: VerifyEOSVersion :: SUCCESS -> FAILURE" in result_cli.output
+    assert "Watch mode stopped." in result_cli.output
+
+
+def test_anta_nrfu_rerun_from(click_runner: CliRunner, tmp_path: Path) -> None:
+    """Test anta nrfu --rerun-from only re-runs the test results with the selected statuses."""
+    results = [
+        TestResult(name="leaf1", test="VerifyEOSVersion", categories=[], description="", result=AntaTestStatus.FAILURE, inputs_uid="0123456789abcdef"),
+        TestResult(name="leaf2", test="VerifyUptime", categories=[], description="", result=AntaTestStatus.ERROR),
+        TestResult(name="leaf3", test="VerifyUptime", categories=[], description="", result=AntaTestStatus.SUCCESS),
+    ]
+    manager = ResultManager()
+    manager.results = results
+    results_file = tmp_path / "results.json"
+    results_file.write_text(manager.json, encoding="UTF-8")
+
+    with patch("anta.cli.nrfu.utils.AntaRunner.run", new_callable=AsyncMock) as run_mock:
+        result_cli = click_runner.invoke(anta, ["nrfu", "--rerun-from", str(results_file), "--status", "failure"])
+    assert result_cli.exit_code == ExitCode.OK
+    assert run_mock.call_args.kwargs["filters"].test_instances == {"leaf1": {("VerifyEOSVersion", "0123456789abcdef")}}
+
+    result_cli = click_runner.invoke(anta, ["nrfu", "--rerun-from", str(results_file), "--status", "skipped"])
+    assert result_cli.exit_code == ExitCode.OK
+    assert "No test results to re-run with the selected statuses." in result_cli.output
+
+    result_cli = click_runner.invoke(anta, ["nrfu", "--rerun-from", str(results_file), "--status", "failure,unknown"])
+    assert result_cli.exit_code == ExitCode.USAGE_ERROR
+    assert "'unknown' is not a valid AntaTestStatus" in result_cli.output
+
+    results_file.write_text("{invalid", encoding="UTF-8")
+    result_cli = click_runner.invoke(anta, ["nrfu", "--rerun-from", str(results_file)])
+    assert result_cli.exit_code == ExitCode.USAGE_ERROR
+    assert "Cannot load the test results from" in result_cli.output
+
+
+def test_anta_nrfu_trace(click_runner: CliRunner, tmp_path: Path) -> None:
+    """Test anta nrfu --trace saves a trace of the run."""
+    trace_file = tmp_path / "trace.json"
+    result = click_runner.invoke(anta, ["nrfu", "--dry-run", "--trace", str(trace_file)])
+    assert result.exit_code == ExitCode.OK
+    trace = json.loads(trace_file.read_text(encoding="UTF-8"))
+    assert "AntaRunner.run" in {event["name"] for event in trace["traceEvents"]}
+
+
+@pytest.mark.parametrize(
+    ("args", "expected"),
+    [
+        pytest.param(["nrfu"], False, id="default"),
+        pytest.param(["nrfu", "--progress-per-device"], True, id="option"),
+    ],
+)
+def test_anta_nrfu_progress(click_runner: CliRunner, args: list[str], expected: bool) -> None:
+    """Test anta nrfu reports the progress of the run while the tests are executed."""
+    per_device: list[bool] = []
+
+    async def run(*_: object, **__: object) -> None:
+        assert AntaTest.progress is not None
+        per_device.append(AntaTest.progress.per_device)
+
+    with patch("anta.cli.nrfu.utils.AntaRunner.run", new=AsyncMock(side_effect=run)):
+        result = click_runner.invoke(anta, args)
+
+    assert result.exit_code == ExitCode.OK
+    assert per_device == [expected]
+    assert AntaTest.progress is None
+
+
 def test_anta_nrfu_wrong_catalog_format(click_runner: CliRunner) -> None:
     """Test anta nrfu --dry-run, catalog is given via env."""
     result = click_runner.invoke(anta, ["nrfu", "--dry-run", "--catalog-format", "toto"])
@@ -166,6 +304,48 @@ def test_anta_nrfu_use_session(click_runner: CliRunner, args: list[str], env: di
     assert parse_mock.call_args.kwargs["use_session_auth"] is expected
 
 
+@pytest.mark.parametrize(
+    ("args", "env", "expected"),
+    [
+        pytest.param(["nrfu"], {}, None, id="default"),
+        pytest.param(["nrfu", "--batch-window", "0.01"], {}, 0.01, id="option"),
+        pytest.param(["nrfu"], {"ANTA_BATCH_WINDOW": "0.05"}, 0.05, id="env-var"),
+    ],
+)
+def test_anta_nrfu_batch_window(click_runner: CliRunner, args: list[str], env: dict[str, str], expected: float | None) -> None:
+    """Test anta nrfu batch_window inputs are forwarded to AntaInventory.parse."""
+    with patch("anta.cli.utils.AntaInventory.parse", wraps=AntaInventory.parse) as parse_mock:
+        result = click_runner.invoke(anta, args, env=env)
+    assert result.exit_code == ExitCode.OK
+    parse_mock.assert_called_once()
+    assert parse_mock.call_args.kwargs["batch_window"] == expected
+
+
+@pytest.mark.parametrize(
+    ("args", "env", "expected"),
+    [
+        pytest.param(["nrfu"], {}, False, id="default"),
+        pytest.param(["nrfu", "--http2"], {}, True, id="option"),
+        pytest.param(["nrfu"], {"ANTA_HTTP2": "true"}, True, id="env-var"),
+    ],
+)
+def test_anta_nrfu_http2(click_runner: CliRunner, args: list[str], env: dict[str, str], *, expected: bool) -> None:
+    """Test anta nrfu http2 inputs are forwarded to AntaInventory.parse."""
+    with patch("anta.cli.utils.AntaInventory.parse", wraps=AntaInventory.parse) as parse_mock:
+        result = click_runner.invoke(anta, args, env=env)
+    assert result.exit_code == ExitCode.OK
+    parse_mock.assert_called_once()
+    assert parse_mock.call_args.kwargs["http2"] is expected
+
+
+@pytest.mark.parametrize("option", ["--http2", "--batch-window=0.01"])
+def test_transport_options_nrfu_only(click_runner: CliRunner, option: str) -> None:
+    """Test that the transport options are only available to anta nrfu."""
+    result = click_runner.invoke(anta, ["get", "inventory", option])
+    assert result.exit_code == ExitCode.USAGE_ERROR
+    assert "No such option" in result.output
+
+
 def test_hide(click_runner: CliRunner) -> None:
     """Test the `--hide` option of the `anta nrfu` command."""
     result = click_runner.invoke(anta, ["nrfu", "--hide", "success", "text"])
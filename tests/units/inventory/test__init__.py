@@ -144,6 +144,67 @@ class TestAntaInventory:
         assert devices_by_host["192.168.0.1"]._client._use_session_auth is True
         assert devices_by_host["192.168.0.2"]._client._use_session_auth is False
 
+    @pytest.mark.parametrize(
+        "yaml_file",
+        [
+            {
+                "anta_inventory": {
+                    "hosts": [{"host": "192.168.0.1", "http2": True}, {"host": "192.168.0.2"}],
+                    "ranges": [{"start": "10.0.0.1", "end": "10.0.0.2", "http2": True}],
+                }
+            }
+        ],
+        indirect=["yaml_file"],
+    )
+    @pytest.mark.parametrize(
+        ("http2", "expected"), [(False, {"192.168.0.1", "10.0.0.1", "10.0.0.2"}), (True, {"192.168.0.1", "192.168.0.2", "10.0.0.1", "10.0.0.2"})]
+    )
+    def test_http2(self, yaml_file: Path, *, http2: bool, expected: set[str]) -> None:
+        """Verify http2=True in an inventory entry or passed to parse() enables HTTP/2 and reduces the potential connections."""
+        inventory = AntaInventory.parse(filename=yaml_file, username="arista", password="arista123", http2=http2)
+        devices_http2 = {device._client.host for device in inventory.values() if isinstance(device, AsyncEOSDevice) and device.http2}
+
+        assert devices_http2 == expected
+        assert inventory.max_potential_connections == len(expected) + 100 * (len(inventory) - len(expected))
+        assert {host.name for host in inventory.dump().hosts or [] if host.http2} == expected
+
+    @pytest.mark.parametrize(
+        "yaml_file",
+        [
+            {
+                "anta_inventory": {
+                    "transport_profiles": {"spine": {"max_connections": 10, "keepalive_expiry": 300}, "lab": {"max_connections": 2, "read_timeout": 5}},
+                    "hosts": [{"host": "192.168.0.1", "transport_profile": "spine"}, {"host": "192.168.0.2"}],
+                    "networks": [{"network": "10.0.0.0/31", "transport_profile": "lab"}],
+                    "ranges": [{"start": "10.0.1.1", "end": "10.0.1.2", "transport_profile": "spine"}],
+                }
+            }
+        ],
+        indirect=["yaml_file"],
+    )
+    def test_transport_profiles(self, yaml_file: Path) -> None:
+        """Verify the transport profiles of the inventory entries tune the HTTPX client of the devices and the potential connections."""
+        inventory = AntaInventory.parse(filename=yaml_file, username="arista", password="arista123", timeout=30)
+        devices = {device._client.host: device for device in inventory.values() if isinstance(device, AsyncEOSDevice)}
+
+        assert {host: device.max_connections for host, device in devices.items()} == {
+            "192.168.0.1": 10,
+            "192.168.0.2": 100,
+            "10.0.0.0": 2,
+            "10.0.0.1": 2,
+            "10.0.1.1": 10,
+            "10.0.1.2": 10,
+        }
+        assert devices["192.168.0.1"]._client._transport._pool._keepalive_expiry == 300  # type: ignore[attr-defined]
+        assert devices["10.0.0.1"]._client.timeout.read == 5
+        assert devices["10.0.0.1"]._client.timeout.connect == 30
+        assert inventory.max_potential_connections == 134
+
+        dump = inventory.dump()
+        assert dump.transport_profiles is not None
+        assert set(dump.transport_profiles) == {"spine", "lab"}
+        assert {host.name: host.transport_profile for host in dump.hosts or []}["10.0.0.1"] == "lab"
+
     @pytest.mark.parametrize(
         ("cli", "inventory", "expected"),
         [
@@ -237,3 +237,33 @@ class TestAntaInventoryInputs:
             expected_data = safe_load(f)
 
         assert safe_load(anta_inventory_input.yaml()) == expected_data["anta_inventory"]
+
+    def test_transport_profiles(self) -> None:
+        """Verify the transport profiles are named after their key and not dumped with their name."""
+        anta_inventory_input = AntaInventoryInput(
+            transport_profiles={"spine": {"keepalive_expiry": 300, "tcp_keepalive": True}},
+            hosts=[{"host": "192.168.0.1", "transport_profile": "spine"}],
+        )
+        transport_profiles = anta_inventory_input.transport_profiles or {}
+        assert transport_profiles["spine"].name == "spine"
+        assert safe_load(anta_inventory_input.yaml())["transport_profiles"] == {"spine": {"keepalive_expiry": 300.0, "tcp_keepalive": True}}
+
+    @pytest.mark.parametrize(
+        "inventory",
+        [
+            pytest.param({"hosts": [{"host": "192.168.0.1", "transport_profile": "lab"}]}, id="host"),
+            pytest.param({"transport_profiles": {"spine": {}}, "networks": [{"network": "192.168.0.0/30", "transport_profile": "lab"}]}, id="network"),
+            pytest.param({"ranges": [{"start": "10.0.0.1", "end": "10.0.0.2", "transport_profile": "lab"}]}, id="range"),
+        ],
+    )
+    def test_transport_profile_undefined(self, inventory: dict[str, Any]) -> None:
+        """Verify an inventory entry referencing an undefined transport profile is invalid."""
+        with pytest.raises(ValidationError, match=r"Transport profile 'lab' is not defined in 'transport_profiles'"):
+            AntaInventoryInput(**inventory)
+
+    def test_transport_profile_invalid(self) -> None:
+        """Verify a transport profile with an unknown or invalid setting is invalid."""
+        with pytest.raises(ValidationError):
+            AntaInventoryInput(transport_profiles={"spine": {"keepalive": 300}})
+        with pytest.raises(ValidationError):
+            AntaInventoryInput(transport_profiles={"spine": {"max_connections": 0}})
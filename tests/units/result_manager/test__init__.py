@@ -582,7 +582,7 @@ class TestResultManager:
         result_manager = ResultManager()
         expected_match = (
             r"Invalid sort_by fields: ['bad_field']. Accepted fields are: "
-            r"['name', 'test', 'categories', 'description', 'result', 'messages', 'atomic_results', 'custom_field']"
+            r"['name', 'test', 'categories', 'description', 'result', 'messages', 'atomic_results', 'custom_field', 'inputs_uid']"
         )
         with pytest.raises(ValueError, match=re.escape(expected_match)):
             _ = result_manager.sort(["bad_field"])
@@ -0,0 +1,129 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Test anta._limiter.py."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from anta._limiter import AntaAdaptiveLimiter
+
+
+class TestAntaAdaptiveLimiter:
+    """Test AntaAdaptiveLimiter class."""
+
+    async def test_additive_increase(self) -> None:
+        """Test that the limit increases by 1 every `limit` successful requests, up to the maximum."""
+        limiter = AntaAdaptiveLimiter("device", initial_limit=2, max_limit=3)
+        for _ in range(3):
+            async with limiter.slot():
+                pass
+        assert limiter.limit == 3
+        for _ in range(10):
+            async with limiter.slot():
+                pass
+        assert limiter.limit == 3
+        assert limiter.statistics == {"limit": 3, "requests": 13, "timeouts": 0, "rejections": 0, "lowest_limit": 2, "highest_limit": 3}
+
+    async def test_multiplicative_decrease(self) -> None:
+        """Test that a burst of overloads started before a decrease only decreases the limit once."""
+        limiter = AntaAdaptiveLimiter("device", initial_limit=8, max_limit=10, min_limit=2)
+        started = asyncio.Event()
+
+        async def request() -> None:
+            async with limiter.slot(overload=(TimeoutError,)):
+                await started.wait()
+                raise TimeoutError
+
+        tasks = [asyncio.create_task(request()) for _ in range(4)]
+        await asyncio.sleep(0)
+        started.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert all(isinstance(result, TimeoutError) for result in results)
+        assert limiter.limit == 4
+        with pytest.raises(TimeoutError):
+            await request()
+        assert limiter.limit == 2
+        with pytest.raises(TimeoutError):
+            await request()
+        assert limiter.limit == 2
+        assert limiter.stats["timeouts"] == 6
+
+    async def test_rejected_request(self) -> None:
+        """Test that a rejected request decreases the limit by the latency backoff and is counted in the statistics."""
+        limiter = AntaAdaptiveLimiter("device", initial_limit=10, max_limit=10)
+
+        async def request() -> None:
+            async with limiter.slot(overload=(TimeoutError,), rejected=(ValueError,)):
+                msg = "rejected"
+                raise ValueError(msg)
+
+        with pytest.raises(ValueError, match="rejected"):
+            await request()
+        assert limiter.limit == 9
+        assert limiter.stats == {"requests": 1, "timeouts": 0, "rejections": 1, "lowest_limit": 9, "highest_limit": 10}
+
+    async def test_slow_request(self) -> None:
+        """Test that a request slower than the average latency decreases the limit."""
+        limiter = AntaAdaptiveLimiter("device", initial_limit=10, max_limit=10, latency_tolerance=2.0)
+        limiter._on_success(0.1, epoch=0)
+        limiter._on_success(1.0, epoch=0)
+        assert limiter.limit == 9
+
+    async def test_limit_and_parent(self) -> None:
+        """Test that the concurrent requests are bounded by the limiter and its parent."""
+        parent = AntaAdaptiveLimiter("global", initial_limit=3, max_limit=3)
+        limiters = [AntaAdaptiveLimiter(f"device-{i}", initial_limit=2, max_limit=2, parent=parent) for i in range(2)]
+        running: dict[str, int] = {"global": 0, "device-0": 0, "device-1": 0}
+        peak: dict[str, int] = dict.fromkeys(running, 0)
+
+        async def request(limiter: AntaAdaptiveLimiter) -> None:
+            async with limiter.slot():
+                for name in ("global", limiter.name):
+                    running[name] += 1
+                    peak[name] = max(peak[name], running[name])
+                await asyncio.sleep(0.01)
+                for name in ("global", limiter.name):
+                    running[name] -= 1
+
+        await asyncio.wait_for(asyncio.gather(*(request(limiters[i % 2]) for i in range(10))), timeout=5)
+
+        assert peak == {"global": 3, "device-0": 2, "device-1": 2}
+        assert parent.stats["requests"] == 10
+        assert parent._in_flight == 0
+
+    def test_set_max_limit(self) -> None:
+        """Test that lowering the maximum limit lowers the current limit above it."""
+        limiter = AntaAdaptiveLimiter("global", initial_limit=10, max_limit=10)
+        limiter.set_max_limit(4)
+        assert (limiter.max_limit, limiter.limit) == (4, 4)
+        limiter.set_max_limit(0)
+        assert (limiter.max_limit, limiter.limit) == (1, 1)
+        limiter.set_max_limit(8)
+        assert (limiter.max_limit, limiter.limit) == (8, 1)
+
+    async def test_cancelled_waiter(self) -> None:
+        """Test that a cancelled waiter does not leak a slot."""
+        limiter = AntaAdaptiveLimiter("device", initial_limit=1, max_limit=1)
+        release = asyncio.Event()
+
+        async def request() -> None:
+            async with limiter.slot():
+                await release.wait()
+
+        holder = asyncio.create_task(request())
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(request())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        release.set()
+        await holder
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert limiter._in_flight == 0
+        await asyncio.wait_for(request(), timeout=1)
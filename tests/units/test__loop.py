@@ -0,0 +1,54 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Test anta._loop.py."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from anta._loop import run
+from anta.settings import AntaRunnerSettings
+
+
+async def loop_info() -> tuple[str, float, str]:
+    """Return the module of the event loop class, the slow callback duration and the name of a default executor thread."""
+    loop = asyncio.get_running_loop()
+    thread_name = await loop.run_in_executor(None, lambda: threading.current_thread().name)
+    return type(loop).__module__, loop.slow_callback_duration, thread_name
+
+
+def test_run_asyncio() -> None:
+    """Test that run() applies the loop settings to the asyncio event loop."""
+    module, slow_callback_duration, thread_name = run(loop_info(), AntaRunnerSettings(executor_workers=2, slow_callback_duration=0.5))
+    assert module.startswith("asyncio")
+    assert slow_callback_duration == 0.5
+    assert thread_name.startswith("anta")
+
+
+def test_run_default_settings() -> None:
+    """Test that run() keeps the asyncio defaults of the event loop."""
+    module, slow_callback_duration, thread_name = run(loop_info())
+    assert module.startswith("asyncio")
+    assert slow_callback_duration == 0.1
+    assert not thread_name.startswith("anta")
+
+
+def test_run_uvloop() -> None:
+    """Test that run() uses the uvloop event loop."""
+    pytest.importorskip("uvloop")
+    module, _, _ = run(loop_info(), AntaRunnerSettings(event_loop="uvloop"))
+    assert module.startswith("uvloop")
+
+
+def test_run_uvloop_not_installed(caplog: pytest.LogCaptureFixture) -> None:
+    """Test that run() falls back to the asyncio event loop when uvloop is not installed."""
+    with patch.dict(sys.modules, {"uvloop": None}):
+        module, _, _ = run(loop_info(), AntaRunnerSettings(event_loop="uvloop"))
+    assert module.startswith("asyncio")
+    assert "uvloop is not installed, using the asyncio event loop. Install it with `pip install anta[uvloop]`." in caplog.messages
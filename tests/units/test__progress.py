@@ -0,0 +1,77 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Test anta._progress.py."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from anta._progress import AntaProgress, AntaProgressUpdate
+
+if TYPE_CHECKING:
+    import pytest
+
+
+class TestAntaProgress:
+    """Test AntaProgress class."""
+
+    def test_report(self) -> None:
+        """Test that the progress is only reported when it changed."""
+        updates: list[AntaProgressUpdate] = []
+        progress = AntaProgress(updates.append)
+        progress.report()
+        progress.schedule("leaf1", 3)
+        progress.schedule("leaf2", 2)
+        progress.advance("leaf1")
+        progress.advance("leaf2", 2)
+        progress.report()
+        progress.report()
+        progress.schedule("leaf1", -2)
+        progress.report()
+        assert updates == [AntaProgressUpdate(completed=3, total=5), AntaProgressUpdate(completed=3, total=3)]
+
+    def test_report_per_device(self) -> None:
+        """Test that the progress of each device is reported."""
+        updates: list[AntaProgressUpdate] = []
+        progress = AntaProgress(updates.append, per_device=True)
+        progress.schedule("leaf1", 3)
+        progress.schedule("leaf2", 2)
+        progress.advance("leaf1")
+        progress.advance()
+        progress.report()
+        assert updates == [AntaProgressUpdate(completed=2, total=5, devices={"leaf1": (1, 3), "leaf2": (0, 2)})]
+
+    def test_report_callback_exception(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test that an exception raised by the callback is logged."""
+
+        def callback(_: AntaProgressUpdate) -> None:
+            msg = "boom"
+            raise ValueError(msg)
+
+        progress = AntaProgress(callback)
+        progress.advance()
+        progress.report()
+        assert "Exception raised by the progress callback\nValueError: boom" in caplog.messages
+
+    async def test_execution(self) -> None:
+        """Test that concurrent executions share the periodic report and that the progress is reported when they end."""
+        updates: list[AntaProgressUpdate] = []
+        progress = AntaProgress(updates.append, interval=0.01)
+        progress.schedule("leaf1", 2)
+
+        async def execute() -> None:
+            async with progress.execution():
+                await asyncio.sleep(0.05)
+                progress.advance("leaf1")
+
+        async with progress.execution():
+            reporter = progress._reporter
+            await asyncio.gather(execute(), execute())
+            assert progress._reporter is reporter
+            assert updates[0] == AntaProgressUpdate(completed=0, total=2)
+        assert progress._reporter is None
+        assert reporter is not None
+        assert reporter.cancelled()
+        assert updates[-1] == AntaProgressUpdate(completed=2, total=2)
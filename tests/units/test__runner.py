@@ -5,25 +5,50 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
 import os
+import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import aclosing
+from functools import partial
 from pathlib import Path
-from typing import ClassVar
+from typing import Any, ClassVar
 from unittest.mock import AsyncMock, patch
 
 import pytest
 import respx
+from httpx import ConnectTimeout
 from pydantic import ValidationError
 
-from anta._runner import AntaRunContext, AntaRunFilters, AntaRunner
+from anta._runner import AntaCostPlan, AntaRunContext, AntaRunFilters, AntaRunner, AntaStatusChange
+from anta._scheduler import AntaDurationHistory
 from anta.catalog import AntaCatalog, AntaTestDefinition
-from anta.device import AsyncEOSDevice
+from anta.device import MAX_CONCURRENT_REQUESTS, AntaDevice, AsyncEOSDevice
 from anta.inventory import AntaInventory
 from anta.models import AntaCommand, AntaTemplate, AntaTest
 from anta.result_manager import ResultManager
 from anta.result_manager.models import TestResult as AntaTestResult
-from anta.settings import DEFAULT_MAX_CONCURRENCY, DEFAULT_NOFILE, AntaRunnerSettings
+from anta.settings import (
+    DEFAULT_ADAPTIVE_CONCURRENCY,
+    DEFAULT_CIRCUIT_BREAKER_COOLDOWN,
+    DEFAULT_CIRCUIT_BREAKER_THRESHOLD,
+    DEFAULT_DURATIONS_FILE,
+    DEFAULT_EVENT_LOOP,
+    DEFAULT_EXECUTOR_WORKERS,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_NOFILE,
+    DEFAULT_PIPELINED_CONNECT,
+    DEFAULT_PREFETCH,
+    DEFAULT_RUN_DEADLINE,
+    DEFAULT_SCHEDULE,
+    DEFAULT_SHARDS,
+    DEFAULT_SLOW_CALLBACK_DURATION,
+    DEFAULT_TEST_TIMEOUT,
+    AntaRunnerSettings,
+)
 from anta.tests.routing.generic import VerifyRoutingTableEntry
 from tests.units.test_models import FakeTest
 
@@ -37,7 +62,23 @@ class TestAntaRunner:
     def test_init_with_default_settings(self, caplog: pytest.LogCaptureFixture) -> None:
         """Test initialization with default settings."""
         caplog.set_level(logging.DEBUG)
-        default_settings = {"nofile": DEFAULT_NOFILE, "max_concurrency": DEFAULT_MAX_CONCURRENCY}
+        default_settings = {
+            "nofile": DEFAULT_NOFILE,
+            "max_concurrency": DEFAULT_MAX_CONCURRENCY,
+            "prefetch": DEFAULT_PREFETCH,
+            "shards": DEFAULT_SHARDS,
+            "adaptive_concurrency": DEFAULT_ADAPTIVE_CONCURRENCY,
+            "schedule": DEFAULT_SCHEDULE,
+            "durations_file": DEFAULT_DURATIONS_FILE,
+            "pipelined_connect": DEFAULT_PIPELINED_CONNECT,
+            "circuit_breaker_threshold": DEFAULT_CIRCUIT_BREAKER_THRESHOLD,
+            "circuit_breaker_cooldown": DEFAULT_CIRCUIT_BREAKER_COOLDOWN,
+            "run_deadline": DEFAULT_RUN_DEADLINE,
+            "test_timeout": DEFAULT_TEST_TIMEOUT,
+            "event_loop": DEFAULT_EVENT_LOOP,
+            "executor_workers": DEFAULT_EXECUTOR_WORKERS,
+            "slow_callback_duration": DEFAULT_SLOW_CALLBACK_DURATION,
+        }
 
         runner = AntaRunner()
 
@@ -47,9 +88,38 @@ class TestAntaRunner:
     def test_init_with_custom_env_settings(self, caplog: pytest.LogCaptureFixture, setenvvar: pytest.MonkeyPatch) -> None:
         """Test initialization with custom env settings."""
         caplog.set_level(logging.DEBUG)
-        desired_settings = {"nofile": 1048576, "max_concurrency": 10000}
+        desired_settings = {
+            "nofile": 1048576,
+            "max_concurrency": 10000,
+            "prefetch": True,
+            "shards": 4,
+            "adaptive_concurrency": True,
+            "schedule": "historical",
+            "durations_file": Path("/tmp/durations.json"),
+            "pipelined_connect": True,
+            "circuit_breaker_threshold": 3,
+            "circuit_breaker_cooldown": 30.0,
+            "run_deadline": 600.0,
+            "test_timeout": 60.0,
+            "event_loop": "uvloop",
+            "executor_workers": 64,
+            "slow_callback_duration": 0.5,
+        }
         setenvvar.setenv("ANTA_NOFILE", str(desired_settings["nofile"]))
         setenvvar.setenv("ANTA_MAX_CONCURRENCY", str(desired_settings["max_concurrency"]))
+        setenvvar.setenv("ANTA_PREFETCH", str(desired_settings["prefetch"]))
+        setenvvar.setenv("ANTA_SHARDS", str(desired_settings["shards"]))
+        setenvvar.setenv("ANTA_ADAPTIVE_CONCURRENCY", str(desired_settings["adaptive_concurrency"]))
+        setenvvar.setenv("ANTA_SCHEDULE", str(desired_settings["schedule"]))
+        setenvvar.setenv("ANTA_DURATIONS_FILE", str(desired_settings["durations_file"]))
+        setenvvar.setenv("ANTA_PIPELINED_CONNECT", str(desired_settings["pipelined_connect"]))
+        setenvvar.setenv("ANTA_CIRCUIT_BREAKER_THRESHOLD", str(desired_settings["circuit_breaker_threshold"]))
+        setenvvar.setenv("ANTA_CIRCUIT_BREAKER_COOLDOWN", str(desired_settings["circuit_breaker_cooldown"]))
+        setenvvar.setenv("ANTA_RUN_DEADLINE", str(desired_settings["run_deadline"]))
+        setenvvar.setenv("ANTA_TEST_TIMEOUT", str(desired_settings["test_timeout"]))
+        setenvvar.setenv("ANTA_EVENT_LOOP", str(desired_settings["event_loop"]))
+        setenvvar.setenv("ANTA_EXECUTOR_WORKERS", str(desired_settings["executor_workers"]))
+        setenvvar.setenv("ANTA_SLOW_CALLBACK_DURATION", str(desired_settings["slow_callback_duration"]))
 
         runner = AntaRunner()
 
@@ -87,6 +157,70 @@ class TestAntaRunner:
 
         assert "Dry-run mode, exiting before running the tests." in caplog.messages
 
+    @pytest.mark.parametrize(
+        ("device_params", "prefetch", "expected_requests"),
+        [
+            pytest.param({}, False, 2, id="cache"),
+            pytest.param({"disable_cache": True}, False, 3, id="no-cache"),
+            pytest.param({"disable_cache": True}, True, 2, id="no-cache-prefetch"),
+            pytest.param({"batch_window": 0.01}, False, 1, id="batching"),
+        ],
+    )
+    async def test_dry_run_cost_plan(
+        self, caplog: pytest.LogCaptureFixture, tmp_path: Path, device_params: dict[str, Any], *, prefetch: bool, expected_requests: int
+    ) -> None:
+        """Test that AntaRunner.run() in dry-run estimates the cost of the selected tests."""
+        caplog.set_level(logging.INFO)
+
+        class VersionClockTest(AntaTest):
+            """ANTA test collecting a cached and a non-cached command."""
+
+            categories: ClassVar[list[str]] = []
+            commands: ClassVar[list[AntaCommand | AntaTemplate]] = [AntaCommand(command="show version"), AntaCommand(command="show clock", use_cache=False)]
+
+            @AntaTest.anta_test
+            def test(self) -> None:
+                """Test function."""
+
+        class VersionTest(AntaTest):
+            """ANTA test collecting a command shared with another test."""
+
+            categories: ClassVar[list[str]] = []
+            commands: ClassVar[list[AntaCommand | AntaTemplate]] = [AntaCommand(command="show version")]
+
+            @AntaTest.anta_test
+            def test(self) -> None:
+                """Test function."""
+
+        class BlockedTest(AntaTest):
+            """ANTA test with a blocked command."""
+
+            categories: ClassVar[list[str]] = []
+            commands: ClassVar[list[AntaCommand | AntaTemplate]] = [AntaCommand(command="reload")]
+
+            @AntaTest.anta_test
+            def test(self) -> None:
+                """Test function."""
+
+        device = AsyncEOSDevice(host="device.example.com", username="admin", password="password", name="device", **device_params)
+        inventory = AntaInventory()
+        inventory.add_device(device)
+        catalog = AntaCatalog.from_list([(VersionClockTest, None), (VersionTest, None), (BlockedTest, None)])
+        durations_file = tmp_path / "durations.json"
+        history = AntaDurationHistory(durations_file)
+        history.record(device, next(test_def for test_def in catalog.tests if test_def.test is VersionClockTest), 1.5)
+        history.save()
+        runner = AntaRunner(settings=AntaRunnerSettings(prefetch=prefetch, durations_file=durations_file))
+
+        ctx = await runner.run(inventory, catalog, dry_run=True)
+
+        assert ctx.cost_plans["device"] == AntaCostPlan(
+            tests=3, commands=3, unique_commands=2, requests=expected_requests, expected_duration=1.5, tests_with_history=1
+        )
+        assert ctx.total_cost_plan == ctx.cost_plans["device"]
+        assert f"Cost plan: 3 command(s) rendered, 2 unique command(s), {expected_requests} eAPI request(s) predicted across 1 device(s)" in caplog.messages
+        assert "Cumulated test duration from the previous runs: 0:00:01.500 (1/3 tests with history)" in caplog.messages
+
     @pytest.mark.parametrize(
         ("filters", "expected_devices", "expected_tests"),
         [
@@ -374,7 +508,7 @@ class TestAntaRunner:
 
         with (
             patch.object(device, "refresh", new=AsyncMock(side_effect=refresh)),
-            patch.object(runner, "_get_test_coroutines", return_value=[raise_during_execution()]),
+            patch.object(runner, "_create_test_coroutine", side_effect=lambda *_: raise_during_execution()),
             pytest.raises(RuntimeError, match="test execution failed"),
         ):
             await runner.run(inventory, catalog, disconnect=True)
@@ -530,6 +664,758 @@ class TestAntaRunner:
         for result in ctx.manager.results:
             assert result.result == "failure"
 
+    @pytest.mark.parametrize(("inventory"), [{"count": 2}], indirect=True)
+    async def test_run_lazy_test_instantiation(self, inventory: AntaInventory) -> None:
+        """Test that AntaRunner.run() only instantiates tests when a concurrency slot is available."""
+
+        class CountingTest(AntaTest):
+            """ANTA test counting the live instances."""
+
+            categories: ClassVar[list[str]] = []
+            commands: ClassVar[list[AntaCommand | AntaTemplate]] = []
+            live: ClassVar[int] = 0
+            peak: ClassVar[int] = 0
+
+            def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+                super().__init__(*args, **kwargs)
+                CountingTest.live += 1
+                CountingTest.peak = max(CountingTest.peak, CountingTest.live)
+
+            @AntaTest.anta_test
+            def test(self) -> None:
+                """Test function."""
+                CountingTest.live -= 1
+                self.result.is_success()
+
+        catalog = AntaCatalog.from_list([(CountingTest, {"result_overwrite": {"custom_field": str(i)}}) for i in range(10)])
+        runner = AntaRunner(settings=AntaRunnerSettings(max_concurrency=3))
+
+        ctx = await runner.run(inventory, catalog)
+
+        assert len(ctx.manager) == 20
+        assert ctx.manager.status == "success"
+        assert CountingTest.peak <= 3
+
+    @pytest.mark.parametrize(
+        ("inventory", "errors", "expected_status"),
+        [
+            pytest.param({"count": 2}, [], "success", id="output"),
+            pytest.param({"count": 2}, ["BGP inactive"], "failure", id="errors"),
+        ],
+        indirect=["inventory"],
+    )
+    async def test_run_prefetch(self, inventory: AntaInventory, errors: list[str], expected_status: str) -> None:
+        """Test that AntaRunner.run() collects the commands shared by the tests once per device when prefetch is enabled."""
+
+        class SharedCommandTest(AntaTest):
+            """ANTA test with a command shared by all its instances."""
+
+            categories: ClassVar[list[str]] = []
+            commands: ClassVar[list[AntaCommand | AntaTemplate]] = [
+                AntaCommand(command="show bgp summary"),
+                AntaCommand(command="show interfaces counters", use_cache=False),
+            ]
+
+            @AntaTest.anta_test
+            def test(self) -> None:
+                """Test function."""
+                self.result.is_success()
+
+        collected: list[tuple[str, str, str | None]] = []
+
+        async def collect(self: AntaDevice, command: AntaCommand, *, collection_id: str | None = None) -> None:
+            collected.append((self.name, command.command, collection_id))
+            if command.command == "show bgp summary" and errors:
+                command.errors = errors
+            else:
+                command.output = {}
+
+        catalog = AntaCatalog.from_list([(SharedCommandTest, {"result_overwrite": {"custom_field": str(i)}}) for i in range(5)])
+        runner = AntaRunner(settings=AntaRunnerSettings(prefetch=True))
+
+        with patch.object(AntaDevice, "collect", collect):
+            ctx = await runner.run(inventory, catalog)
+
+        assert len(ctx.manager) == 10
+        assert ctx.manager.status == expected_status
+        assert sorted(item for item in collected if item[1] == "show bgp summary") == [
+            ("device-0", "show bgp summary", "prefetch"),
+            ("device-1", "show bgp summary", "prefetch"),
+        ]
+        # Commands with use_cache disabled are collected by each test
+        if not errors:
+            assert len([item for item in collected if item[1] == "show interfaces counters"]) == 10
+        assert not ctx.prefetched_commands
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 2}], indirect=True)
+    async def test_run_adaptive_concurrency(self, caplog: pytest.LogCaptureFixture, inventory: AntaInventory) -> None:
+        """Test that AntaRunner.run() reports the adaptive concurrency limits and detaches the limiters."""
+        caplog.set_level(logging.INFO)
+        catalog = AntaCatalog.from_list([(FakeTest, {"result_overwrite": {"custom_field": str(i)}}) for i in range(3)])
+        runner = AntaRunner(settings=AntaRunnerSettings(adaptive_concurrency=True, max_concurrency=20))
+
+        ctx = await runner.run(inventory, catalog)
+
+        assert len(ctx.manager) == 6
+        assert set(ctx.concurrency_limits) == {"device-0", "device-1"}
+        assert ctx.concurrency_limits["device-0"]["limit"] == 10
+        assert ctx.global_concurrency_limit is not None
+        assert ctx.global_concurrency_limit["limit"] == 20
+        assert all(device.limiter is None for device in inventory.devices)
+        assert "Adaptive concurrency limit for the run: 20 (lowest: 20, highest: 20), 0 timeout(s), 0 rejection(s) / 0 request(s)" in caplog.messages
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 2}], indirect=True)
+    async def test_run_historical_schedule(self, inventory: AntaInventory, tmp_path: Path) -> None:
+        """Test that AntaRunner.run() dispatches the longest tests of the previous runs first and records the durations."""
+        catalog = AntaCatalog.from_list([(FakeTest, {"result_overwrite": {"custom_field": str(i)}}) for i in range(3)])
+        durations_file = tmp_path / "durations.json"
+        history = AntaDurationHistory(durations_file)
+        test_definitions = sorted(catalog.tests, key=lambda test_def: str(test_def.inputs.result_overwrite))
+        for device in inventory.devices:
+            for duration, test_def in enumerate(test_definitions):
+                history.record(device, test_def, duration)
+        history.save()
+        runner = AntaRunner(settings=AntaRunnerSettings(schedule="historical", durations_file=durations_file, max_concurrency=1))
+
+        ctx = await runner.run(inventory, catalog)
+
+        assert [result.custom_field for result in ctx.manager.results] == ["2", "2", "1", "1", "0", "0"]
+        durations = json.loads(durations_file.read_text(encoding="UTF-8"))
+        assert set(durations) == {"device-0", "device-1"}
+        # The new durations are averaged with the previous ones
+        assert max(durations["device-0"].values()) < 2
+
+    async def test_run_timings(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test that AntaRunner.run() records the timings of the test phases and aggregates them in the run context."""
+        caplog.set_level(logging.DEBUG)
+        device = AsyncEOSDevice(host="device.example.com", username="admin", password="password", name="device")
+        inventory = AntaInventory()
+        inventory.add_device(device)
+
+        class VersionTest(AntaTest):
+            """ANTA test collecting a command."""
+
+            categories: ClassVar[list[str]] = []
+            commands: ClassVar[list[AntaCommand | AntaTemplate]] = [AntaCommand(command="show version")]
+
+            @AntaTest.anta_test
+            def test(self) -> None:
+                """Test function."""
+                self.result.is_success()
+
+        async def cli(**_kwargs: object) -> list[dict[str, Any]]:
+            await asyncio.sleep(0.01)
+            return [{"modelName": "pytest"}]
+
+        catalog = AntaCatalog.from_list([(VersionTest, {"result_overwrite": {"custom_field": str(i)}}) for i in range(2)])
+        runner = AntaRunner(settings=AntaRunnerSettings(max_concurrency=1))
+
+        async def refresh() -> None:
+            device.is_online = True
+            device.established = True
+
+        with patch.object(device, "refresh", new=AsyncMock(side_effect=refresh)), patch.object(device._client, "cli", side_effect=cli):
+            ctx = await runner.run(inventory, catalog)
+
+        first, second = ctx.manager.results
+        assert first.timings.setup > 0
+        assert first.timings.evaluation > 0
+        assert first.timings.collection >= first.timings.network >= 0.01
+        assert first.timings.commands["show version"].cache_hit is False
+        assert second.timings.commands["show version"].cache_hit is True
+        # The queued time only covers the wait for the concurrency budget of run_many(), not the scheduler queue
+        assert second.timings.queued < first.timings.duration
+        statistics = ctx.timing_statistics
+        assert (statistics["cache_hits"], statistics["cache_misses"]) == (1, 1)
+        assert statistics["network"] == first.timings.network
+        assert ctx.slowest_tests(count=1) == [first]
+        assert ctx.slowest_devices() == [("device", first.timings.duration + second.timings.duration)]
+        assert ctx.slowest_commands() == [("device", "show version", first.timings.network)]
+        assert any(message.startswith("Cumulated test timings: setup") for message in caplog.messages)
+        assert any(message.startswith("Slowest command: 'show version' on device") for message in caplog.messages)
+
+        # The statistics of a run ignore the results of the previous runs held by the ResultManager
+        with patch.object(device, "refresh", new=AsyncMock(side_effect=refresh)), patch.object(device._client, "cli", side_effect=cli):
+            ctx = await runner.run(inventory, catalog, result_manager=ctx.manager)
+
+        assert len(ctx.manager) == 4
+        assert ctx.results == ctx.manager.results[2:]
+        assert sorted(ctx.slowest_tests(), key=ctx.results.index) == ctx.results
+        assert ctx.slowest_devices() == [("device", sum(result.timings.duration for result in ctx.results))]
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 2}], indirect=True)
+    async def test_run_from_results(self, inventory: AntaInventory) -> None:
+        """Test that AntaRunner.run() with filters built from previous results only runs the selected test instances."""
+        catalog = AntaCatalog.from_list([(FakeTest, {"result_overwrite": {"custom_field": str(i)}}) for i in range(3)])
+        runner = AntaRunner()
+        previous = await runner.run(inventory, catalog)
+        assert all(result.inputs_uid is not None for result in previous.manager.results)
+        for result in previous.manager.results:
+            if (result.name, result.custom_field) == ("device-0", "1"):
+                result.is_failure()
+            elif (result.name, result.custom_field) == ("device-1", "2"):
+                result.is_error()
+
+        filters = AntaRunFilters.from_results(previous.manager.results)
+        ctx = await runner.run(inventory, catalog, filters=filters)
+
+        assert sorted((result.name, result.custom_field) for result in ctx.manager.results) == [("device-0", "1"), ("device-1", "2")]
+
+        # Results without inputs uid match all the instances of the test
+        filters = AntaRunFilters.from_results([AntaTestResult(name="device-0", test="FakeTest", categories=[], description="", result="failure")])
+        ctx = await runner.run(inventory, catalog, filters=filters)
+
+        assert sorted((result.name, result.custom_field) for result in ctx.manager.results) == [("device-0", "0"), ("device-0", "1"), ("device-0", "2")]
+
+    async def test_run_shutdown_decode_executor(self, inventory: AntaInventory) -> None:
+        """Test that the decoding process pool is shut down once the run completes, after all the concurrent runs of run_many()."""
+        catalog = AntaCatalog.from_list([(FakeTest, None)])
+        runner = AntaRunner()
+        with patch("anta._runner.shutdown_decode_executor") as shutdown_mock:
+            await runner.run(inventory, catalog)
+            shutdown_mock.assert_called_once_with()
+            shutdown_mock.reset_mock()
+            await runner.run_many(inventory, [(catalog, None), (catalog, None)])
+            shutdown_mock.assert_called_once_with()
+
+    async def test_run_save_session_store(self, inventory: AntaInventory) -> None:
+        """Test that the session store is saved once the run completes, once for all the concurrent runs of run_many()."""
+        catalog = AntaCatalog.from_list([(FakeTest, None)])
+        runner = AntaRunner()
+        with patch("anta._runner.save_session_store", new_callable=AsyncMock) as save_mock:
+            await runner.run(inventory, catalog)
+            save_mock.assert_awaited_once_with()
+            save_mock.reset_mock()
+            await runner.run_many(inventory, [(catalog, None), (catalog, None)])
+            save_mock.assert_awaited_once_with()
+
+    async def test_run_periodic(self) -> None:
+        """Test that AntaRunner.run_periodic() reuses the connected devices and yields the status changes of each iteration."""
+        device = AsyncEOSDevice(host="device.example.com", username="admin", password="password", name="device")
+        inventory = AntaInventory()
+        inventory.add_device(device)
+        statuses = iter(["success", "success", "failure"])
+
+        class ToggleTest(AntaTest):
+            """ANTA test with a status changing across runs."""
+
+            categories: ClassVar[list[str]] = []
+            commands: ClassVar[list[AntaCommand | AntaTemplate]] = []
+
+            @AntaTest.anta_test
+            def test(self) -> None:
+                """Test function."""
+                if next(statuses) == "success":
+                    self.result.is_success()
+                else:
+                    self.result.is_failure("Changed")
+
+        async def refresh() -> None:
+            device.is_online = True
+            device.established = True
+
+        catalog = AntaCatalog.from_list([(ToggleTest, None)])
+        runner = AntaRunner()
+        iterations: list[tuple[AntaRunContext, list[AntaStatusChange]]] = []
+
+        with patch.object(device, "refresh", new=AsyncMock(side_effect=refresh)) as refresh_mock:
+            async with aclosing(runner.run_periodic(inventory, catalog, interval=0.01, iterations=3)) as periodic:
+                async for iteration in periodic:
+                    assert not device._client.is_closed
+                    iterations.append(iteration)
+
+        refresh_mock.assert_awaited_once()
+        assert device._client.is_closed
+        assert len(iterations) == 3
+        assert all(len(ctx.manager) == 1 for ctx, _ in iterations)
+        first, second, third = (changes for _, changes in iterations)
+        assert [(change.previous, change.result.result) for change in first] == [(None, "success")]
+        assert second == []
+        assert [(change.previous, change.result.result) for change in third] == [("success", "failure")]
+
+    async def test_run_periodic_same_test_inputs(self) -> None:
+        """Test that AntaRunner.run_periodic() tracks the status of each inputs of a test separately."""
+        device = AsyncEOSDevice(host="device.example.com", username="admin", password="password", name="device")
+        inventory = AntaInventory()
+        inventory.add_device(device)
+        statuses = {1: iter(["success", "success", "failure"]), 2: iter(["success", "failure", "failure"])}
+
+        class ToggleTest(AntaTest):
+            """ANTA test with a status changing across runs per inputs."""
+
+            categories: ClassVar[list[str]] = []
+            commands: ClassVar[list[AntaCommand | AntaTemplate]] = []
+
+            class Input(AntaTest.Input):
+                """Inputs for the test."""
+
+                value: int
+
+            @AntaTest.anta_test
+            def test(self) -> None:
+                """Test function."""
+                if next(statuses[self.inputs.value]) == "success":
+                    self.result.is_success()
+                else:
+                    self.result.is_failure("Changed")
+
+        async def refresh() -> None:
+            device.is_online = True
+            device.established = True
+
+        catalog = AntaCatalog.from_list([(ToggleTest, {"value": 1}), (ToggleTest, {"value": 2})])
+        runner = AntaRunner()
+        uids = {definition.inputs.uid: definition.inputs.value for definition in catalog.tests}  # type: ignore[attr-defined]
+        changes: list[list[tuple[int, str | None, str]]] = []
+
+        with patch.object(device, "refresh", new=AsyncMock(side_effect=refresh)):
+            async with aclosing(runner.run_periodic(inventory, catalog, interval=0.01, iterations=3)) as periodic:
+                async for ctx, iteration_changes in periodic:
+                    assert len(ctx.manager) == 2
+                    changes.append(sorted((uids[change.result.inputs_uid], change.previous, change.result.result) for change in iteration_changes))
+
+        assert changes == [
+            [(1, None, "success"), (2, None, "success")],
+            [(2, "success", "failure")],
+            [(1, "success", "failure")],
+        ]
+
+    async def test_run_many(self) -> None:
+        """Test that AntaRunner.run_many() connects the devices once and shares their cache and the concurrency budget across the runs."""
+        devices = [AsyncEOSDevice(host=f"{name}.example.com", username="admin", password="password", name=name) for name in ("leaf1", "leaf2")]
+        inventory = AntaInventory()
+        for device in devices:
+            inventory.add_device(device)
+        running: list[int] = [0, 0]
+
+        class VersionTest(AntaTest):
+            """ANTA test collecting a command."""
+
+            categories: ClassVar[list[str]] = []
+            commands: ClassVar[list[AntaCommand | AntaTemplate]] = [AntaCommand(command="show version")]
+
+            @AntaTest.anta_test
+            def test(self) -> None:
+                """Test function."""
+                self.result.is_success()
+
+        class ModelTest(VersionTest):
+            """Other ANTA test collecting the same command."""
+
+            name: ClassVar[str] = "ModelTest"
+
+        async def cli(**_kwargs: object) -> list[dict[str, Any]]:
+            running[0] += 1
+            running[1] = max(running)
+            await asyncio.sleep(0.01)
+            running[0] -= 1
+            return [{"modelName": "pytest"}]
+
+        async def refresh(device: AntaDevice) -> None:
+            device.is_online = True
+            device.established = True
+
+        runs: list[tuple[AntaCatalog, AntaRunFilters | None]] = [
+            (AntaCatalog.from_list([(VersionTest, None)]), AntaRunFilters(devices={"leaf1"})),
+            (AntaCatalog.from_list([(ModelTest, None)]), None),
+        ]
+        runner = AntaRunner(settings=AntaRunnerSettings(max_concurrency=1))
+        with (
+            patch.object(devices[0], "refresh", new=AsyncMock(side_effect=partial(refresh, devices[0]))) as refresh1,
+            patch.object(devices[1], "refresh", new=AsyncMock(side_effect=partial(refresh, devices[1]))) as refresh2,
+            patch.object(devices[0]._client, "cli", side_effect=cli) as cli1,
+            patch.object(devices[1]._client, "cli", side_effect=cli) as cli2,
+        ):
+            version_ctx, model_ctx = await runner.run_many(inventory, runs, disconnect=True)
+
+        refresh1.assert_awaited_once()
+        refresh2.assert_awaited_once()
+        assert cli1.call_count == cli2.call_count == 1
+        assert running[1] == 1
+        assert [(result.name, result.test, result.result) for result in version_ctx.manager.results] == [("leaf1", "VersionTest", "success")]
+        assert sorted((result.name, result.test, result.result) for result in model_ctx.manager.results) == [
+            ("leaf1", "ModelTest", "success"),
+            ("leaf2", "ModelTest", "success"),
+        ]
+        assert all(device._client.is_closed for device in devices)
+        assert await runner.run_many(inventory, []) == []
+
+    async def test_run_plan(self) -> None:
+        """Test that AntaRunner.run_plan() renders the commands of the prepared tests once and resets their outputs and results for each run."""
+        device = AsyncEOSDevice(host="device.example.com", username="admin", password="password", name="device", disable_cache=True)
+        inventory = AntaInventory()
+        inventory.add_device(device)
+        renders: list[str] = []
+        outputs = iter([[{"vlans": {}}], [{"vlans": {"10": {}}}]])
+
+        class VlanTest(AntaTest):
+            """ANTA test rendering a command template."""
+
+            categories: ClassVar[list[str]] = []
+            commands: ClassVar[list[AntaCommand | AntaTemplate]] = [AntaTemplate(template="show vlan {vlan}")]
+
+            class Input(AntaTest.Input):
+                """Inputs for VlanTest test."""
+
+                vlan: int
+
+            def render(self, template: AntaTemplate) -> list[AntaCommand]:
+                """Render function."""
+                renders.append(str(self.inputs.vlan))
+                if self.inputs.vlan > 4094:
+                    msg = "Invalid VLAN"
+                    raise ValueError(msg)
+                return [template.render(vlan=self.inputs.vlan)]
+
+            @AntaTest.anta_test
+            def test(self) -> None:
+                """Test function."""
+                if self.instance_commands[0].json_output["vlans"]:
+                    self.result.is_success()
+                else:
+                    self.result.is_failure("VLAN not found")
+
+        async def refresh() -> None:
+            device.is_online = True
+            device.established = True
+
+        catalog = AntaCatalog.from_list([(VlanTest, {"vlan": 10}), (VlanTest, {"vlan": 5000})])
+        runner = AntaRunner()
+        plan = runner.prepare(inventory, catalog)
+        assert [len(tests) for tests in plan.tests.values()] == [1]
+        with (
+            patch.object(device, "refresh", new=AsyncMock(side_effect=refresh)),
+            patch.object(device._client, "cli", side_effect=lambda **_: next(outputs)),
+        ):
+            first = await runner.run_plan(plan)
+            second = await runner.run_plan(plan)
+
+        # The test failing to render is not prepared and is created by each run
+        assert sorted(renders) == ["10", "5000", "5000", "5000"]
+        assert sorted(result.result for result in first.manager.results) == ["error", "failure"]
+        assert sorted(result.result for result in second.manager.results) == ["error", "success"]
+
+    @pytest.mark.parametrize(
+        ("settings", "tests", "expected"),
+        [
+            pytest.param(
+                {"test_timeout": 0.05},
+                ["OkTest", "HangTest"],
+                [
+                    ("HangTest", "error", ["Test cancelled after exceeding the test timeout of 0.05s"]),
+                    ("OkTest", "success", []),
+                ],
+                id="test-timeout",
+            ),
+            pytest.param(
+                {"run_deadline": 0.05},
+                ["HangTest", "HangTest"],
+                [
+                    ("HangTest", "error", ["Test cancelled after exceeding the run deadline of 0.05s"]),
+                    ("HangTest", "unset", ["Test not run, the run deadline of 0.05s was exceeded"]),
+                ],
+                id="run-deadline",
+            ),
+        ],
+    )
+    async def test_run_timeouts(self, settings: dict[str, Any], tests: list[str], expected: list[tuple[str, str, list[str]]]) -> None:
+        """Test that AntaRunner.run() cancels the tests exceeding the test timeout or the run deadline."""
+        device = AsyncEOSDevice(host="device.example.com", username="admin", password="password", name="device")
+        inventory = AntaInventory()
+        inventory.add_device(device)
+
+        class OkTest(AntaTest):
+            """ANTA test collecting a command."""
+
+            categories: ClassVar[list[str]] = []
+            commands: ClassVar[list[AntaCommand | AntaTemplate]] = [AntaCommand(command="show version")]
+
+            @AntaTest.anta_test
+            def test(self) -> None:
+                """Test function."""
+                self.result.is_success()
+
+        class HangTest(OkTest):
+            """ANTA test collecting a command that never completes."""
+
+            name: ClassVar[str] = "HangTest"
+            commands: ClassVar[list[AntaCommand | AntaTemplate]] = [AntaCommand(command="show hang", use_cache=False)]
+
+        async def cli(**kwargs: object) -> list[dict[str, Any]]:
+            if "show hang" in str(kwargs["commands"]):
+                await asyncio.sleep(10)
+            return [{"modelName": "pytest"}]
+
+        async def refresh() -> None:
+            device.is_online = True
+            device.established = True
+
+        test_classes: dict[str, type[AntaTest]] = {"OkTest": OkTest, "HangTest": HangTest}
+        catalog = AntaCatalog.from_list([(test_classes[test], {"result_overwrite": {"custom_field": str(i)}}) for i, test in enumerate(tests)])
+        runner = AntaRunner(settings=AntaRunnerSettings(max_concurrency=1, **settings))
+        with patch.object(device, "refresh", new=AsyncMock(side_effect=refresh)), patch.object(device._client, "cli", side_effect=cli):
+            ctx = await runner.run(inventory, catalog)
+
+        assert sorted((result.test, result.result, result.messages) for result in ctx.manager.results) == expected
+        assert ctx.manager.error_status
+        assert len(json.loads(ctx.manager.json)) == 2
+
+    @pytest.mark.parametrize(
+        ("settings", "hang", "expected", "warning"),
+        [
+            pytest.param({"prefetch": True}, "cli", 1, "Prefetching commands cancelled", id="prefetch"),
+            pytest.param({"pipelined_connect": True}, "refresh", 0, "Connection to device cancelled", id="pipelined-refresh"),
+            pytest.param({"pipelined_connect": True, "prefetch": True}, "cli", 1, "Prefetching commands on device cancelled", id="pipelined-prefetch"),
+        ],
+    )
+    async def test_run_deadline_setup(self, caplog: pytest.LogCaptureFixture, settings: dict[str, Any], hang: str, expected: int, warning: str) -> None:
+        """Test that the run deadline bounds the device connection and the command prefetching."""
+        device = AsyncEOSDevice(host="device.example.com", username="admin", password="password", name="device")
+        inventory = AntaInventory()
+        inventory.add_device(device)
+
+        class VersionTest(AntaTest):
+            """ANTA test collecting a command."""
+
+            categories: ClassVar[list[str]] = []
+            commands: ClassVar[list[AntaCommand | AntaTemplate]] = [AntaCommand(command="show version")]
+
+            @AntaTest.anta_test
+            def test(self) -> None:
+                """Test function."""
+                self.result.is_success()
+
+        async def cli(**_kwargs: object) -> list[dict[str, Any]]:
+            if hang == "cli":
+                await asyncio.sleep(10)
+            return [{"modelName": "pytest"}]
+
+        async def refresh() -> None:
+            if hang == "refresh":
+                await asyncio.sleep(10)
+            device.is_online = True
+            device.established = True
+
+        catalog = AntaCatalog.from_list([(VersionTest, None)])
+        runner = AntaRunner(settings=AntaRunnerSettings(run_deadline=0.1, **settings))
+        start = time.perf_counter()
+        with patch.object(device, "refresh", new=AsyncMock(side_effect=refresh)), patch.object(device._client, "cli", side_effect=cli):
+            ctx = await runner.run(inventory, catalog)
+
+        assert time.perf_counter() - start < 5
+        assert warning in caplog.text
+        not_run = ("unset", ["Test not run, the run deadline of 0.1s was exceeded"])
+        assert [(result.result, result.messages) for result in ctx.manager.results] == [not_run] * expected
+        assert ctx.devices_unreachable_at_setup == ([] if expected else ["device"])
+
+    async def test_run_circuit_breaker(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test that AntaRunner.run() fails fast the tests of a device with consecutive transport failures."""
+        caplog.set_level(logging.INFO)
+        device = AsyncEOSDevice(host="device.example.com", username="admin", password="password", name="device", disable_cache=True)
+        device.established = True
+        inventory = AntaInventory()
+        inventory.add_device(device)
+
+        class ShowVersionTest(AntaTest):
+            """ANTA test collecting `show version`."""
+
+            categories: ClassVar[list[str]] = []
+            commands: ClassVar[list[AntaCommand | AntaTemplate]] = [AntaCommand(command="show version")]
+
+            @AntaTest.anta_test
+            def test(self) -> None:
+                """Test function."""
+                self.result.is_success()
+
+        catalog = AntaCatalog.from_list([(ShowVersionTest, {"result_overwrite": {"custom_field": str(i)}}) for i in range(5)])
+        runner = AntaRunner(settings=AntaRunnerSettings(circuit_breaker_threshold=2, max_concurrency=1))
+
+        with (
+            patch.object(device, "refresh", new=AsyncMock()),
+            patch.object(device._client, "cli", side_effect=ConnectTimeout("Timeout!")) as cli_mock,
+        ):
+            ctx = await runner.run(inventory, catalog)
+
+        assert cli_mock.call_count == 2
+        assert all(result.result == "error" for result in ctx.manager.results)
+        assert [result.messages for result in ctx.manager.results][-1] == [
+            "show version has failed: Circuit breaker open after 2 consecutive transport failures on device, last error: ConnectTimeout: Timeout!"
+        ]
+        assert device.circuit_breaker is None
+        assert "Circuit breaker of device opened 1 time(s) during the run, 3 request(s) failed fast" in caplog.messages
+
+    @pytest.mark.parametrize(("prefetch"), [pytest.param(False, id="no-prefetch"), pytest.param(True, id="prefetch")])
+    async def test_run_pipelined_connect(self, caplog: pytest.LogCaptureFixture, prefetch: bool) -> None:
+        """Test that AntaRunner.run() runs the tests of a connected device while other devices are still connecting."""
+        caplog.set_level(logging.INFO)
+        reachable = AsyncEOSDevice(host="reachable.example.com", username="admin", password="password", name="reachable", disable_cache=True)
+        unreachable = AsyncEOSDevice(host="unreachable.example.com", username="admin", password="password", name="unreachable", disable_cache=True)
+        inventory = AntaInventory()
+        inventory.add_device(reachable)
+        inventory.add_device(unreachable)
+        tested = asyncio.Event()
+
+        class SignalingTest(AntaTest):
+            """ANTA test signaling that it ran."""
+
+            categories: ClassVar[list[str]] = []
+            commands: ClassVar[list[AntaCommand | AntaTemplate]] = []
+
+            @AntaTest.anta_test
+            def test(self) -> None:
+                """Test function."""
+                tested.set()
+                self.result.is_success()
+
+        async def refresh_reachable() -> None:
+            reachable.is_online = True
+            reachable.established = True
+
+        async def refresh_unreachable() -> None:
+            # Only returns once the tests of the reachable device ran
+            await tested.wait()
+            unreachable.is_online = False
+            unreachable.established = False
+
+        catalog = AntaCatalog.from_list([(SignalingTest, {"result_overwrite": {"custom_field": str(i)}}) for i in range(2)])
+        runner = AntaRunner(settings=AntaRunnerSettings(pipelined_connect=True, prefetch=prefetch, adaptive_concurrency=True, max_concurrency=150))
+
+        with (
+            patch.object(reachable, "refresh", new=AsyncMock(side_effect=refresh_reachable)),
+            patch.object(unreachable, "refresh", new=AsyncMock(side_effect=refresh_unreachable)),
+        ):
+            ctx = await asyncio.wait_for(runner.run(inventory, catalog), timeout=5)
+
+        assert len(ctx.manager) == 2
+        assert {result.name for result in ctx.manager.results} == {"reachable"}
+        assert list(ctx.selected_inventory) == ["reachable"]
+        assert ctx.devices_unreachable_at_setup == ["unreachable"]
+        assert list(ctx.selected_tests) == [reachable]
+        # The run information is logged once the devices are connected
+        assert "1 devices found unreachable after connection attempts: unreachable" in caplog.messages
+        assert "1 devices selected for testing" in caplog.messages
+        assert "2 devices selected for testing" not in caplog.messages
+        # The run-wide limit is lowered to the limit of the reachable device
+        assert ctx.global_concurrency_limit is not None
+        assert ctx.global_concurrency_limit["limit"] == MAX_CONCURRENT_REQUESTS
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 2, "reachable": False}], indirect=True)
+    async def test_run_pipelined_connect_no_reachable_devices(self, caplog: pytest.LogCaptureFixture, inventory: AntaInventory) -> None:
+        """Test AntaRunner.run() with the pipelined connection and no reachable devices."""
+        catalog = AntaCatalog.from_list([(FakeTest, None)])
+        runner = AntaRunner(settings=AntaRunnerSettings(pipelined_connect=True))
+
+        ctx = await asyncio.wait_for(runner.run(inventory, catalog), timeout=5)
+
+        assert len(ctx.manager) == 0
+        assert ctx.devices_unreachable_at_setup == ["device-0", "device-1"]
+        assert "No reachable devices found for testing after connectivity checks." in caplog.messages
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 5}], indirect=True)
+    async def test_run_shards(self, inventory: AntaInventory) -> None:
+        """Test AntaRunner.run() with the selected inventory split across shards."""
+        catalog = AntaCatalog.from_list([(FakeTest, {"result_overwrite": {"custom_field": str(i)}}) for i in range(2)])
+        runner = AntaRunner(settings=AntaRunnerSettings(shards=2))
+
+        # Run the shards in threads, respx mocks are not available in the worker processes
+        with patch("anta._runner.ProcessPoolExecutor", lambda max_workers, **_: ThreadPoolExecutor(max_workers=max_workers)):
+            ctx = await runner.run(inventory, catalog)
+
+        assert len(ctx.manager) == 10
+        assert ctx.manager.status == "success"
+        assert len(ctx.shard_reports) == 2
+        assert sorted(len(report.devices) for report in ctx.shard_reports) == [2, 3]
+        assert sorted(device for report in ctx.shard_reports for device in report.devices) == sorted(inventory.keys())
+        assert all(report.total_results == report.tests_scheduled and report.duration is not None for report in ctx.shard_reports)
+        assert ctx.total_devices_selected_for_testing == 5
+        assert ctx.total_tests_scheduled == 10
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 5}], indirect=True)
+    async def test_run_shards_dry_run(self, inventory: AntaInventory) -> None:
+        """Test AntaRunner.run() sets up the shards in dry-run mode."""
+        catalog = AntaCatalog.from_list([(FakeTest, None)])
+        runner = AntaRunner(settings=AntaRunnerSettings(shards=2))
+
+        ctx = await runner.run(inventory, catalog, dry_run=True)
+
+        assert len(ctx.shard_reports) == 2
+        assert ctx.total_devices_selected_for_testing == 5
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 2}], indirect=True)
+    async def test_run_shards_not_picklable(self, inventory: AntaInventory, caplog: pytest.LogCaptureFixture) -> None:
+        """Test AntaRunner.run() falls back to a single process when the catalog cannot be sent to the shards."""
+
+        class LocalTest(AntaTest):
+            """ANTA test defined locally."""
+
+            categories: ClassVar[list[str]] = []
+            commands: ClassVar[list[AntaCommand | AntaTemplate]] = []
+
+            @AntaTest.anta_test
+            def test(self) -> None:
+                """Test function."""
+                self.result.is_success()
+
+        catalog = AntaCatalog.from_list([(LocalTest, None)])
+        runner = AntaRunner(settings=AntaRunnerSettings(shards=2))
+
+        ctx = await runner.run(inventory, catalog)
+
+        assert len(ctx.manager) == 2
+        assert not ctx.shard_reports
+        assert "Running the tests in a single process." in caplog.text
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 3}], indirect=True)
+    async def test_iter_results(self, inventory: AntaInventory) -> None:
+        """Test AntaRunner.iter_results() streams results into the ResultManager as they complete."""
+        catalog = AntaCatalog.from_list([(FakeTest, None)])
+        manager = ResultManager()
+        runner = AntaRunner()
+
+        results = []
+        async for result in runner.iter_results(inventory, catalog, manager):
+            results.append(result)
+            # Each result is added to the manager before being yielded
+            assert len(manager) == len(results)
+            assert manager.results[-1] is result
+
+        assert len(results) == 3
+        assert {result.name for result in results} == set(inventory)
+        assert all(result.result == "success" for result in results)
+
+    async def test_iter_results_dry_run(self) -> None:
+        """Test AntaRunner.iter_results() in dry-run yields unset results."""
+        inventory = AntaInventory.parse(filename=DATA_DIR / "test_inventory_with_tags.yml", username="anta", password="anta")
+        catalog = AntaCatalog.parse(filename=DATA_DIR / "test_catalog_with_tags.yml")
+        manager = ResultManager()
+        runner = AntaRunner()
+
+        results = [result async for result in runner.iter_results(inventory, catalog, manager, dry_run=True)]
+
+        assert len(results) == len(manager) == 27
+        assert all(result.result == "unset" for result in results)
+
+    async def test_iter_results_early_exit_disconnects(self) -> None:
+        """Test that stopping AntaRunner.iter_results() early still cleans up the run."""
+        device = AsyncEOSDevice(host="device.example.com", username="admin", password="password", name="device", disable_cache=True)
+        inventory = AntaInventory()
+        inventory.add_device(device)
+        catalog = AntaCatalog.from_list([(FakeTest, None), (FakeTest, {"result_overwrite": {"custom_field": "second"}})])
+        runner = AntaRunner()
+
+        async def refresh() -> None:
+            device.is_online = True
+            device.established = True
+            device.hw_model = "pytest"
+
+        with patch.object(device, "refresh", new=AsyncMock(side_effect=refresh)):
+            results = runner.iter_results(inventory, catalog, disconnect=True)
+            async for _ in results:
+                break
+            await results.aclose()
+
+        assert device._client.is_closed
+
     async def test_run_disconnect_called_when_enabled(self, caplog: pytest.LogCaptureFixture) -> None:
         """Test that disconnect_inventory is called after the run when disconnect=True."""
         caplog.set_level(logging.DEBUG)
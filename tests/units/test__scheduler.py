@@ -0,0 +1,217 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Test anta._scheduler.py."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from anta._scheduler import AntaDurationHistory, AntaHistoricalTestScheduler, AntaTestScheduler
+from anta.catalog import AntaTestDefinition
+from anta.device import AntaDevice
+from tests.units.test_models import FakeTest
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from anta.models import AntaCommand
+
+
+class FakeDevice(AntaDevice):
+    """AntaDevice with a configurable `max_connections`."""
+
+    def __init__(self, name: str, max_connections: int | None = None) -> None:
+        super().__init__(name, disable_cache=True)
+        self._max_connections = max_connections
+
+    @property
+    def _keys(self) -> tuple[Any, ...]:
+        return (self.name,)
+
+    @property
+    def max_connections(self) -> int | None:
+        """Return the configured maximum number of connections."""
+        return self._max_connections
+
+    async def _collect(self, command: AntaCommand, *, collection_id: str | None = None) -> None:
+        """Do nothing."""
+
+    async def refresh(self) -> None:
+        """Do nothing."""
+
+
+def _tests(count: int, prefix: str = "") -> list[AntaTestDefinition]:
+    """Return distinct test definitions."""
+    return [AntaTestDefinition(test=FakeTest, inputs={"result_overwrite": {"custom_field": f"{prefix}{i}"}}) for i in range(count)]
+
+
+class TestAntaTestScheduler:
+    """Test AntaTestScheduler class."""
+
+    def test_round_robin(self) -> None:
+        """Test that tests are dispatched round-robin across devices."""
+        device_a, device_b, device_c = FakeDevice("a"), FakeDevice("b"), FakeDevice("c")
+        scheduler = AntaTestScheduler()
+        scheduler.add(device_a, _tests(3))
+        scheduler.add(device_b, _tests(1))
+        scheduler.add(device_c, _tests(2))
+        assert len(scheduler) == 6
+
+        order = []
+        while (item := scheduler.get_nowait()) is not None:
+            order.append(item[0].name)
+
+        assert order == ["a", "b", "c", "a", "c", "a"]
+        assert len(scheduler) == 0
+
+    def test_device_limit(self) -> None:
+        """Test that a device reaching its limit does not hold the other devices back."""
+        limited, unlimited = FakeDevice("limited", max_connections=1), FakeDevice("unlimited")
+        scheduler = AntaTestScheduler()
+        scheduler.add(limited, _tests(2))
+        scheduler.add(unlimited, _tests(2))
+
+        order = []
+        while (item := scheduler.get_nowait()) is not None:
+            order.append(item[0].name)
+        assert order == ["limited", "unlimited", "unlimited"]
+        assert len(scheduler) == 1
+
+        scheduler.task_done(limited)
+        item = scheduler.get_nowait()
+        assert item is not None
+        assert item[0] is limited
+        assert scheduler.get_nowait() is None
+
+    def test_add_to_existing_device(self) -> None:
+        """Test adding tests to a device after some tests have been dispatched."""
+        device = FakeDevice("device")
+        scheduler = AntaTestScheduler()
+        scheduler.add(device, _tests(1))
+        assert scheduler.get_nowait() is not None
+        assert scheduler.get_nowait() is None
+
+        scheduler.add(device, _tests(2, prefix="new"))
+        assert len(scheduler) == 2
+        assert scheduler.get_nowait() is not None
+        assert scheduler.get_nowait() is not None
+        assert scheduler.get_nowait() is None
+
+    async def test_get_waits_for_capacity(self) -> None:
+        """Test that workers wait for a device slot and exit once all tests are dispatched."""
+        device = FakeDevice("device", max_connections=2)
+        scheduler = AntaTestScheduler()
+        scheduler.add(device, _tests(10))
+        running = 0
+        peak = 0
+        done = 0
+
+        async def worker() -> None:
+            nonlocal running, peak, done
+            while (item := await scheduler.get()) is not None:
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0)
+                running -= 1
+                done += 1
+                scheduler.task_done(item[0])
+
+        await asyncio.wait_for(asyncio.gather(*(worker() for _ in range(5))), timeout=5)
+
+        assert done == 10
+        assert peak == 2
+
+    async def test_open(self) -> None:
+        """Test that workers wait for the tests added while the scheduler is open and exit once it is closed."""
+        scheduler = AntaTestScheduler()
+        scheduler.open()
+        dispatched: list[str] = []
+
+        async def worker() -> None:
+            while (item := await scheduler.get()) is not None:
+                dispatched.append(item[0].name)
+                scheduler.task_done(item[0])
+
+        workers = [asyncio.create_task(worker()) for _ in range(2)]
+        await asyncio.sleep(0)
+        assert not any(task.done() for task in workers)
+
+        scheduler.add(FakeDevice("a"), _tests(2))
+        await asyncio.sleep(0)
+        scheduler.add(FakeDevice("b"), _tests(1))
+        scheduler.close()
+        await asyncio.wait_for(asyncio.gather(*workers), timeout=5)
+
+        assert sorted(dispatched) == ["a", "a", "b"]
+
+
+class TestAntaDurationHistory:
+    """Test AntaDurationHistory class."""
+
+    def test_record_and_save(self, tmp_path: Path) -> None:
+        """Test that durations are averaged, saved and merged with the durations saved concurrently."""
+        path = tmp_path / "cache" / "durations.json"
+        device = FakeDevice("device")
+        test_a, test_b = _tests(2)
+        history = AntaDurationHistory.load(path)
+        assert history.expected_duration(device, test_a) is None
+
+        history.record(device, test_a, 2.0)
+        history.record(device, test_a, 4.0)
+        assert history.expected_duration(device, test_a) == 3.0
+
+        other = AntaDurationHistory.load(path)
+        other.record(FakeDevice("other"), test_b, 1.0)
+        other.save()
+        history.save()
+
+        loaded = AntaDurationHistory.load(path)
+        assert loaded.expected_duration(device, test_a) == 3.0
+        assert loaded.expected_duration(FakeDevice("other"), test_b) == 1.0
+        assert loaded.expected_duration(device, test_b) is None
+        assert [file.name for file in path.parent.iterdir()] == ["durations.json"]
+
+    @pytest.mark.parametrize("content", [pytest.param("{", id="invalid-json"), pytest.param("[]", id="invalid-format")])
+    def test_load_invalid(self, caplog: pytest.LogCaptureFixture, tmp_path: Path, content: str) -> None:
+        """Test that an invalid file is ignored."""
+        path = tmp_path / "durations.json"
+        path.write_text(content, encoding="UTF-8")
+        history = AntaDurationHistory.load(path)
+        assert history.durations == {}
+        assert "Unable to load the test durations" in caplog.text
+
+        history.record(FakeDevice("device"), _tests(1)[0], 1.0)
+        history.save()
+        assert list(json.loads(path.read_text(encoding="UTF-8"))) == ["device"]
+
+
+class TestAntaHistoricalTestScheduler:  # pylint: disable=too-few-public-methods
+    """Test AntaHistoricalTestScheduler class."""
+
+    def test_longest_first(self, tmp_path: Path) -> None:
+        """Test that the longest tests are dispatched first across devices, unknown tests first, within the device limits."""
+        device_a, device_b = FakeDevice("a", max_connections=1), FakeDevice("b")
+        tests_a, tests_b = _tests(2, prefix="a"), _tests(3, prefix="b")
+        history = AntaDurationHistory(tmp_path / "durations.json")
+        history.record(device_a, tests_a[0], 1.0)
+        history.record(device_a, tests_a[1], 5.0)
+        history.record(device_b, tests_b[0], 3.0)
+        history.record(device_b, tests_b[1], 4.0)
+        scheduler = AntaHistoricalTestScheduler(history)
+        scheduler.add(device_a, tests_a)
+        scheduler.add(device_b, tests_b)
+
+        order = []
+        while (item := scheduler.get_nowait()) is not None:
+            order.append((item[0].name, item[1].inputs.result_overwrite.custom_field))
+        assert order == [("b", "b2"), ("a", "a1"), ("b", "b1"), ("b", "b0")]
+
+        scheduler.task_done(device_a)
+        item = scheduler.get_nowait()
+        assert item is not None
+        assert (item[0].name, item[1].inputs.result_overwrite.custom_field) == ("a", "a0")
@@ -0,0 +1,73 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Test anta._tracing.py."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import TYPE_CHECKING
+
+import asynceapi
+from anta._tracing import _NO_SPAN, AntaTracer, trace_span, tracing
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class TestAntaTracer:
+    """Test AntaTracer class."""
+
+    async def test_lanes(self) -> None:
+        """Test that concurrent spans of a track are laid out on distinct lanes and nested spans on the lane of their parent."""
+        tracer = AntaTracer()
+        started = asyncio.Event()
+
+        async def test(name: str) -> None:
+            with tracer.span(name, "leaf1"):
+                with tracer.span("collect", "leaf1"), tracer.span("cache"):
+                    await started.wait()
+                await asyncio.sleep(0)
+
+        tasks = [asyncio.create_task(test(name)) for name in ("test1", "test2")]
+        await asyncio.sleep(0)
+        started.set()
+        await asyncio.gather(*tasks)
+        with tracer.span("test3", "leaf1"):
+            pass
+
+        lanes = {(event["name"], event["tid"]) for event in tracer.events}
+        assert lanes == {("test1", 0), ("test2", 1), ("collect", 0), ("collect", 1), ("cache", 0), ("cache", 1), ("test3", 0)}
+        assert {event["pid"] for event in tracer.events} == {1}
+
+    def test_save(self, tmp_path: Path) -> None:
+        """Test that the saved trace names the tracks and lanes of the spans."""
+        tracer = AntaTracer()
+        with tracer.span("run", commands=2):
+            pass
+        with tracer.span("test", "leaf1"):
+            pass
+        path = tmp_path / "trace.json"
+        tracer.save(path)
+
+        trace = json.loads(path.read_text(encoding="UTF-8"))
+        metadata = [(event["name"], event["pid"], event["args"]["name"]) for event in trace["traceEvents"] if event["ph"] == "M"]
+        assert metadata == [("process_name", 0, "ANTA"), ("thread_name", 0, "lane 0"), ("process_name", 1, "leaf1"), ("thread_name", 1, "lane 0")]
+        spans = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+        assert [(span["name"], span["pid"], span["args"]) for span in spans] == [("run", 0, {"commands": 2}), ("test", 1, {})]
+        assert all(span["dur"] >= 0 for span in spans)
+
+
+def test_tracing(tmp_path: Path) -> None:
+    """Test that tracing is only enabled in the context of `tracing()`."""
+    path = tmp_path / "trace.json"
+    assert trace_span("span") is _NO_SPAN
+    with tracing(path) as tracer:
+        assert asynceapi.Device.trace_span is not None
+        with trace_span("span", "leaf1"):
+            pass
+    assert trace_span("span") is _NO_SPAN
+    assert asynceapi.Device.trace_span is None
+    assert [event["name"] for event in tracer.events] == ["span"]
+    assert path.exists()
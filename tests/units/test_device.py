@@ -7,19 +7,34 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import pickle
+import socket
+import time
 from contextlib import AbstractContextManager
 from contextlib import nullcontext as does_not_raise
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
-from unittest.mock import AsyncMock, MagicMock, patch
+from typing import TYPE_CHECKING, Any, Literal
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import pytest
 from asyncssh import SSHClientConnection, SSHClientConnectionOptions
 from httpx import ConnectError, ConnectTimeout, HTTPError, TimeoutException
 from rich import print as rprint
 
-from anta.device import AntaDevice, AntaDeviceCapabilities, AsyncEOSDevice
+from anta._limiter import AntaAdaptiveLimiter
+from anta.device import (
+    AntaCircuitBreaker,
+    AntaDevice,
+    AntaDeviceCapabilities,
+    AsyncEOSDevice,
+    _decode_executor,
+    _DecodeProcessPool,
+    shutdown_decode_executor,
+)
+from anta.inventory.models import AntaTransportProfile
 from anta.models import AntaCommand
+from anta.result_manager.models import CommandTiming
+from anta.settings import get_httpx_settings
 from asynceapi import EapiCommandError
 from asynceapi._models import EAPIClientConnectionOptions
 from asynceapi.errors import EapiAuthenticationError
@@ -640,6 +655,52 @@ class TestAntaDevice:
         """Test max_connections property."""
         assert device.max_connections is None
 
+    @pytest.mark.parametrize("device", [{"disable_cache": True, "batch_window": 0.01}], indirect=True)
+    async def test_collect_batching(self, device: AntaDevice) -> None:
+        """Test that concurrent commands are coalesced by output format and version when batching is enabled."""
+        assert device.batcher is not None
+        commands = [AntaCommand(command=f"show command {i}") for i in range(3)]
+        commands.append(AntaCommand(command="show text", ofmt="text"))
+        with patch.object(device, "_collect_batch", wraps=device._collect_batch) as collect_batch_mock:
+            await device.collect_commands(commands)
+
+        assert all(command.output == COMMAND_OUTPUT for command in commands)
+        assert collect_batch_mock.call_count == 2
+        assert collect_batch_mock.call_args_list[0].args[0] == commands[:3]
+        assert device.batch_statistics == {"batched_commands": 4, "batches_sent": 2, "average_batch_size": "2.00"}
+
+    @pytest.mark.parametrize("device", [{"disable_cache": True, "batch_window": 0.01}], indirect=True)
+    async def test_collect_batching_collection_id(self, device: AntaDevice) -> None:
+        """Test that the collection IDs of the commands of a batch are passed to _collect_batch."""
+        commands = [AntaCommand(command=f"show command {i}") for i in range(3)]
+        with patch.object(device, "_collect_batch", wraps=device._collect_batch) as collect_batch_mock:
+            await asyncio.gather(
+                device.collect_commands(commands[:2], collection_id="VerifyA"),
+                device.collect_commands(commands[2:], collection_id="VerifyB"),
+            )
+            collect_batch_mock.assert_called_once_with(commands, collection_id="VerifyA+VerifyB")
+            collect_batch_mock.reset_mock()
+            await device.collect_commands([AntaCommand(command="show version")], collection_id="VerifyA")
+            collect_batch_mock.assert_called_once_with(ANY, collection_id="VerifyA")
+
+    @pytest.mark.parametrize("device", [{"disable_cache": True, "batch_window": 10}], indirect=True)
+    async def test_collect_batching_max_size(self, device: AntaDevice) -> None:
+        """Test that a batch is flushed without waiting for the window when it is full."""
+        assert device.batcher is not None
+        device.batcher.max_size = 2
+        commands = [AntaCommand(command=f"show command {i}") for i in range(2)]
+        await asyncio.wait_for(device.collect_commands(commands), timeout=1)
+        assert all(command.output == COMMAND_OUTPUT for command in commands)
+
+    def test_batch_statistics_disabled(self, device: AntaDevice) -> None:
+        """Test batch_statistics property when batching is disabled."""
+        assert device.batcher is None
+        assert device.batch_statistics is None
+
+    def test_decode_statistics(self, device: AntaDevice) -> None:
+        """Test decode_statistics property of a device not decoding responses."""
+        assert device.decode_statistics is None
+
     def test_capabilities_default(self, device: AntaDevice) -> None:
         """Verify the base AntaDevice capabilities default to all-False."""
         assert device.capabilities == AntaDeviceCapabilities()
@@ -647,6 +708,68 @@ class TestAntaDevice:
 
 
 # pylint: disable=too-many-public-methods
+class TestAntaCircuitBreaker:
+    """Test AntaCircuitBreaker class."""
+
+    def test_threshold(self) -> None:
+        """Test that the circuit opens after consecutive failures only."""
+        breaker = AntaCircuitBreaker("device", threshold=2)
+        breaker.record_failure("error")
+        breaker.record_success()
+        breaker.record_failure("error")
+        assert breaker.allow()
+        breaker.record_failure("error")
+        assert breaker.is_open
+        assert not breaker.allow()
+        assert breaker.stats == {"trips": 1, "rejected": 1}
+
+    def test_cooldown(self) -> None:
+        """Test that one probe request is allowed per cool-down and a failed probe keeps the circuit open."""
+        breaker = AntaCircuitBreaker("device", threshold=1, cooldown=10)
+        with patch("anta.device.monotonic", return_value=100):
+            breaker.record_failure("error")
+        with patch("anta.device.monotonic", return_value=105):
+            assert not breaker.allow()
+        with patch("anta.device.monotonic", return_value=110):
+            assert breaker.allow()
+            assert not breaker.allow()
+            breaker.record_failure("error")
+        with patch("anta.device.monotonic", return_value=115):
+            assert not breaker.allow()
+        with patch("anta.device.monotonic", return_value=120):
+            assert breaker.allow()
+        breaker.record_success()
+        assert not breaker.is_open
+        assert breaker.stats == {"trips": 1, "rejected": 3}
+
+
+class TestDecodeProcessPool:
+    """Test _DecodeProcessPool class."""
+
+    def test_spawn_and_restart(self) -> None:
+        """Test that the pool spawns its worker processes on the first submission and starts again after a shutdown."""
+        pool = _DecodeProcessPool()
+        pool.shutdown()
+        assert pool._pool is None
+        assert pool.submit(int, "1").result() == 1
+        assert pool._pool is not None
+        assert pool._pool._mp_context.get_start_method() == "spawn"
+        pool.shutdown()
+        assert pool._pool is None
+        assert pool.submit(int, "2").result() == 2
+        pool.shutdown()
+
+    def test_shutdown_decode_executor(self) -> None:
+        """Test that shutdown_decode_executor() shuts down the shared pool without waiting, only if the pool was requested."""
+        _decode_executor.cache_clear()
+        shutdown_decode_executor()
+        assert _decode_executor.cache_info().currsize == 0
+        with patch.object(_decode_executor(), "shutdown") as shutdown_mock:
+            shutdown_decode_executor()
+        shutdown_mock.assert_called_once_with(wait=False)
+        _decode_executor.cache_clear()
+
+
 class TestAsyncEOSDevice:
     """Test for anta.device.AsyncEOSDevice."""
 
@@ -686,6 +809,39 @@ class TestAsyncEOSDevice:
             timeout=12.0,
         )
 
+    def test_pickle(self) -> None:
+        """Test that an AsyncEOSDevice can be pickled and is recreated from its constructor arguments."""
+        device = AsyncEOSDevice(
+            host="42.42.42.42",
+            username="anta",
+            password="anta",
+            name="pytest",
+            enable_password="enable",
+            port=8443,
+            tags={"leaf"},
+            enable=True,
+            insecure=True,
+            disable_cache=True,
+            batch_window=0.01,
+            http2=True,
+        )
+        device.established = True
+
+        clone = pickle.loads(pickle.dumps(device))  # noqa: S301
+
+        assert clone == device
+        assert clone is not device
+        assert clone.tags == device.tags
+        assert clone._eapi_opts == device._eapi_opts
+        assert clone._enable_password == "enable"
+        assert clone.enable is True
+        assert clone._ssh_opts.known_hosts is None
+        assert clone.cache is None
+        assert clone.batcher is not None
+        assert clone.batcher.window == 0.01
+        assert clone.http2 is True
+        assert clone.established is False
+
     def test__rich_repr_debug_sanitizes_client_details(self, async_device: AsyncEOSDevice) -> None:
         """Test the debug Rich repr does not expose internal client state."""
         with patch("anta.device.__DEBUG__", new=True):
@@ -715,6 +871,86 @@ class TestAsyncEOSDevice:
         # HTTPX uses a max_connections of 100 by default
         assert async_device.max_connections == 100
 
+    @pytest.mark.parametrize(("proto", "http2", "expected"), [("https", False, 100), ("https", True, 1), ("http", True, 100)])
+    def test_potential_connections(self, proto: Literal["http", "https"], *, http2: bool, expected: int) -> None:
+        """Test potential_connections property, a single connection when the requests are multiplexed over HTTP/2."""
+        device = AsyncEOSDevice(host="42.42.42.42", username="anta", password="anta", proto=proto, http2=http2)
+        assert device.http2 is (http2 and proto == "https")
+        assert device.potential_connections == expected
+
+    @pytest.mark.parametrize(
+        ("profile", "env", "expected"),
+        [
+            pytest.param(None, {}, (100, 20, 5.0, (30, 30, 30, 30), None), id="defaults"),
+            pytest.param(
+                AntaTransportProfile(max_connections=10, keepalive_expiry=300, connect_timeout=2, tcp_keepalive=True),
+                {},
+                (10, 10, 300, (2, 30, 30, 30), [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]),
+                id="profile",
+            ),
+            pytest.param(
+                AntaTransportProfile(max_connections=10, read_timeout=5),
+                {"ANTA_HTTPX_MAX_CONNECTIONS": "50", "ANTA_HTTPX_MAX_KEEPALIVE_CONNECTIONS": "50", "ANTA_HTTPX_READ_TIMEOUT": "60"},
+                (10, 10, 5.0, (30, 5, 30, 30), None),
+                id="profile-overrides-settings",
+            ),
+        ],
+    )
+    def test_transport_profile(self, setenvvar: pytest.MonkeyPatch, profile: AntaTransportProfile | None, env: dict[str, str], expected: tuple[Any, ...]) -> None:
+        """Test that the transport profile, then the ANTA_HTTPX_* settings, tune the HTTPX client of the device.
+
+        HTTPX caps the idle connections kept alive to the maximum number of connections.
+        """
+        for name, value in env.items():
+            setenvvar.setenv(name, value)
+        get_httpx_settings.cache_clear()
+        device = AsyncEOSDevice(host="42.42.42.42", username="anta", password="anta", timeout=30, transport_profile=profile)
+        pool = device._client._transport._pool  # type: ignore[attr-defined]
+        timeout = device._client.timeout
+        assert (
+            pool._max_connections,
+            pool._max_keepalive_connections,
+            pool._keepalive_expiry,
+            (timeout.connect, timeout.read, timeout.write, timeout.pool),
+            pool._socket_options,
+        ) == expected
+        assert device.potential_connections == expected[0]
+        assert pickle.loads(pickle.dumps(device)).transport_profile == profile  # noqa: S301
+        get_httpx_settings.cache_clear()
+
+    @pytest.mark.parametrize(
+        ("profile", "env", "http2", "expected"),
+        [
+            pytest.param(None, {}, False, 100, id="default"),
+            pytest.param(AntaTransportProfile(max_connections=10), {}, False, 10, id="profile"),
+            pytest.param(None, {"ANTA_HTTPX_MAX_CONNECTIONS": "250"}, False, 250, id="settings"),
+            pytest.param(AntaTransportProfile(max_connections=10), {}, True, 100, id="http2"),
+            pytest.param(AntaTransportProfile(max_connections=250), {}, True, 250, id="http2-above-default"),
+        ],
+    )
+    def test_command_semaphore(
+        self, setenvvar: pytest.MonkeyPatch, profile: AntaTransportProfile | None, env: dict[str, str], *, http2: bool, expected: int
+    ) -> None:
+        """Test that the concurrent requests of the device are bounded by the maximum number of connections of the HTTPX client."""
+        if http2:
+            pytest.importorskip("h2")
+        for name, value in env.items():
+            setenvvar.setenv(name, value)
+        get_httpx_settings.cache_clear()
+        device = AsyncEOSDevice(host="42.42.42.42", username="anta", password="anta", transport_profile=profile, http2=http2)
+        assert device._command_semaphore._value == expected
+        get_httpx_settings.cache_clear()
+
+    def test_decode_statistics(self, async_device: AsyncEOSDevice) -> None:
+        """Test decode_statistics property."""
+        async_device._client.decode_stats.update(inline=3, offloaded=1, inline_time=0.0125, max_inline_time=0.01)
+        assert async_device.decode_statistics == {
+            "inline_responses": 3,
+            "offloaded_responses": 1,
+            "inline_decode_time": "0.013s",
+            "max_inline_decode_time": "0.010s",
+        }
+
     def test_max_connections_none(self, async_device: AsyncEOSDevice) -> None:
         """Test max_connections property when not available in the session object."""
         with patch.object(async_device, "_client", None):
@@ -854,6 +1090,139 @@ class TestAsyncEOSDevice:
             assert async_device.established is True
             assert async_device.hw_model == "DCS-72"
 
+    @pytest.mark.parametrize("async_device", [{"enable": True, "batch_window": 0.01}], indirect=True)
+    async def test_collect_batch(self, async_device: AsyncEOSDevice) -> None:
+        """Test that batched commands are sent in a single eAPI request."""
+        commands = [AntaCommand(command="show version"), AntaCommand(command="show ip route", revision=4)]
+        with patch.object(async_device._client, "cli", return_value=[{}, {"modelName": "pytest"}, {"vrfs": {}}]) as cli_mock:
+            await async_device.collect_commands(commands)
+        cli_mock.assert_called_once_with(
+            commands=[{"cmd": "enable"}, {"cmd": "show version"}, {"cmd": "show ip route", "revision": 4}],
+            ofmt="json",
+            version="latest",
+            req_id=f"ANTA-{id(commands[0])}",
+        )
+        assert commands[0].output == {"modelName": "pytest"}
+        assert commands[1].output == {"vrfs": {}}
+
+    @pytest.mark.parametrize("async_device", [{"enable": True}], indirect=True)
+    async def test_collect_batch_command_error(self, async_device: AsyncEOSDevice) -> None:
+        """Test that a failing command of a batch gets the errors and the commands that were not executed are sent again."""
+        commands = [AntaCommand(command="show version"), AntaCommand(command="show bgp summary"), AntaCommand(command="show ip route")]
+        error = EapiCommandError(
+            passed=[{}, {"modelName": "pytest"}],
+            failed="show bgp summary",
+            errors=["BGP inactive"],
+            errmsg="CLI command 3 of 4 'show bgp summary' failed: could not run command",
+            not_exec=[{"cmd": "show ip route"}],
+        )
+        with patch.object(async_device._client, "cli", side_effect=[error, [{}, {"vrfs": {}}]]) as cli_mock:
+            await async_device._collect_batch(commands)
+        assert cli_mock.call_count == 2
+        assert cli_mock.call_args.kwargs["commands"] == [{"cmd": "enable"}, {"cmd": "show ip route"}]
+        assert commands[0].output == {"modelName": "pytest"}
+        assert commands[1].output is None
+        assert commands[1].errors == ["BGP inactive"]
+        assert commands[2].output == {"vrfs": {}}
+
+    async def test_collect_batch_transport_error(self, async_device: AsyncEOSDevice) -> None:
+        """Test that a transport error is reported on every command of the batch."""
+        commands = [AntaCommand(command="show version"), AntaCommand(command="show ip route")]
+        with patch.object(async_device._client, "cli", side_effect=ConnectTimeout("Timeout!")):
+            await async_device._collect_batch(commands)
+        assert all(command.errors == ["ConnectTimeout: Timeout!"] for command in commands)
+
+    async def test_collect_batch_limiter(self, async_device: AsyncEOSDevice) -> None:
+        """Test that the requests are observed by the adaptive limiter of the device."""
+        async_device.limiter = AntaAdaptiveLimiter(async_device.name, initial_limit=4, max_limit=10)
+        with patch.object(async_device._client, "cli", side_effect=ConnectTimeout("Timeout!")):
+            await async_device._collect_batch([AntaCommand(command="show version")])
+        assert async_device.limiter.limit == 2
+        with patch.object(async_device._client, "cli", return_value=[{"modelName": "pytest"}]):
+            await async_device._collect_batch([AntaCommand(command="show version")])
+        assert async_device.limiter.stats == {"requests": 2, "timeouts": 1, "rejections": 0, "lowest_limit": 2, "highest_limit": 4}
+
+    @pytest.mark.parametrize("async_device", [{"enable": True}], indirect=True)
+    async def test_collect_batch_limiter_command_error(self, async_device: AsyncEOSDevice) -> None:
+        """Test that a batch rejected with a command error is observed by the adaptive limiter of the device before it is sent again."""
+        async_device.limiter = AntaAdaptiveLimiter(async_device.name, initial_limit=10, max_limit=10)
+        commands = [AntaCommand(command="show version"), AntaCommand(command="show bgp summary"), AntaCommand(command="show ip route")]
+        error = EapiCommandError(
+            passed=[{}, {"modelName": "pytest"}],
+            failed="show bgp summary",
+            errors=["BGP inactive"],
+            errmsg="CLI command 3 of 4 'show bgp summary' failed: could not run command",
+            not_exec=[{"cmd": "show ip route"}],
+        )
+        with patch.object(async_device._client, "cli", side_effect=[error, [{}, {"vrfs": {}}]]):
+            await async_device._collect_batch(commands)
+        assert async_device.limiter.limit == 9
+        assert async_device.limiter.stats == {"requests": 2, "timeouts": 0, "rejections": 1, "lowest_limit": 9, "highest_limit": 10}
+
+    async def test_collect_batch_circuit_breaker(self, async_device: AsyncEOSDevice) -> None:
+        """Test that the requests fail fast once the circuit breaker of the device is open and a probe closes it."""
+        async_device.circuit_breaker = AntaCircuitBreaker(async_device.name, threshold=2, cooldown=30)
+        with patch.object(async_device._client, "cli", side_effect=ConnectTimeout("Timeout!")) as cli_mock:
+            for _ in range(3):
+                await async_device._collect_batch([AntaCommand(command="show version")])
+            commands = [AntaCommand(command="show version"), AntaCommand(command="show ip route")]
+            await async_device._collect_batch(commands)
+        assert cli_mock.call_count == 2
+        reason = f"Circuit breaker open after 2 consecutive transport failures on {async_device.name}, last error: ConnectTimeout: Timeout!"
+        assert all(command.errors == [reason] for command in commands)
+        assert async_device.circuit_breaker.stats == {"trips": 1, "rejected": 2}
+
+        # Probe after the cool-down
+        with (
+            patch("anta.device.monotonic", return_value=time.monotonic() + 60),
+            patch.object(async_device._client, "cli", return_value=[{"modelName": "pytest"}]),
+        ):
+            command = AntaCommand(command="show version")
+            await async_device._collect_batch([command])
+        assert command.output == {"modelName": "pytest"}
+        assert not async_device.circuit_breaker.is_open
+        assert async_device.circuit_breaker.failures == 0
+
+    async def test_collect_batch_circuit_breaker_queued(self, async_device: AsyncEOSDevice) -> None:
+        """Test that the requests waiting for a slot fail fast once the circuit breaker opens, without being observed by the limiter."""
+        async_device.circuit_breaker = AntaCircuitBreaker(async_device.name, threshold=1)
+        async_device.limiter = AntaAdaptiveLimiter(async_device.name, initial_limit=1, max_limit=10)
+        async_device._command_semaphore = asyncio.Semaphore(1)
+
+        async def cli(**_kwargs: object) -> list[dict[str, Any]]:
+            await asyncio.sleep(0.01)
+            msg = "Timeout!"
+            raise ConnectTimeout(msg)
+
+        commands = [AntaCommand(command="show version") for _ in range(5)]
+        with patch.object(async_device._client, "cli", side_effect=cli) as cli_mock:
+            await asyncio.gather(*(async_device._collect_batch([command]) for command in commands))
+        assert cli_mock.call_count == 1
+        reason = f"Circuit breaker open after 1 consecutive transport failures on {async_device.name}, last error: ConnectTimeout: Timeout!"
+        assert all(command.errors == [reason] for command in commands[1:])
+        assert async_device.circuit_breaker.stats == {"trips": 1, "rejected": 4}
+        assert async_device.limiter.stats["requests"] == 1
+
+    async def test_collect_timing(self, async_device: AsyncEOSDevice) -> None:
+        """Test that the collection of a command records its network time and the cache hits and misses."""
+
+        async def cli(**_kwargs: object) -> list[dict[str, Any]]:
+            await asyncio.sleep(0.01)
+            return [{"modelName": "pytest"}]
+
+        with patch.object(async_device._client, "cli", side_effect=cli):
+            command = AntaCommand(command="show version")
+            await async_device.collect(command)
+            cached_command = AntaCommand(command="show version")
+            await async_device.collect(cached_command)
+
+        assert command.timing is not None
+        assert command.timing.cache_hit is (False if async_device.cache is not None else None)
+        assert command.timing.network >= 0.01
+        assert command.timing.wait < command.timing.network
+        if async_device.cache is not None:
+            assert cached_command.timing == CommandTiming(cache_hit=True)
+
     async def test__collect_raises_when_client_closed(self, async_device: AsyncEOSDevice) -> None:
         """Test that _collect() raises RuntimeError when the httpx client is closed."""
         await async_device.disconnect()
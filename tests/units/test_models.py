@@ -540,6 +540,23 @@ class TestAntaTest:
         if custom_field:
             assert test.result.custom_field == "a custom field"
 
+    def test_reset(self, device: AntaDevice) -> None:
+        """Test that AntaTest.reset() keeps the rendered commands and replaces the result and the command outputs."""
+        test = FakeTestWithTemplate(device, inputs={"interface": "Ethernet1", "result_overwrite": {"custom_field": "a custom field"}})
+        commands = list(test.instance_commands)
+        asyncio.run(test.test(eos_data=[{}]))
+        previous = test.result
+
+        test.reset()
+        assert previous.result == AntaTestStatus.SUCCESS
+        assert test.result is not previous
+        assert test.result.result == AntaTestStatus.UNSET
+        assert test.result.custom_field == "a custom field"
+        assert test.result.inputs_uid == previous.inputs_uid
+        assert test.instance_commands[0] is commands[0]
+        assert test.instance_commands[0].output is None
+        assert test.instance_commands[0].command == "show interface Ethernet1"
+
 
 class TestAntaCommand:
     """Test for anta.models.AntaCommand."""
@@ -8,13 +8,31 @@ from __future__ import annotations
 import logging
 import os
 import sys
+from typing import TYPE_CHECKING
 from unittest.mock import patch
 
 import pytest
+from cryptography.fernet import Fernet
 from pydantic import ValidationError
 
-from anta.device import AsyncEOSDevice
-from anta.settings import DEFAULT_HTTPX_TRUST_ENV, DEFAULT_MAX_CONCURRENCY, DEFAULT_NOFILE, AntaHttpxSettings, AntaRunnerSettings, get_httpx_settings
+from anta.device import AsyncEOSDevice, _decode_executor, _session_store, save_session_store
+from anta.settings import (
+    DEFAULT_HTTPX_TRUST_ENV,
+    DEFAULT_JSON_CODEC,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_NOFILE,
+    AntaHttpxSettings,
+    AntaJsonSettings,
+    AntaRunnerSettings,
+    AntaSessionStoreSettings,
+    get_httpx_settings,
+    get_json_settings,
+    get_session_store_settings,
+)
+from asynceapi.codec import get_codec
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 if os.name == "posix":
     # The function is not defined on non-POSIX system
@@ -135,6 +153,8 @@ class TestAntaHttpxSettings:
         """Test that AntaHttpxSettings uses default values when no environment variables are set."""
         httpx_settings = AntaHttpxSettings()
         assert httpx_settings.trust_env == DEFAULT_HTTPX_TRUST_ENV
+        assert httpx_settings.max_connections is None
+        assert httpx_settings.tcp_keepalive is None
 
     def test_env_var(self, setenvvar: pytest.MonkeyPatch) -> None:
         """Test that the ANTA_HTTPX_TRUST_ENV environment variable overrides the default trust_env value."""
@@ -158,3 +178,106 @@ class TestAntaHttpxSettings:
         with pytest.raises(ValueError, match=r"Failed to load ANTA HTTPX settings\. Check ANTA_HTTPX_\* environment variables:"):
             get_httpx_settings()
         get_httpx_settings.cache_clear()
+
+
+class TestAntaJsonSettings:
+    """Tests for the AntaJsonSettings class."""
+
+    def test_defaults(self, setenvvar: pytest.MonkeyPatch) -> None:
+        """Test that AntaJsonSettings uses default values when no environment variables are set."""
+        json_settings = AntaJsonSettings()
+        assert json_settings.codec == DEFAULT_JSON_CODEC == "json"
+        assert json_settings.decode_offload_threshold is None
+
+    def test_env_var_attached_to_device(self, setenvvar: pytest.MonkeyPatch) -> None:
+        """Test that the codec from the ANTA_JSON_CODEC environment variable is passed to the asynceapi.Device session."""
+        get_json_settings.cache_clear()
+        setenvvar.setenv("ANTA_JSON_CODEC", "json")
+        device = AsyncEOSDevice(host="test", username="test", password="test")
+        assert device._client.codec is get_codec("json")
+        get_json_settings.cache_clear()
+
+    def test_decode_offload_attached_to_device(self, setenvvar: pytest.MonkeyPatch) -> None:
+        """Test that the decode offload environment variable and the shared process pool are passed to the asynceapi.Device session."""
+        get_json_settings.cache_clear()
+        device = AsyncEOSDevice(host="test", username="test", password="test")
+        assert device._client.decode_executor is None
+        setenvvar.setenv("ANTA_JSON_DECODE_OFFLOAD_THRESHOLD", "1048576")
+        get_json_settings.cache_clear()
+        device = AsyncEOSDevice(host="test", username="test", password="test")
+        assert device._client.decode_offload_threshold == 1048576
+        assert device._client.decode_executor is _decode_executor()
+        get_json_settings.cache_clear()
+
+    def test_validation_error(self, setenvvar: pytest.MonkeyPatch) -> None:
+        """Test that get_json_settings raises ValueError when an env var is invalid."""
+        get_json_settings.cache_clear()
+        setenvvar.setenv("ANTA_JSON_CODEC", "ujson")
+        with pytest.raises(ValueError, match=r"Failed to load ANTA JSON settings\. Check ANTA_JSON_\* environment variables:"):
+            get_json_settings()
+        get_json_settings.cache_clear()
+
+
+class TestAntaSessionStoreSettings:
+    """Tests for the AntaSessionStoreSettings class."""
+
+    def test_defaults(self, setenvvar: pytest.MonkeyPatch) -> None:
+        """Test that the session store is disabled when no environment variables are set."""
+        session_store_settings = AntaSessionStoreSettings()
+        assert session_store_settings.path is None
+        assert session_store_settings.key is None
+
+    def test_env_var_attached_to_device(self, setenvvar: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        """Test that the session store is passed to the asynceapi.Device session only when use_session_auth is True."""
+        get_session_store_settings.cache_clear()
+        _session_store.cache_clear()
+        setenvvar.setenv("ANTA_SESSION_STORE_PATH", str(tmp_path / "sessions"))
+        setenvvar.setenv("ANTA_SESSION_STORE_KEY", Fernet.generate_key().decode())
+        device = AsyncEOSDevice(host="test", username="test", password="test", use_session_auth=True)
+        assert device._client._session_store is not None
+        assert device._client._session_store.path == tmp_path / "sessions"
+        device = AsyncEOSDevice(host="test", username="test", password="test")
+        assert device._client._session_store is None
+        get_session_store_settings.cache_clear()
+        _session_store.cache_clear()
+
+    async def test_save_session_store(self, setenvvar: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        """Test that save_session_store() saves the session store shared by the devices and that closing the devices does not save it again."""
+        get_session_store_settings.cache_clear()
+        _session_store.cache_clear()
+        await save_session_store()
+        assert _session_store.cache_info().currsize == 0
+
+        setenvvar.setenv("ANTA_SESSION_STORE_PATH", str(tmp_path / "sessions"))
+        setenvvar.setenv("ANTA_SESSION_STORE_KEY", Fernet.generate_key().decode())
+        device = AsyncEOSDevice(host="test", username="test", password="test", use_session_auth=True)
+        store = _session_store()
+        assert store is not None
+        store.set("test", 443, "test", "cookie")
+        await save_session_store()
+        assert store.path.exists()
+        with patch.object(store, "save") as save_mock:
+            await device._client.aclose()
+        save_mock.assert_not_called()
+        get_session_store_settings.cache_clear()
+        _session_store.cache_clear()
+
+    @pytest.mark.parametrize(
+        ("key", "match"),
+        [
+            pytest.param(None, "ANTA_SESSION_STORE_KEY is required", id="missing-key"),
+            pytest.param("not-a-key", "must be a URL-safe base64-encoded 32-byte key", id="invalid-key"),
+            pytest.param("c2hvcnQ=", "must be a URL-safe base64-encoded 32-byte key", id="short-key"),
+        ],
+    )
+    def test_validation_error(self, setenvvar: pytest.MonkeyPatch, tmp_path: Path, key: str | None, match: str) -> None:
+        """Test that get_session_store_settings raises ValueError when the key is missing or invalid."""
+        get_session_store_settings.cache_clear()
+        setenvvar.setenv("ANTA_SESSION_STORE_PATH", str(tmp_path / "sessions"))
+        if key is not None:
+            setenvvar.setenv("ANTA_SESSION_STORE_KEY", key)
+        with pytest.raises(ValueError, match=rf"(?s)Failed to load ANTA session store settings\..*{match}") as exc_info:
+            get_session_store_settings()
+        if key is not None:
+            assert key not in str(exc_info.value)
+        get_session_store_settings.cache_clear()